@@ -1,14 +1,16 @@
 """Core constructs for Jac Language."""
 
+from collections import deque
 from dataclasses import asdict as _asdict, dataclass, field, fields, is_dataclass
 from enum import Enum
+from inspect import isawaitable
 from os import getenv
-from pickle import dumps as pdumps
 from re import IGNORECASE, compile
 from typing import (
     Any,
     Callable,
     ClassVar,
+    Generator,
     Iterable,
     Mapping,
     TypeVar,
@@ -29,16 +31,16 @@ from jaclang.runtimelib.architype import (
     DSFunc,
     EdgeAnchor as _EdgeAnchor,
     EdgeArchitype as _EdgeArchitype,
+    FieldIndex,
     NodeAnchor as _NodeAnchor,
     NodeArchitype as _NodeArchitype,
     Permission as _Permission,
     TANCH,
     WalkerAnchor as _WalkerAnchor,
     WalkerArchitype as _WalkerArchitype,
+    run_awaitable,
 )
 
-from orjson import dumps
-
 from pymongo import ASCENDING, DeleteMany, DeleteOne, InsertOne, UpdateMany, UpdateOne
 from pymongo.client_session import ClientSession
 from pymongo.errors import ConnectionFailure, OperationFailure
@@ -275,8 +277,6 @@ class AnchorState:
     """Anchor state handler."""
 
     changes: dict[str, dict[str, Any]] = field(default_factory=dict)
-    full_hash: int = 0
-    context_hashes: dict[str, int] = field(default_factory=dict)
     deleted: bool | None = None
     connected: bool = False
 
@@ -291,6 +291,11 @@ class BaseAnchor:
     root: ObjectId | None = None
     access: Permission
     state: AnchorState
+    # redeclared so non-slotted subclasses get them as defaults
+    dirty: set[str] | None = field(default=None, init=False, repr=False)
+    dirty_fields: set[str] | None = field(default=None, init=False, repr=False)
+    loaded: bool = field(default=True, init=False, repr=False)
+    owner: tuple[Anchor, str] | None = field(default=None, init=False, repr=False)
 
     class Collection(BaseCollection["BaseAnchor"]):
         """Anchor collection interface."""
@@ -320,6 +325,7 @@ class BaseAnchor:
             anchor = object.__new__(cls)
             anchor.name = str(match.group(2))
             anchor.id = ObjectId(match.group(3))
+            anchor.loaded = False
             return anchor
         raise ValueError(f"{ref_id}] is not a valid reference!")
 
@@ -401,6 +407,7 @@ class BaseAnchor:
             access.anchors[ref_id] = level
             self._set.update({f"access.roots.anchors.{ref_id}": level.name})
             self._unset.pop(f"access.roots.anchors.{ref_id}", None)
+            self.invalidate_access()
 
     def disallow_root(
         self, root: Anchor, level: AccessLevel | int | str = AccessLevel.READ
@@ -412,6 +419,7 @@ class BaseAnchor:
         if (ref_id := root.ref_id) and access.anchors.pop(ref_id, None) is not None:
             self._unset.update({f"access.roots.anchors.{ref_id}": True})
             self._set.pop(f"access.roots.anchors.{ref_id}", None)
+            self.invalidate_access()
 
     def unrestrict(self, level: AccessLevel | int | str = AccessLevel.READ) -> None:
         """Allow everyone to access current Architype."""
@@ -419,12 +427,22 @@ class BaseAnchor:
         if level != self.access.all:
             self.access.all = level
             self._set.update({"access.all": level.name})
+            self.invalidate_access()
 
     def restrict(self) -> None:
         """Disallow others to access current Architype."""
         if self.access.all > AccessLevel.NO_ACCESS:
             self.access.all = AccessLevel.NO_ACCESS
             self._set.update({"access.all": AccessLevel.NO_ACCESS.name})
+            self.invalidate_access()
+
+    def invalidate_access(self) -> None:
+        """Drop cached access levels affected by current Architype."""
+        from .context import JASECI_CONTEXT
+
+        # nothing is cached without a context
+        if ctx := JASECI_CONTEXT.get(None):
+            ctx.access_cache.invalidate(self.id)
 
     ####################################################
     #                POPULATE OPERATIONS               #
@@ -432,7 +450,7 @@ class BaseAnchor:
 
     def is_populated(self) -> bool:
         """Check if populated."""
-        return "architype" in self.__dict__
+        return self.loaded
 
     def make_stub(self: "BaseAnchor | TANCH") -> "BaseAnchor | TANCH":
         """Return unsynced copy of anchor."""
@@ -440,6 +458,7 @@ class BaseAnchor:
             unloaded = object.__new__(self.__class__)
             unloaded.name = self.name
             unloaded.id = self.id
+            unloaded.loaded = False
             return unloaded
         return self
 
@@ -450,7 +469,7 @@ class BaseAnchor:
         jsrc = JaseciContext.get().mem
 
         if anchor := jsrc.find_by_id(self):
-            self.__dict__.update(anchor.__dict__)
+            self.populate_from(anchor)  # type: ignore[attr-defined]
         else:
             raise ValueError(
                 f"{self.__class__.__name__} [{self.ref_id}] is not a valid reference!"
@@ -466,7 +485,7 @@ class BaseAnchor:
             self.delete(bulk_write)
         elif not self.state.connected:
             self.state.connected = True
-            self.sync_hash()
+            self.track_changes()  # type: ignore[attr-defined]
             self.insert(bulk_write)
         elif self.has_connect_access(self):  # type: ignore[attr-defined]
             self.update(bulk_write, True)
@@ -511,23 +530,21 @@ class BaseAnchor:
 
         if JaseciContext.get().root.has_write_access(self):
             set_architype = changes.pop("$set", {})
-            if is_dataclass(architype := self.architype) and not isinstance(
-                architype, type
+            if (
+                self.dirty_fields
+                and is_dataclass(architype := self.architype)
+                and not isinstance(architype, type)
             ):
-                for (
-                    key,
-                    val,
-                ) in (
-                    architype.__serialize__().items()  # type:ignore[attr-defined] # mypy issue
-                ):
-                    if (h := hash(dumps(val))) != self.state.context_hashes.get(key):
-                        self.state.context_hashes[key] = h
-                        set_architype[f"architype.{key}"] = val
+                serialized = architype.__serialize__()  # type: ignore[attr-defined]
+                for key in self.dirty_fields:
+                    if key in serialized:
+                        set_architype[f"architype.{key}"] = serialized[key]
             if set_architype:
                 changes["$set"] = set_architype
         else:
             changes.pop("$set", None)
             changes.pop("$unset", None)
+        self.track_changes()  # type: ignore[attr-defined]
 
         # -------------------------------------------------------- #
 
@@ -591,23 +608,6 @@ class BaseAnchor:
         """Delete Anchor."""
         raise NotImplementedError("destroy must be implemented in subclasses")
 
-    def has_changed(self) -> int:
-        """Check if needs to update."""
-        if self.state.full_hash != (new_hash := hash(pdumps(self.serialize()))):
-            return new_hash
-        return 0
-
-    def sync_hash(self) -> None:
-        """Sync current serialization hash."""
-        if is_dataclass(architype := self.architype) and not isinstance(
-            architype, type
-        ):
-            self.state.context_hashes = {
-                key: hash(dumps(val))
-                for key, val in architype.__serialize__().items()  # type:ignore[attr-defined] # mypy issue
-            }
-            self.state.full_hash = hash(pdumps(self.serialize()))
-
     def access_level(self, to: Anchor) -> AccessLevel:
         """Access validation."""
         if not to.persistent:
@@ -625,6 +625,9 @@ class BaseAnchor:
         if jroot == jctx.system_root or jroot.id == to.root or jroot == to:
             return AccessLevel.WRITE
 
+        if (access_level := jctx.access_cache.get(jroot.id, to.id)) is not None:
+            return access_level
+
         access_level = AccessLevel.NO_ACCESS
 
         # if target anchor have set access.all
@@ -649,7 +652,7 @@ class BaseAnchor:
         if level > AccessLevel.NO_ACCESS and access_level == AccessLevel.NO_ACCESS:
             access_level = level
 
-        return access_level
+        return jctx.access_cache.set(jroot.id, to, access_level)
 
     # ---------------------------------------------------------------------- #
 
@@ -683,8 +686,8 @@ class BaseAnchor:
         if self.is_populated():
             attrs = ""
             for f in fields(self):
-                if f.name in self.__dict__:
-                    attrs += f"{f.name}={self.__dict__[f.name]}, "
+                if f.repr:
+                    attrs += f"{f.name}={getattr(self, f.name)}, "
             attrs = attrs[:-2]
         else:
             attrs = f"name={self.name}, id={self.id}"
@@ -726,7 +729,7 @@ class NodeAnchor(BaseAnchor, _NodeAnchor):  # type: ignore[misc]
                 **doc,
             )
             architype.__jac__ = anchor
-            anchor.sync_hash()
+            anchor.track_changes(wrap=True)
             return anchor
 
     @classmethod
@@ -736,6 +739,7 @@ class NodeAnchor(BaseAnchor, _NodeAnchor):  # type: ignore[misc]
             anchor = object.__new__(cls)
             anchor.name = str(match.group(1))
             anchor.id = ObjectId(match.group(2))
+            anchor.loaded = False
             return anchor
         raise ValueError(f"[{ref_id}] is not a valid reference!")
 
@@ -768,38 +772,62 @@ class NodeAnchor(BaseAnchor, _NodeAnchor):  # type: ignore[misc]
             jctx = JaseciContext.get()
 
             if jctx.root.has_write_access(self):
-
+                self.check_write()
                 self.state.deleted = False
 
                 for edge in self.edges:
                     edge.destroy()
                 jctx.mem.remove(self.id)
 
-    def get_edges(
+    def destroy_subgraph(
+        self, edge_filter: Callable[["EdgeArchitype"], bool] | None = None
+    ) -> None:
+        """Destroy node and everything reachable from it.
+
+        Pulls/deletes are queued per anchor and flushed as bulk writes on commit.
+        """
+        nodes, _ = self.collect_subgraph(edge_filter)
+        for node in nodes:
+            node.destroy()
+
+    def iter_edges(
         self,
         dir: EdgeDir,
         filter_func: Callable[[list["EdgeArchitype"]], list["EdgeArchitype"]] | None,
         target_obj: list["NodeArchitype"] | None,
-    ) -> list["EdgeArchitype"]:
-        """Get edges connected to this node."""
+        edge_type: type | None = None,
+    ) -> Generator["EdgeArchitype", None, None]:
+        """Stream edges connected to this node."""
         from .context import JaseciContext
 
         JaseciContext.get().mem.populate_data(self.edges)
 
-        return super().get_edges(dir, filter_func, target_obj)
+        yield from super().iter_edges(dir, filter_func, target_obj, edge_type)
 
-    def edges_to_nodes(
+    def iter_nodes(
         self,
         dir: EdgeDir,
         filter_func: Callable[[list["EdgeArchitype"]], list["EdgeArchitype"]] | None,
         target_obj: list["NodeArchitype"] | None,
-    ) -> list["NodeArchitype"]:
-        """Get set of nodes connected to this node."""
+        edge_type: type | None = None,
+    ) -> Generator["NodeArchitype", None, None]:
+        """Stream nodes connected to this node."""
         from .context import JaseciContext
 
         JaseciContext.get().mem.populate_data(self.edges)
 
-        return super().edges_to_nodes(dir, filter_func, target_obj)
+        yield from super().iter_nodes(dir, filter_func, target_obj, edge_type)
+
+    def get_field_index(
+        self, dir: EdgeDir, edge_type: type | None, cls: type, name: str
+    ) -> FieldIndex:
+        """Get neighbors of type cls sorted by field, built on first use."""
+        from .context import JaseciContext
+
+        if self.field_indexes is None:
+            JaseciContext.get().mem.populate_data(self.edges)
+
+        return super().get_field_index(dir, edge_type, cls, name)
 
     def serialize(self) -> dict[str, object]:
         """Serialize Node Anchor."""
@@ -845,7 +873,7 @@ class EdgeAnchor(BaseAnchor, _EdgeAnchor):  # type: ignore[misc]
                 **doc,
             )
             architype.__jac__ = anchor
-            anchor.sync_hash()
+            anchor.track_changes(wrap=True)
             return anchor
 
     def __post_init__(self) -> None:
@@ -860,6 +888,7 @@ class EdgeAnchor(BaseAnchor, _EdgeAnchor):  # type: ignore[misc]
             anchor = object.__new__(cls)
             anchor.name = str(match.group(1))
             anchor.id = ObjectId(match.group(2))
+            anchor.loaded = False
             return anchor
         raise ValueError(f"{ref_id}] is not a valid reference!")
 
@@ -891,6 +920,7 @@ class EdgeAnchor(BaseAnchor, _EdgeAnchor):  # type: ignore[misc]
             jctx = JaseciContext.get()
 
             if jctx.root.has_write_access(self):
+                self.check_write()
                 self.state.deleted = False
                 self.detach()
                 jctx.mem.remove(self.id)
@@ -918,9 +948,10 @@ class WalkerAnchor(BaseAnchor, _WalkerAnchor):  # type: ignore[misc]
 
     architype: "WalkerArchitype"
     path: list[Anchor] = field(default_factory=list)
-    next: list[Anchor] = field(default_factory=list)
+    next: deque[Anchor] = field(default_factory=deque)
     returns: list[Any] = field(default_factory=list)
-    ignores: list[Anchor] = field(default_factory=list)
+    ignores: set[Anchor] = field(default_factory=set)
+    visited: set[Anchor] = field(default_factory=set)
     disengaged: bool = False
 
     class Collection(BaseCollection["WalkerAnchor"]):
@@ -948,7 +979,7 @@ class WalkerAnchor(BaseAnchor, _WalkerAnchor):  # type: ignore[misc]
                 **doc,
             )
             architype.__jac__ = anchor
-            anchor.sync_hash()
+            anchor.track_changes(wrap=True)
             return anchor
 
     @classmethod
@@ -958,6 +989,7 @@ class WalkerAnchor(BaseAnchor, _WalkerAnchor):  # type: ignore[misc]
             anchor = object.__new__(cls)
             anchor.name = str(match.group(1))
             anchor.id = ObjectId(match.group(2))
+            anchor.loaded = False
             return anchor
         raise ValueError(f"{ref_id}] is not a valid reference!")
 
@@ -980,52 +1012,27 @@ class WalkerAnchor(BaseAnchor, _WalkerAnchor):  # type: ignore[misc]
             jctx = JaseciContext.get()
 
             if jctx.root.has_write_access(self):
+                self.check_write()
                 self.state.deleted = False
                 jctx.mem.remove(self.id)
 
     def spawn_call(self, node: Anchor) -> "WalkerArchitype":
         """Invoke data spatial call."""
-        if walker := self.architype:
-            self.path = []
-            self.next = [node]
-            self.returns = []
-            while len(self.next):
-                if current_node := self.next.pop(0).architype:
-                    for i in current_node._jac_entry_funcs_:
-                        if not i.trigger or isinstance(walker, i.trigger):
-                            if i.func:
-                                self.returns.append(i.func(current_node, walker))
-                            else:
-                                raise ValueError(f"No function {i.name} to call.")
-                        if self.disengaged:
-                            return walker
-                    for i in walker._jac_entry_funcs_:
-                        if not i.trigger or isinstance(current_node, i.trigger):
-                            if i.func:
-                                self.returns.append(i.func(walker, current_node))
-                            else:
-                                raise ValueError(f"No function {i.name} to call.")
-                        if self.disengaged:
-                            return walker
-                    for i in walker._jac_exit_funcs_:
-                        if not i.trigger or isinstance(current_node, i.trigger):
-                            if i.func:
-                                self.returns.append(i.func(walker, current_node))
-                            else:
-                                raise ValueError(f"No function {i.name} to call.")
-                        if self.disengaged:
-                            return walker
-                    for i in current_node._jac_exit_funcs_:
-                        if not i.trigger or isinstance(walker, i.trigger):
-                            if i.func:
-                                self.returns.append(i.func(current_node, walker))
-                            else:
-                                raise ValueError(f"No function {i.name} to call.")
-                        if self.disengaged:
-                            return walker
-            self.ignores = []
-            return walker
-        raise Exception(f"Invalid Reference {self.id}")
+        self.returns = []
+        for result in self.traverse(node):
+            if isawaitable(result):
+                result = run_awaitable(result)
+            self.returns.append(result)
+        return self.architype
+
+    async def async_spawn_call(self, node: Anchor) -> "WalkerArchitype":
+        """Invoke data spatial call, awaiting async abilities."""
+        self.returns = []
+        for result in self.traverse(node):
+            if isawaitable(result):
+                result = await result
+            self.returns.append(result)
+        return self.architype
 
 
 @dataclass(eq=False, repr=False, kw_only=True)
@@ -1118,8 +1125,8 @@ class EdgeArchitype(BaseArchitype, _EdgeArchitype):
             access=Permission(),
             state=AnchorState(),
         )
-        source.edges.append(jac)
-        target.edges.append(jac)
+        source.add_edge(jac)
+        target.add_edge(jac)
         source.connect_edge(jac)
         target.connect_edge(jac)
 
@@ -1186,8 +1193,8 @@ class GenericEdge(EdgeArchitype):
             access=Permission(),
             state=AnchorState(),
         )
-        source.edges.append(jac)
-        target.edges.append(jac)
+        source.add_edge(jac)
+        target.add_edge(jac)
         source.connect_edge(jac)
         target.connect_edge(jac)
 
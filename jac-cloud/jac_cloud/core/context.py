@@ -9,6 +9,7 @@ from bson import ObjectId
 
 from fastapi import Request
 
+from jaclang.runtimelib.architype import AccessCache
 from jaclang.runtimelib.context import ExecutionContext
 
 from .architype import (
@@ -68,6 +69,7 @@ class JaseciContext(ExecutionContext):
         ctx.request = request
         ctx.mem = MongoDB()
         ctx.reports = []
+        ctx.access_cache = AccessCache()
 
         if not isinstance(system_root := ctx.mem.find_by_id(SUPER_ROOT), NodeAnchor):
             system_root = NodeAnchor(
@@ -80,7 +82,7 @@ class JaseciContext(ExecutionContext):
             )
             system_root.architype.__jac__ = system_root
             NodeAnchor.Collection.insert_one(system_root.serialize())
-            system_root.sync_hash()
+            system_root.track_changes()
             ctx.mem.set(system_root.id, system_root)
 
         ctx.system_root = system_root
@@ -46,6 +46,19 @@ class MongoDB(Memory[ObjectId, BaseAnchor | Anchor]):
                     nodes.add(edge.target)
             self.find(nodes)
 
+    def prefetch(self, anchors: Iterable[BaseAnchor | Anchor]) -> None:
+        """Populate unloaded anchors with a single query per collection."""
+        stubs: dict[ObjectId, list[BaseAnchor | Anchor]] = {}
+        for anchor in anchors:
+            if not anchor.is_populated():
+                stubs.setdefault(anchor.id, []).append(anchor)
+
+        if stubs:
+            for anchor in self.find([stub[0] for stub in stubs.values()]):
+                for stub in stubs[anchor.id]:
+                    if stub is not anchor:
+                        stub.populate_from(anchor)
+
     def find(  # type: ignore[override]
         self,
         anchors: BA | Iterable[BA],
@@ -102,6 +115,10 @@ class MongoDB(Memory[ObjectId, BaseAnchor | Anchor]):
 
     def close(self) -> None:
         """Close memory handler."""
+        if self.read_only:
+            super().close()
+            return
+
         bulk_write = self.get_bulk_write()
 
         if bulk_write.has_operations:
@@ -135,14 +152,13 @@ class MongoDB(Memory[ObjectId, BaseAnchor | Anchor]):
             if anchor.architype and anchor.persistent:
                 if not anchor.state.connected:
                     anchor.state.connected = True
-                    anchor.sync_hash()
+                    anchor.track_changes()
                     bulk_write.operations[anchor.__class__].append(
                         InsertOne(anchor.serialize())
                     )
-                elif (new_hash := anchor.has_changed()) and anchor.has_connect_access(
-                    anchor
-                ):
-                    anchor.state.full_hash = new_hash
+                elif (
+                    anchor.state.changes or anchor.dirty_fields
+                ) and anchor.has_connect_access(anchor):
                     if (
                         not DISABLE_AUTO_CLEANUP
                         and isinstance(anchor, NodeAnchor)
@@ -23,7 +23,7 @@ from fastapi.responses import ORJSONResponse
 
 from jaclang.plugin.default import JacFeatureDefaults, hookimpl
 from jaclang.plugin.feature import JacFeature as Jac
-from jaclang.runtimelib.architype import DSFunc
+from jaclang.runtimelib.architype import DSFunc, DSTable
 
 from orjson import loads
 
@@ -161,6 +161,8 @@ def populate_apis(cls: Type[WalkerArchitype]) -> None:
 
             wlk: WalkerAnchor = cls(**body, **pl["query"], **pl["files"]).__jac__
             if jctx.validate_access():
+                # read-only walkers can't write, skip the bulk write on close
+                jctx.mem.read_only = cls.read_only
                 wlk.spawn_call(jctx.entry_node)
                 jctx.close()
                 return ORJSONResponse(jctx.response(wlk.returns))
@@ -291,6 +293,7 @@ class JacPlugin:
                 )
                 exit_funcs.update(new_exit_funcs)
                 cls._jac_exit_funcs_ = list(exit_funcs.values())
+                DSTable.invalidate()
 
             inner_init = cls.__init__  # type: ignore
 
@@ -8,6 +8,7 @@ import pickle
 import shutil
 import types
 from typing import Optional
+from uuid import UUID
 
 import jaclang.compiler.absyntree as ast
 from jaclang import jac_import
@@ -17,12 +18,14 @@ from jaclang.compiler.constant import Constants
 from jaclang.compiler.passes.main.pyast_load_pass import PyastBuildPass
 from jaclang.compiler.passes.main.schedules import py_code_gen_typed
 from jaclang.compiler.passes.tool.schedules import format_pass
-from jaclang.plugin.builtin import dotgen
 from jaclang.plugin.feature import JacCmd as Cmd
 from jaclang.plugin.feature import JacFeature as Jac
-from jaclang.runtimelib.constructs import WalkerArchitype
+from jaclang.runtimelib.constructs import WalkerAnchor, WalkerArchitype
 from jaclang.runtimelib.context import ExecutionContext
+from jaclang.runtimelib.graphwriter import WRITERS, walk_graph, write_graph
 from jaclang.runtimelib.machine import JacMachine, JacProgram
+from jaclang.runtimelib.profiler import Profiler
+from jaclang.runtimelib.snapshot import export_graph, import_graph
 from jaclang.utils.helpers import debugger as db
 from jaclang.utils.lang_tools import AstTool
 
@@ -67,9 +70,21 @@ def format(path: str, outfile: str = "", debug: bool = False) -> None:
 
 @cmd_registry.register
 def run(
-    filename: str, session: str = "", main: bool = True, cache: bool = True
+    filename: str,
+    session: str = "",
+    main: bool = True,
+    cache: bool = True,
+    profile: bool = False,
+    profile_json: str = "",
+    resume: str = "",
 ) -> None:
-    """Run the specified .jac file."""
+    """Run the specified .jac file.
+
+    :param profile: print walker profile after run.
+    :param profile_json: also dump walker profile as JSON to this path.
+    :param resume: id of a checkpointed walker in the session to continue, the
+        module is then imported without running its main entry code.
+    """
     # if no session specified, check if it was defined when starting the command shell
     # otherwise default to jaclang.session
     if session == "":
@@ -86,13 +101,14 @@ def run(
     mod = mod[:-4]
 
     jctx = ExecutionContext.create(session=session)
+    profiler = Profiler.start() if profile or profile_json else None
 
     if filename.endswith(".jac"):
         jac_import(
             target=mod,
             base_path=base,
             cachable=cache,
-            override_name="__main__" if main else None,
+            override_name="__main__" if main and not resume else None,
         )
     elif filename.endswith(".jir"):
         with open(filename, "rb") as f:
@@ -103,15 +119,23 @@ def run(
                 target=mod,
                 base_path=base,
                 cachable=cache,
-                override_name="__main__" if main else None,
+                override_name="__main__" if main and not resume else None,
             )
     else:
         jctx.close()
         JacMachine.detach()
         raise ValueError("Not a valid file!\nOnly supports `.jac` and `.jir`")
 
+    if resume:
+        if isinstance(walker := jctx.mem.find_by_id(UUID(resume)), WalkerAnchor):
+            walker.resume_call()
+        else:
+            print(f"No checkpointed walker {resume} in this session.")
+
     jctx.close()
     JacMachine.detach()
+    if profiler:
+        profiler.finish(jctx.mem.get_stats(), profile_json)
 
 
 @cmd_registry.register
@@ -225,6 +249,8 @@ def enter(
     cache: bool = True,
     root: str = "",
     node: str = "",
+    profile: bool = False,
+    profile_json: str = "",
 ) -> None:
     """
     Run the specified entrypoint function in the given .jac file.
@@ -232,9 +258,11 @@ def enter(
     :param filename: The path to the .jac file.
     :param entrypoint: The name of the entrypoint function.
     :param args: Arguments to pass to the entrypoint function.
-    :param session: shelve.Shelf file path.
+    :param session: shelve.Shelf file path, or SQLite database path ending in .db.
     :param root: root executor.
     :param node: starting node.
+    :param profile: print walker profile after run.
+    :param profile_json: also dump walker profile as JSON to this path.
     """
     if session == "":
         session = (
@@ -250,6 +278,7 @@ def enter(
     mod = mod[:-4]
 
     jctx = ExecutionContext.create(session=session, root=root)
+    profiler = Profiler.start() if profile or profile_json else None
 
     if filename.endswith(".jac"):
         ret_module = jac_import(
@@ -284,10 +313,16 @@ def enter(
             jctx.set_entry_node(node)
 
             if isinstance(architype, WalkerArchitype) and jctx.validate_access():
+                if architype.read_only:
+                    # commit what the module wrote, the walk itself can't write
+                    jctx.mem.sync()
+                    jctx.mem.read_only = True
                 Jac.spawn_call(jctx.entry_node.architype, architype)
 
     jctx.close()
     JacMachine.detach()
+    if profiler:
+        profiler.finish(jctx.mem.get_stats(), profile_json)
 
 
 @cmd_registry.register
@@ -398,6 +433,8 @@ def dot(
     bfs: bool = False,
     edge_limit: int = 512,
     node_limit: int = 512,
+    breadth: int = -1,
+    fraction: float = 1.0,
     saveto: str = "",
 ) -> None:
     """Generate and Visualize a graph based on the specified .jac file contents and parameters.
@@ -410,7 +447,9 @@ def dot(
     :param bfs: Flag to indicate whether to use breadth-first search for traversal (default is False).
     :param edge_limit: The maximum number of edges allowed in the graph.
     :param node_limit: The maximum number of nodes allowed in the graph.
-    :param saveto: Path to save the generated graph.
+    :param breadth: The maximum number of edges followed from each node (-1 for no limit).
+    :param fraction: Probability of keeping each newly reached node (default is 1.0).
+    :param saveto: Path to save the generated graph, .jsonl and .graphml pick those formats.
     """
     if session == "":
         session = (
@@ -432,27 +471,38 @@ def dot(
         jac_import(target=mod, base_path=base, override_name="__main__")
         module = jac_machine.loaded_modules.get("__main__")
         globals().update(vars(module))
+        file_name = saveto if saveto else f"{mod}.dot"
+        fmt = os.path.splitext(file_name)[1][1:]
+        # streamed next to the target, replacing it only once generation succeeds
+        tmp_name = f"{file_name}.{os.getpid()}.tmp"
         try:
-            node = globals().get(initial, eval(initial)) if initial else None
-            graph = dotgen(
-                node=node,
-                depth=depth,
-                traverse=traverse,
-                edge_type=connection,
-                bfs=bfs,
-                edge_limit=edge_limit,
-                node_limit=node_limit,
-            )
+            node = globals().get(initial, eval(initial)) if initial else Jac.get_root()
+            with open(tmp_name, "w") as file:
+                write_graph(
+                    file,
+                    fmt if fmt in WRITERS else "dot",
+                    walk_graph(
+                        node.__jac__,
+                        depth=depth,
+                        traverse=traverse,
+                        edge_type=connection,
+                        bfs=bfs,
+                        edge_limit=edge_limit,
+                        node_limit=node_limit,
+                        breadth=breadth,
+                        fraction=fraction,
+                    ),
+                )
+            os.replace(tmp_name, file_name)
         except Exception as e:
             print(f"Error while generating graph: {e}")
             import traceback
 
             traceback.print_exc()
+            if os.path.exists(tmp_name):
+                os.remove(tmp_name)
             jctx.close()
             return
-        file_name = saveto if saveto else f"{mod}.dot"
-        with open(file_name, "w") as file:
-            file.write(graph)
         print(f">>> Graph content saved to {os.path.join(os.getcwd(), file_name)}")
     else:
         print("Not a .jac file.")
@@ -460,6 +510,49 @@ def dot(
     jctx.close()
 
 
+@cmd_registry.register
+def graph(
+    action: str,
+    filepath: str,
+    session: str = "",
+    snapshot: str = "",
+    node: str = "",
+) -> None:
+    """Export or import the graph of a session as a columnar binary snapshot.
+
+    :param action: export (session to snapshot) or import (snapshot to session).
+    :param filepath: The .jac file defining the graph's architypes.
+    :param session: The session to export the graph from or import it into.
+    :param snapshot: Path of the snapshot (default is <module>.jgs).
+    :param node: Node id to export from or import onto (default is root node).
+    """
+    if action not in ("export", "import"):
+        print(f"Unknown graph action {action}, use export or import.")
+        return
+    if not filepath.endswith(".jac"):
+        print("Not a .jac file.")
+        return
+
+    base, mod = os.path.split(filepath)
+    base = base if base else "./"
+    mod = mod[:-4]
+    snapshot = snapshot or f"{mod}.jgs"
+
+    jctx = ExecutionContext.create(session=session)
+    try:
+        JacMachine(base)
+        jac_import(target=mod, base_path=base, override_name="__main__")
+        start = jctx.init_anchor(node, jctx.root).architype if node else None
+        if action == "export":
+            stats = export_graph(start or jctx.root.architype, snapshot)
+        else:
+            stats = import_graph(snapshot, start)
+        print(f"{action.capitalize()}ed {stats.nodes} nodes, {stats.edges} edges.")
+    finally:
+        jctx.close()
+        JacMachine.detach()
+
+
 @cmd_registry.register
 def py2jac(filename: str) -> None:
     """Convert a Python file to Jac.
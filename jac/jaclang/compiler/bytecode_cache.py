@@ -0,0 +1,115 @@
+"""Manifest of cached module bytecode.
+
+Each `__jac_gen__` folder keeps a `manifest.json` next to its `.jbc` files,
+recording per module the hash of the source it was compiled from, the compiler
+that built it and the hashes of every Jac module compiled into it (annexed impl
+and test modules, transitive imports). Bytecode is reused only while all of
+them still match, so an edit invalidates exactly the modules depending on it.
+"""
+
+from __future__ import annotations
+
+import json
+import marshal
+import os
+import types
+from hashlib import md5
+from importlib.metadata import PackageNotFoundError, version
+from importlib.util import MAGIC_NUMBER
+from typing import Optional
+
+from jaclang.compiler.constant import Constants as Con
+
+try:
+    JAC_VERSION = version("jaclang")
+except PackageNotFoundError:
+    JAC_VERSION = "unknown"
+
+# marshaled code objects are only valid for the Python that produced them
+COMPILER_VERSION = f"{JAC_VERSION}-{MAGIC_NUMBER.hex()}"
+
+# path -> (mtime_ns, size, hash), saves rehashing shared dependencies
+HASHES: dict[str, tuple[int, int, str]] = {}
+
+
+def source_hash(path: str) -> Optional[str]:
+    """Get the hash of a source file, as JacSource computes it."""
+    try:
+        stat = os.stat(path)
+        cached = HASHES.get(path)
+        if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+        with open(path) as file:
+            digest = md5(file.read().encode()).hexdigest()
+    except (OSError, UnicodeDecodeError):
+        return None
+    HASHES[path] = (stat.st_mtime_ns, stat.st_size, digest)
+    return digest
+
+
+def cache_targets(mod_path: str) -> tuple[str, str]:
+    """Get the generated folder of mod_path and the module's base name."""
+    base_path, file_name = os.path.split(os.path.abspath(mod_path))
+    return os.path.join(base_path, Con.JAC_GEN_DIR), os.path.splitext(file_name)[0]
+
+
+class BytecodeManifest:
+    """Manifest of one `__jac_gen__` folder."""
+
+    def __init__(self, gen_dir: str) -> None:
+        """Load manifest of gen_dir, empty if missing or unreadable."""
+        self.gen_dir = gen_dir
+        self.path = os.path.join(gen_dir, "manifest.json")
+        try:
+            with open(self.path) as file:
+                self.entries: dict[str, dict] = json.load(file)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def is_fresh(self, mod_path: str) -> bool:
+        """Check if the cached bytecode of mod_path is still valid."""
+        _, name = cache_targets(mod_path)
+        entry = self.entries.get(name)
+        return (
+            entry is not None
+            and entry.get("compiler") == COMPILER_VERSION
+            and entry.get("source") == source_hash(mod_path)
+            and all(
+                source_hash(dep) == digest
+                for dep, digest in entry.get("deps", {}).items()
+            )
+            and os.path.exists(os.path.join(self.gen_dir, f"{name}.jbc"))
+        )
+
+    def record(self, mod_path: str, source: str, deps: dict[str, str]) -> None:
+        """Record the source and dependency hashes mod_path was compiled from."""
+        _, name = cache_targets(mod_path)
+        own = os.path.abspath(mod_path)
+        self.entries[name] = {
+            "compiler": COMPILER_VERSION,
+            "source": source,
+            "deps": {
+                os.path.abspath(dep): digest
+                for dep, digest in sorted(deps.items())
+                if os.path.abspath(dep) != own
+            },
+        }
+
+    def save(self) -> None:
+        """Write manifest, replacing the old one at once."""
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as file:
+            json.dump(self.entries, file, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+def load_bytecode(mod_path: str) -> Optional[types.CodeType]:
+    """Load cached bytecode of mod_path, None if missing or stale."""
+    gen_dir, name = cache_targets(mod_path)
+    if not BytecodeManifest(gen_dir).is_fresh(mod_path):
+        return None
+    try:
+        with open(os.path.join(gen_dir, f"{name}.jbc"), "rb") as file:
+            return marshal.load(file)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
@@ -2140,6 +2140,17 @@ class PyastGenPass(Pass):
             if node.from_walker
             else ast3.Name(id=Con.HERE.value, ctx=ast3.Load())
         )
+        keywords = (
+            [
+                self.sync(
+                    ast3.keyword(
+                        arg="priority", value=self.gen_visit_priority(node.vis_type)
+                    )
+                )
+            ]
+            if node.vis_type
+            else []
+        )
         node.gen.py_ast = [
             self.sync(
                 ast3.If(
@@ -2157,7 +2168,7 @@ class PyastGenPass(Pass):
                                 )
                             ),
                             args=[loc, node.target.gen.py_ast[0]],
-                            keywords=[],
+                            keywords=keywords,
                         )
                     ),
                     body=[self.sync(ast3.Pass())],
@@ -2166,6 +2177,13 @@ class PyastGenPass(Pass):
             )
         ]
 
+    def gen_visit_priority(self, vis_type: ast.SubNodeList[ast.Expr]) -> ast3.AST:
+        """Priority of `visit :key: target;`, a tuple when several keys are given."""
+        keys = [key.gen.py_ast[0] for key in vis_type.items]
+        if len(keys) == 1:
+            return keys[0]
+        return self.sync(ast3.Tuple(elts=keys, ctx=ast3.Load()), vis_type)
+
     def exit_revisit_stmt(self, node: ast.RevisitStmt) -> None:
         """Sub objects.
 
@@ -2390,7 +2408,7 @@ class PyastGenPass(Pass):
                                 else self.sync(ast3.Constant(value=None))
                             ),
                         ],
-                        keywords=[],
+                        keywords=self.gen_edge_type_keyword(node.op.edge_spec),
                     )
                 )
             ]
@@ -2428,6 +2446,19 @@ class PyastGenPass(Pass):
         else:
             node.gen.py_ast = self.translate_jac_bin_op(node)
 
+    def in_async_ability(self, node: ast.AstNode) -> bool:
+        """Check if node is directly within the body of an async ability."""
+        parent = node.parent
+        while parent:
+            if isinstance(parent, ast.LambdaExpr):
+                return False
+            if isinstance(parent, ast.AbilityDef):
+                parent = parent.decl_link
+            if isinstance(parent, ast.Ability):
+                return parent.is_async
+            parent = parent.parent if parent else None
+        return False
+
     def translate_jac_bin_op(self, node: ast.BinaryExpr) -> list[ast3.AST]:
         """Translate jac binary op."""
         if isinstance(node.op, (ast.DisconnectOp, ast.ConnectOp)):
@@ -2452,23 +2483,23 @@ class PyastGenPass(Pass):
             return func_node.gen.py_ast
         elif node.op.name in [Tok.KW_SPAWN]:
             self.needs_jac_feature()
-            return [
-                self.sync(
-                    ast3.Call(
-                        func=self.sync(
-                            ast3.Attribute(
-                                value=self.sync(
-                                    ast3.Name(id=Con.JAC_FEATURE.value, ctx=ast3.Load())
-                                ),
-                                attr="spawn_call",
-                                ctx=ast3.Load(),
-                            )
-                        ),
-                        args=[node.left.gen.py_ast[0], node.right.gen.py_ast[0]],
-                        keywords=[],
-                    )
+            is_async = self.in_async_ability(node)
+            spawn_call = self.sync(
+                ast3.Call(
+                    func=self.sync(
+                        ast3.Attribute(
+                            value=self.sync(
+                                ast3.Name(id=Con.JAC_FEATURE.value, ctx=ast3.Load())
+                            ),
+                            attr="async_spawn_call" if is_async else "spawn_call",
+                            ctx=ast3.Load(),
+                        )
+                    ),
+                    args=[node.left.gen.py_ast[0], node.right.gen.py_ast[0]],
+                    keywords=[],
                 )
-            ]
+            )
+            return [self.sync(ast3.Await(value=spawn_call)) if is_async else spawn_call]
         elif node.op.name in [
             Tok.PIPE_BKWD,
             Tok.A_PIPE_BKWD,
@@ -3172,6 +3203,9 @@ class PyastGenPass(Pass):
                         else None
                     ),
                     edges_only=node.edges_only and cur == last_edge,
+                    lazy=isinstance(next_i, ast.FilterCompr)
+                    or bool(chomp[1:] if next_i else chomp)
+                    or self.consumes_edge_ref(node),
                 )
                 if next_i and isinstance(next_i, ast.FilterCompr):
                     pynode = self.sync(
@@ -3188,12 +3222,37 @@ class PyastGenPass(Pass):
                     cur,
                     targ=None,
                     edges_only=node.edges_only and cur == last_edge,
+                    lazy=True,
                 )
             else:
                 raise self.ice("Invalid edge ref trailer")
 
         node.gen.py_ast = [pynode]
 
+    def consumes_edge_ref(self, node: ast.EdgeRefTrailer) -> bool:
+        """Check if edge ref result is consumed right away, so it can stream."""
+        parent = node.parent
+        if isinstance(parent, ast.VisitStmt):
+            return parent.target is node
+        if isinstance(parent, ast.AtomTrailer):
+            return (
+                parent.target is node
+                and not parent.is_attr
+                and not parent.is_null_ok
+                and not parent.is_genai
+                and not isinstance(parent.right, ast.AssignCompr)
+            )
+        if isinstance(parent, ast.SubNodeList) and isinstance(
+            call := parent.parent, ast.FuncCall
+        ):
+            return (
+                call.params is parent
+                and len(parent.items) == 1
+                and isinstance(call.target, ast.Name)
+                and call.target.sym_name in ("any", "all")
+            )
+        return False
+
     def exit_edge_op_ref(self, node: ast.EdgeOpRef) -> None:
         """Sub objects.
 
@@ -3214,6 +3273,7 @@ class PyastGenPass(Pass):
         node: ast.EdgeOpRef,
         targ: Optional[ast3.AST],
         edges_only: bool,
+        lazy: bool = False,
     ) -> ast3.AST:
         """Generate ast for edge op ref call."""
         return self.sync(
@@ -3276,10 +3336,36 @@ class PyastGenPass(Pass):
                             value=self.sync(ast3.Constant(value=edges_only)),
                         )
                     ),
+                    *self.gen_edge_type_keyword(node),
+                    *(
+                        [
+                            self.sync(
+                                ast3.keyword(
+                                    arg="lazy",
+                                    value=self.sync(ast3.Constant(value=True)),
+                                )
+                            )
+                        ]
+                        if lazy
+                        else []
+                    ),
                 ],
             )
         )
 
+    def gen_edge_type_keyword(self, node: ast.EdgeOpRef) -> list[ast3.keyword]:
+        """Generate edge_type keyword for typed edge filters."""
+        if node.filter_cond and node.filter_cond.f_type:
+            return [
+                self.sync(
+                    ast3.keyword(
+                        arg="edge_type",
+                        value=node.filter_cond.f_type.gen.py_ast[0],
+                    )
+                )
+            ]
+        return []
+
     def exit_disconnect_op(self, node: ast.DisconnectOp) -> None:
         """Sub objects.
 
@@ -3449,6 +3535,64 @@ class PyastGenPass(Pass):
                 )
             )
         ]
+        if node.f_type and node.compares:
+            self.gen_field_filter(node, node.f_type)
+
+    def gen_field_filter(self, node: ast.FilterCompr, f_type: ast.Expr) -> None:
+        """Wrap typed filter lambda so indexed fields can be looked up."""
+        ops = {
+            ast3.Eq: "==",
+            ast3.Lt: "<",
+            ast3.LtE: "<=",
+            ast3.Gt: ">",
+            ast3.GtE: ">=",
+        }
+        conditions = [
+            self.sync(
+                ast3.Tuple(
+                    elts=[
+                        self.sync(ast3.Constant(value=compare.left.id)),
+                        self.sync(
+                            ast3.Constant(
+                                value=(
+                                    ops.get(type(compare.ops[0]), "")
+                                    if len(compare.ops) == 1
+                                    else ""
+                                )
+                            )
+                        ),
+                        compare.comparators[0],
+                    ],
+                    ctx=ast3.Load(),
+                ),
+                jac_node=x,
+            )
+            for x in (node.compares.items if node.compares else [])
+            if isinstance(compare := x.gen.py_ast[0], ast3.Compare)
+            and isinstance(compare.left, ast3.Name)
+        ]
+        self.needs_jac_feature()
+        node.gen.py_ast = [
+            self.sync(
+                ast3.Call(
+                    func=self.sync(
+                        ast3.Attribute(
+                            value=self.sync(
+                                ast3.Name(id=Con.JAC_FEATURE.value, ctx=ast3.Load())
+                            ),
+                            attr="FieldFilter",
+                            ctx=ast3.Load(),
+                        )
+                    ),
+                    args=[
+                        f_type.gen.py_ast[0],
+                        self.sync(ast3.List(elts=conditions, ctx=ast3.Load())),
+                        node.gen.py_ast[0],
+                    ],
+                    keywords=[],
+                )
+            )
+        ]
 
     def exit_assign_compr(self, node: ast.AssignCompr) -> None:
         """Sub objects.
@@ -9,6 +9,7 @@ import os
 
 
 import jaclang.compiler.absyntree as ast
+from jaclang.compiler.bytecode_cache import BytecodeManifest
 from jaclang.compiler.constant import Constants as Con
 from jaclang.compiler.passes import Pass
 
@@ -38,19 +39,39 @@ class PyOutPass(Pass):
         mods = [node] + [
             i for i in self.get_all_sub_nodes(node, ast.Module) if not i.stub_only
         ]
+        manifests: dict[str, BytecodeManifest] = {}
         for mod in mods:
             mod_path, out_path_py, out_path_pyc = self.get_output_targets(mod)
-            if os.path.exists(out_path_pyc) and os.path.getmtime(
-                out_path_pyc
-            ) > os.path.getmtime(mod_path):
+            gen_dir = os.path.dirname(out_path_pyc)
+            if gen_dir not in manifests:
+                manifests[gen_dir] = BytecodeManifest(gen_dir)
+            manifest = manifests[gen_dir]
+            if manifest.is_fresh(mod_path):
                 continue
             try:
                 self.gen_python(mod, out_path=out_path_py)
                 self.dump_bytecode(mod, mod_path=mod_path, out_path=out_path_pyc)
             except Exception as e:
                 self.warning(f"Error in generating Python code: {e}", node)
+                continue
+            # modules with errors are recompiled next time to report them again
+            if not self.errors_had:
+                manifest.record(mod_path, mod.source.hash, self.get_deps(mod))
+        for manifest in manifests.values():
+            try:
+                manifest.save()
+            except OSError as e:
+                self.warning(f"Can't write {manifest.path}: {e}", node)
         self.terminate()
 
+    def get_deps(self, node: ast.Module) -> dict[str, str]:
+        """Get source hashes of every Jac module compiled into node."""
+        return {
+            i.loc.mod_path: i.source.hash
+            for i in self.get_all_sub_nodes(node, ast.Module)
+            if not i.stub_only
+        }
+
     def gen_python(self, node: ast.Module, out_path: str) -> None:
         """Generate Python."""
         with open(out_path, "w") as f:
@@ -1,10 +1,13 @@
 """Tests for Jac Loader."""
 
 import io
+import os
 import sys
+import tempfile
 
 from jaclang import jac_import
 from jaclang.cli import cli
+from jaclang.compiler.bytecode_cache import BytecodeManifest, load_bytecode
 from jaclang.runtimelib.machine import JacMachine, JacProgram
 from jaclang.utils.test import TestCase
 
@@ -62,3 +65,32 @@ class TestLoader(TestCase):
             "{SomeObj(a=10): 'check'} [MyObj(apple=5, banana=7), MyObj(apple=5, banana=7)]",
             stdout_value,
         )
+
+    def test_bytecode_cache_invalidation(self) -> None:
+        """Test cached bytecode is dropped only for modules whose sources changed."""
+        program = JacProgram(mod_bundle=None, bytecode=None)
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = {}
+            for name, code in (
+                ("a", "import:jac b;\nwith entry { print(b.VAL); }\n"),
+                ("b", "glob VAL = 1;\n"),
+                ("c", "glob VAL = 2;\n"),
+            ):
+                paths[name] = os.path.join(tmp, f"{name}.jac")
+                with open(paths[name], "w") as f:
+                    f.write(code)
+            for name in ("a", "c"):
+                program.get_bytecode(name, paths[name], caller_dir=tmp)
+            self.assertIsNotNone(load_bytecode(paths["a"]))
+            manifest = BytecodeManifest(os.path.join(tmp, "__jac_gen__"))
+            self.assertEqual(list(manifest.entries["a"]["deps"]), [paths["b"]])
+
+            with open(paths["b"], "w") as f:
+                f.write("glob VAL = 10;\n")
+            self.assertIsNone(load_bytecode(paths["a"]))
+            self.assertIsNone(load_bytecode(paths["b"]))
+            self.assertIsNotNone(load_bytecode(paths["c"]))
+
+            program.get_bytecode("a", paths["a"], caller_dir=tmp)
+            self.assertIsNotNone(load_bytecode(paths["a"]))
+            self.assertIsNotNone(load_bytecode(paths["b"]))
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Any, Callable, Optional, Sequence, TypeVar
 
 from jaclang.plugin.feature import JacFeature as Jac
 from jaclang.runtimelib.constructs import Architype, NodeArchitype
 
+N = TypeVar("N", bound=type[NodeArchitype])
+
 
 def dotgen(
     node: Optional[NodeArchitype] = None,
@@ -16,6 +18,8 @@ def dotgen(
     bfs: Optional[bool] = None,
     edge_limit: Optional[int] = None,
     node_limit: Optional[int] = None,
+    breadth: Optional[int] = None,
+    fraction: Optional[float] = None,
     dot_file: Optional[str] = None,
 ) -> str:
     """Print the dot graph."""
@@ -28,6 +32,8 @@ def dotgen(
     bfs = bfs if bfs is not None else True
     edge_limit = edge_limit if edge_limit is not None else 512
     node_limit = node_limit if node_limit is not None else 512
+    breadth = breadth if breadth is not None else -1
+    fraction = fraction if fraction is not None else 1.0
 
     return pm.hook.dotgen(
         edge_type=edge_type,
@@ -37,6 +43,8 @@ def dotgen(
         bfs=bfs,
         edge_limit=edge_limit,
         node_limit=node_limit,
+        breadth=breadth,
+        fraction=fraction,
         dot_file=dot_file,
     )
 
@@ -44,3 +52,62 @@ def dotgen(
 def jid(obj: Architype) -> str:
     """Get the id of the object."""
     return Jac.object_ref(obj)
+
+
+def indexed(*fields: str) -> Callable[[N], N]:
+    """Index node fields so typed filters on neighbors use lookups, not scans."""
+
+    def decorate(cls: N) -> N:
+        if not issubclass(cls, NodeArchitype):
+            raise TypeError(f"@indexed only applies to nodes, not {cls.__name__}")
+        cls._jac_indexes_ = cls._jac_indexes_ | frozenset(fields)
+        return cls
+
+    return decorate
+
+
+def columnar(*fields: str) -> Callable[[N], N]:
+    """Keep numeric node fields in NumPy columns for bulk `column` reads."""
+
+    def decorate(cls: N) -> N:
+        from jaclang.runtimelib.columnar import make_columnar
+
+        if not issubclass(cls, NodeArchitype):
+            raise TypeError(f"@columnar only applies to nodes, not {cls.__name__}")
+        make_columnar(cls, fields)
+        return cls
+
+    return decorate
+
+
+def column(nodes: Sequence[NodeArchitype], field: str) -> Any:  # noqa: ANN401
+    """Get a field of every node as one NumPy array."""
+    from jaclang.runtimelib.columnar import gather
+
+    return gather(list(nodes), field)
+
+
+def top_k(nodes: Sequence[NodeArchitype], field: str, k: int) -> list[NodeArchitype]:
+    """Get the k nodes with the largest field values, largest first."""
+    from jaclang.runtimelib.columnar import gather, np
+
+    nodes = list(nodes)
+    if (k := min(k, len(nodes))) <= 0:
+        return []
+    values = -gather(nodes, field).astype(float)
+    best = np.argpartition(values, k - 1)[:k]
+    return [nodes[i] for i in best[np.argsort(values[best], kind="stable")]]
+
+
+def similarity(
+    nodes: Sequence[NodeArchitype], field: str, vector: Sequence[float]
+) -> Any:  # noqa: ANN401
+    """Get the cosine similarity of a vector field of every node to vector."""
+    from jaclang.runtimelib.columnar import gather, np
+
+    target = np.asarray(vector, float)
+    if not (nodes := list(nodes)):
+        return np.zeros(0)
+    matrix = gather(nodes, field).astype(float)
+    norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(target)
+    return np.divide(matrix @ target, norms, out=np.zeros(len(nodes)), where=norms > 0)
@@ -3,26 +3,44 @@
 from __future__ import annotations
 
 import ast as ast3
+import asyncio
 import fnmatch
-import html
+import io
 import os
 import pickle
 import types
 from collections import OrderedDict
 from dataclasses import field
 from functools import wraps
-from typing import Any, Callable, Mapping, Optional, Sequence, Type, Union
+from time import perf_counter
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    Generator,
+    Iterable,
+    Mapping,
+    Optional,
+    Sequence,
+    Type,
+    Union,
+    cast,
+)
 from uuid import UUID
 
 import jaclang.compiler.absyntree as ast
-from jaclang.compiler.constant import EdgeDir, colors
+from jaclang.compiler.constant import EdgeDir
 from jaclang.compiler.passes.main.pyast_gen_pass import PyastGenPass
 from jaclang.compiler.semtable import SemInfo, SemRegistry, SemScope
+from jaclang.runtimelib.architype import run_awaitable
 from jaclang.runtimelib.constructs import (
     Architype,
     DSFunc,
+    DSTable,
     EdgeAnchor,
     EdgeArchitype,
+    EdgeBuilder,
+    EdgeRefs,
     ExecutionContext,
     GenericEdge,
     JacTestCheck,
@@ -32,9 +50,11 @@ from jaclang.runtimelib.constructs import (
     WalkerAnchor,
     WalkerArchitype,
 )
+from jaclang.runtimelib.graphwriter import walk_graph, write_dot
 from jaclang.runtimelib.importer import ImportPathSpec, JacImporter, PythonImporter
 from jaclang.runtimelib.machine import JacMachine, JacProgram
-from jaclang.runtimelib.utils import traverse_graph
+from jaclang.runtimelib.parallel import spawn_many
+from jaclang.runtimelib.profiler import Profiler
 from jaclang.plugin.feature import JacFeature as Jac  # noqa: I100
 from jaclang.plugin.spec import P, T
 
@@ -121,6 +141,7 @@ class JacFeatureDefaults:
             )
             exit_funcs.update(new_exit_funcs)
             cls._jac_exit_funcs_ = list(exit_funcs.values())
+            DSTable.invalidate()
 
         inner_init = cls.__init__  # type: ignore
 
@@ -372,6 +393,43 @@ class JacFeatureDefaults:
         else:
             raise TypeError("Invalid walker object")
 
+    @staticmethod
+    @hookimpl
+    def async_spawn_call(
+        op1: Architype, op2: Architype
+    ) -> Coroutine[Any, Any, WalkerArchitype]:
+        """Jac's spawn operator feature for async abilities."""
+        if isinstance(op1, WalkerArchitype):
+            return op1.__jac__.async_spawn_call(op2.__jac__)
+        elif isinstance(op2, WalkerArchitype):
+            return op2.__jac__.async_spawn_call(op1.__jac__)
+        else:
+            raise TypeError("Invalid walker object")
+
+    @staticmethod
+    @hookimpl
+    def spawn_concurrent(
+        spawns: list[tuple[Architype, Architype]]
+    ) -> list[WalkerArchitype]:
+        """Run spawns concurrently on a single event loop."""
+
+        async def spawn_all() -> list[WalkerArchitype]:
+            return await asyncio.gather(
+                *(Jac.async_spawn_call(op1, op2) for op1, op2 in spawns)
+            )
+
+        return run_awaitable(spawn_all())
+
+    @staticmethod
+    @hookimpl
+    def spawn_many(
+        walker: Callable[[], WalkerArchitype],
+        start_nodes: list[NodeArchitype],
+        workers: Optional[int],
+    ) -> list[WalkerArchitype]:
+        """Spawn walker on independent start nodes in parallel."""
+        return spawn_many(walker, start_nodes, workers)
+
     @staticmethod
     @hookimpl
     def report(expr: Any) -> Any:  # noqa: ANN401
@@ -392,7 +450,9 @@ class JacFeatureDefaults:
         """Jac's ignore stmt feature."""
         if isinstance(walker, WalkerArchitype):
             return walker.__jac__.ignore_node(
-                (i.__jac__ for i in expr) if isinstance(expr, list) else [expr.__jac__]
+                [expr.__jac__]
+                if isinstance(expr, Architype)
+                else (i.__jac__ for i in expr)
             )
         else:
             raise TypeError("Invalid walker object")
@@ -407,12 +467,21 @@ class JacFeatureDefaults:
             | list[EdgeArchitype]
             | NodeArchitype
             | EdgeArchitype
+            | EdgeRefs
         ),
+        priority: object,
     ) -> bool:
         """Jac's visit stmt feature."""
         if isinstance(walker, WalkerArchitype):
+            if profiler := Profiler.current():
+                profiler.visits += 1
             return walker.__jac__.visit_node(
-                (i.__jac__ for i in expr) if isinstance(expr, list) else [expr.__jac__]
+                (
+                    [cast(NodeAnchor | EdgeAnchor, expr.__jac__)]
+                    if isinstance(expr, Architype)
+                    else (cast(NodeAnchor | EdgeAnchor, i.__jac__) for i in expr)
+                ),
+                priority,
             )
         else:
             raise TypeError("Invalid walker object")
@@ -427,13 +496,23 @@ class JacFeatureDefaults:
     @staticmethod
     @hookimpl
     def edge_ref(
-        node_obj: NodeArchitype | list[NodeArchitype],
+        node_obj: NodeArchitype | Iterable[NodeArchitype],
         target_obj: Optional[NodeArchitype | list[NodeArchitype]],
         dir: EdgeDir,
         filter_func: Optional[Callable[[list[EdgeArchitype]], list[EdgeArchitype]]],
         edges_only: bool,
-    ) -> list[NodeArchitype] | list[EdgeArchitype]:
+        edge_type: Optional[type],
+        lazy: bool,
+    ) -> list[NodeArchitype] | list[EdgeArchitype] | EdgeRefs:
         """Jac's apply_dir stmt feature."""
+        start = perf_counter()
+        # plain neighbor queries of one node can be answered by its field indexes
+        origin = (
+            (node_obj.__jac__, dir, edge_type)
+            if isinstance(node_obj, NodeArchitype)
+            and not (target_obj or filter_func or edges_only)
+            else None
+        )
         if isinstance(node_obj, NodeArchitype):
             node_obj = [node_obj]
         targ_obj_set: Optional[list[NodeArchitype]] = (
@@ -441,22 +520,43 @@ class JacFeatureDefaults:
             if isinstance(target_obj, NodeArchitype)
             else target_obj if target_obj else None
         )
-        if edges_only:
-            connected_edges: list[EdgeArchitype] = []
-            for node in node_obj:
-                connected_edges += node.__jac__.get_edges(
-                    dir, filter_func, target_obj=targ_obj_set
-                )
-            return list(set(connected_edges))
-        else:
-            connected_nodes: list[NodeArchitype] = []
-            for node in node_obj:
-                connected_nodes.extend(
-                    node.__jac__.edges_to_nodes(
-                        dir, filter_func, target_obj=targ_obj_set
+        profiler = Profiler.current()
+
+        def stream() -> Generator[NodeArchitype | EdgeArchitype, None, None]:
+            # order preserving dedup, as nodes are only known while streaming
+            seen: set[NodeArchitype | EdgeArchitype] = set()
+            scanned = 0
+            try:
+                for node in node_obj:
+                    anchor = node.__jac__
+                    scanned += len(anchor.edges) if profiler else 0
+                    items: Iterable[NodeArchitype | EdgeArchitype]
+                    if edges_only:
+                        items = anchor.iter_edges(
+                            dir, filter_func, targ_obj_set, edge_type
+                        )
+                    else:
+                        items = anchor.iter_nodes(
+                            dir, filter_func, targ_obj_set, edge_type
+                        )
+                    for item in items:
+                        if item not in seen:
+                            seen.add(item)
+                            yield item
+            finally:
+                if profiler:
+                    profiler.edge_query(
+                        f"{dir.name} {edge_type.__name__ if edge_type else '*'}"
+                        f"{' edges' if edges_only else ''}",
+                        scanned,
+                        len(seen),
+                        start,
                     )
-                )
-            return list(set(connected_nodes))
+
+        if lazy:
+            return EdgeRefs(stream(), origin)
+        # all edges if edges_only else all nodes
+        return cast(list[NodeArchitype] | list[EdgeArchitype], list(stream()))
 
     @staticmethod
     @hookimpl
@@ -470,19 +570,23 @@ class JacFeatureDefaults:
 
         Note: connect needs to call assign compr with tuple in op
         """
+        start = perf_counter()
         left = [left] if isinstance(left, NodeArchitype) else left
         right = [right] if isinstance(right, NodeArchitype) else right
-        edges = []
+        edges: list[EdgeArchitype] = []
 
         root = Jac.get_root().__jac__
 
-        for i in left:
-            _left = i.__jac__
-            if root.has_connect_access(_left):
-                for j in right:
-                    _right = j.__jac__
-                    if root.has_connect_access(_right):
-                        edges.append(edge_spec(_left, _right))
+        # access is checked once per anchor instead of once per pair
+        if sources := [i.__jac__ for i in left if root.has_connect_access(i.__jac__)]:
+            targets = [j.__jac__ for j in right if root.has_connect_access(j.__jac__)]
+            if isinstance(edge_spec, EdgeBuilder):
+                edges = edge_spec.bulk(sources, targets)
+            else:
+                edges = [edge_spec(i, j) for i in sources for j in targets]
+
+        if profiler := Profiler.current():
+            profiler.connected(len(edges), start)
         return right if not edges_only else edges
 
     @staticmethod
@@ -492,6 +596,7 @@ class JacFeatureDefaults:
         right: NodeArchitype | list[NodeArchitype],
         dir: EdgeDir,
         filter_func: Optional[Callable[[list[EdgeArchitype]], list[EdgeArchitype]]],
+        edge_type: Optional[type],
     ) -> bool:  # noqa: ANN401
         """Jac's disconnect operator feature."""
         disconnect_occurred = False
@@ -502,11 +607,11 @@ class JacFeatureDefaults:
 
         for i in left:
             node = i.__jac__
-            for anchor in set(node.edges):
+            # destroying edges changes them, iterate over a snapshot
+            for anchor in list(node.filter_edges(dir, filter_func, edge_type)):
                 if (
                     (source := anchor.source)
                     and (target := anchor.target)
-                    and (not filter_func or filter_func([anchor.architype]))
                     and source.architype
                     and target.architype
                 ):
@@ -529,6 +634,15 @@ class JacFeatureDefaults:
 
         return disconnect_occurred
 
+    @staticmethod
+    @hookimpl
+    def destroy_subgraph(
+        node: NodeArchitype,
+        edge_filter: Optional[Callable[[EdgeArchitype], bool]],
+    ) -> None:
+        """Destroy node and everything reachable through its outgoing edges."""
+        node.__jac__.destroy_subgraph(edge_filter)
+
     @staticmethod
     @hookimpl
     def assign_compr(
@@ -561,24 +675,11 @@ class JacFeatureDefaults:
         conn_assign: Optional[tuple[tuple, tuple]],
     ) -> Callable[[NodeAnchor, NodeAnchor], EdgeArchitype]:
         """Jac's root getter."""
-        conn_type = conn_type if conn_type else GenericEdge
-
-        def builder(source: NodeAnchor, target: NodeAnchor) -> EdgeArchitype:
-            edge = conn_type() if isinstance(conn_type, type) else conn_type
-            edge.__attach__(source, target, is_undirected)
-            if conn_assign:
-                for fld, val in zip(conn_assign[0], conn_assign[1]):
-                    if hasattr(edge, fld):
-                        setattr(edge, fld, val)
-                    else:
-                        raise ValueError(f"Invalid attribute: {fld}")
-            if source.persistent or target.persistent:
-                edge.__jac__.save()
-                target.save()
-                source.save()
-            return edge
-
-        return builder
+        return EdgeBuilder(
+            is_undirected=is_undirected,
+            conn_type=conn_type if conn_type else GenericEdge,
+            conn_assign=conn_assign,
+        )
 
     @staticmethod
     @hookimpl
@@ -858,79 +959,30 @@ class JacBuiltin:
         bfs: bool,
         edge_limit: int,
         node_limit: int,
+        breadth: int,
+        fraction: float,
         dot_file: Optional[str],
     ) -> str:
         """Generate Dot file for visualizing nodes and edges."""
-        edge_type = edge_type if edge_type else []
-        visited_nodes: list[NodeArchitype] = []
-        node_depths: dict[NodeArchitype, int] = {node: 0}
-        queue: list = [[node, 0]]
-        connections: list[tuple[NodeArchitype, NodeArchitype, EdgeArchitype]] = []
-
-        def dfs(node: NodeArchitype, cur_depth: int) -> None:
-            """Depth first search."""
-            if node not in visited_nodes:
-                visited_nodes.append(node)
-                traverse_graph(
-                    node,
-                    cur_depth,
-                    depth,
-                    edge_type,
-                    traverse,
-                    connections,
-                    node_depths,
-                    visited_nodes,
-                    queue,
-                    bfs,
-                    dfs,
-                    node_limit,
-                    edge_limit,
-                )
-
-        if bfs:
-            cur_depth = 0
-            while queue:
-                current_node, cur_depth = queue.pop(0)
-                if current_node not in visited_nodes:
-                    visited_nodes.append(current_node)
-                    traverse_graph(
-                        current_node,
-                        cur_depth,
-                        depth,
-                        edge_type,
-                        traverse,
-                        connections,
-                        node_depths,
-                        visited_nodes,
-                        queue,
-                        bfs,
-                        dfs,
-                        node_limit,
-                        edge_limit,
-                    )
-        else:
-            dfs(node, cur_depth=0)
-        dot_content = (
-            'digraph {\nnode [style="filled", shape="ellipse", '
-            'fillcolor="invis", fontcolor="black"];\n'
+        out = io.StringIO()
+        write_dot(
+            out,
+            walk_graph(
+                node.__jac__,
+                depth=depth,
+                traverse=traverse,
+                edge_type=edge_type or [],
+                bfs=bfs,
+                edge_limit=edge_limit,
+                node_limit=node_limit,
+                breadth=breadth,
+                fraction=fraction,
+            ),
         )
-        for source, target, edge in connections:
-            dot_content += (
-                f"{visited_nodes.index(source)} -> {visited_nodes.index(target)} "
-                f' [label="{html.escape(str(edge.__jac__.architype))} "];\n'
-            )
-        for node_ in visited_nodes:
-            color = (
-                colors[node_depths[node_]] if node_depths[node_] < 25 else colors[24]
-            )
-            dot_content += (
-                f'{visited_nodes.index(node_)} [label="{html.escape(str(node_.__jac__.architype))}"'
-                f'fillcolor="{color}"];\n'
-            )
         if dot_file:
             with open(dot_file, "w") as f:
-                f.write(dot_content + "}")
-        return dot_content + "}"
+                f.write(out.getvalue())
+        return out.getvalue()
 
 
 class JacCmdDefaults:
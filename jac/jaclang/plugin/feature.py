@@ -4,7 +4,20 @@ from __future__ import annotations
 
 import ast as ast3
 import types
-from typing import Any, Callable, Mapping, Optional, Sequence, Type, TypeAlias, Union
+from functools import update_wrapper
+from inspect import signature
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    Iterable,
+    Mapping,
+    Optional,
+    Sequence,
+    Type,
+    TypeAlias,
+    Union,
+)
 
 import jaclang.compiler.absyntree as ast
 from jaclang.compiler.passes.main.pyast_gen_pass import PyastGenPass
@@ -12,6 +25,7 @@ from jaclang.plugin.spec import JacBuiltin, JacCmdSpec, JacFeatureSpec, P, T
 from jaclang.runtimelib.constructs import (
     Architype,
     EdgeArchitype,
+    EdgeRefs,
     NodeAnchor,
     NodeArchitype,
     Root,
@@ -21,7 +35,113 @@ from jaclang.runtimelib.context import ExecutionContext
 
 import pluggy
 
-pm = pluggy.PluginManager("jac")
+
+class JacPluginManager(pluggy.PluginManager):
+    """Plugin manager binding single implementation hooks straight to JacFeature.
+
+    A `firstresult` hook with exactly one plain implementation always returns
+    that implementation's result, so the feature method is swapped for a copy of
+    it and calls skip the hook caller. Bindings are redone whenever plugins or
+    hook call monitors change.
+    """
+
+    def __init__(self, project_name: str) -> None:
+        """Create manager with nothing bound."""
+        super().__init__(project_name)
+        self.feature: Optional[type] = None
+        self.originals: dict[str, staticmethod] = {}
+        self.monitors = 0
+
+    def register(self, plugin: object, name: Optional[str] = None) -> Optional[str]:
+        """Register plugin and rebind hooks."""
+        plugin_name = super().register(plugin, name)
+        self.bind_hooks()
+        return plugin_name
+
+    def unregister(
+        self, plugin: Optional[object] = None, name: Optional[str] = None
+    ) -> Optional[object]:
+        """Unregister plugin and rebind hooks."""
+        removed = super().unregister(plugin, name)
+        self.bind_hooks()
+        return removed
+
+    def add_hookcall_monitoring(
+        self,
+        before: Callable[..., None],
+        after: Callable[..., None],
+    ) -> Callable[[], None]:
+        """Route every hook through the hook caller while monitored."""
+        undo = super().add_hookcall_monitoring(before, after)
+        self.monitors += 1
+        self.bind_hooks()
+
+        def unmonitor() -> None:
+            undo()
+            self.monitors -= 1
+            self.bind_hooks()
+
+        return unmonitor
+
+    def bind_to(self, feature: type) -> None:
+        """Bind hook backed static methods of feature."""
+        self.feature = feature
+        self.originals = {
+            name: method
+            for name, method in vars(feature).items()
+            if isinstance(method, staticmethod) and hasattr(self.hook, name)
+        }
+        self.bind_hooks()
+
+    def bind_hooks(self) -> None:
+        """Point every feature method at its sole implementation, if it has one."""
+        if self.feature is None:
+            return
+        for name, method in self.originals.items():
+            direct = self.direct_impl(name, method.__func__)
+            setattr(self.feature, name, staticmethod(direct) if direct else method)
+
+    def direct_impl(self, name: str, wrapper: Callable) -> Optional[Callable]:
+        """Get a copy of the only implementation of hook name, if safe to call."""
+        hook = getattr(self.hook, name)
+        impls = hook.get_hookimpls()
+        if (
+            self.monitors
+            or not hook.spec
+            or not hook.spec.opts.get("firstresult")
+            or hook.is_historic()
+            or len(impls) != 1
+            or impls[0].hookwrapper
+            or impls[0].wrapper
+            or not isinstance(impls[0].function, types.FunctionType)
+        ):
+            return None
+        impl = impls[0].function
+        params = [(p.name, p.kind) for p in signature(wrapper).parameters.values()]
+        if (
+            params != [(p.name, p.kind) for p in signature(impl).parameters.values()]
+            # the hook caller passes exactly the spec's arguments
+            or [name for name, _ in params]
+            != [*hook.spec.argnames, *hook.spec.kwargnames]
+            # impl defaults are replaced, so the feature must cover all of them
+            or len(impl.__defaults__ or ()) > len(wrapper.__defaults__ or ())
+            or not (impl.__kwdefaults__ or {}).keys()
+            <= (wrapper.__kwdefaults__ or {}).keys()
+        ):
+            return None
+        # same code, but with the defaults callers of the feature rely on
+        direct = types.FunctionType(
+            impl.__code__,
+            impl.__globals__,
+            impl.__name__,
+            wrapper.__defaults__,  # type: ignore[attr-defined]
+            impl.__closure__,
+        )
+        direct.__kwdefaults__ = wrapper.__kwdefaults__  # type: ignore[attr-defined]
+        return update_wrapper(direct, wrapper)
+
+
+pm = JacPluginManager("jac")
 pm.add_hookspecs(JacFeatureSpec)
 pm.add_hookspecs(JacCmdSpec)
 pm.add_hookspecs(JacBuiltin)
@@ -32,9 +152,11 @@ class JacFeature:
 
     from jaclang.compiler.constant import EdgeDir as EdgeDirType
     from jaclang.runtimelib.constructs import DSFunc as DSFuncType
+    from jaclang.runtimelib.constructs import FieldFilter as FieldFilterType
 
     EdgeDir: TypeAlias = EdgeDirType
     DSFunc: TypeAlias = DSFuncType
+    FieldFilter: TypeAlias = FieldFilterType
     RootType: TypeAlias = Root
     Obj: TypeAlias = Architype
     Node: TypeAlias = NodeArchitype
@@ -167,6 +289,31 @@ class JacFeature:
         """Jac's spawn operator feature."""
         return pm.hook.spawn_call(op1=op1, op2=op2)
 
+    @staticmethod
+    def async_spawn_call(
+        op1: Architype, op2: Architype
+    ) -> Coroutine[Any, Any, WalkerArchitype]:
+        """Jac's spawn operator feature for async abilities."""
+        return pm.hook.async_spawn_call(op1=op1, op2=op2)
+
+    @staticmethod
+    def spawn_concurrent(
+        spawns: list[tuple[Architype, Architype]]
+    ) -> list[WalkerArchitype]:
+        """Run spawns concurrently on a single event loop."""
+        return pm.hook.spawn_concurrent(spawns=spawns)
+
+    @staticmethod
+    def spawn_many(
+        walker: Callable[[], WalkerArchitype],
+        start_nodes: list[NodeArchitype],
+        workers: Optional[int] = None,
+    ) -> list[WalkerArchitype]:
+        """Spawn walker on independent start nodes in parallel."""
+        return pm.hook.spawn_many(
+            walker=walker, start_nodes=start_nodes, workers=workers
+        )
+
     @staticmethod
     def report(expr: Any) -> Any:  # noqa: ANN401
         """Jac's report stmt feature."""
@@ -195,10 +342,12 @@ class JacFeature:
             | list[EdgeArchitype]
             | NodeArchitype
             | EdgeArchitype
+            | EdgeRefs
         ),
+        priority: object = None,
     ) -> bool:  # noqa: ANN401
         """Jac's visit stmt feature."""
-        return pm.hook.visit_node(walker=walker, expr=expr)
+        return pm.hook.visit_node(walker=walker, expr=expr, priority=priority)
 
     @staticmethod
     def disengage(walker: WalkerArchitype) -> bool:  # noqa: ANN401
@@ -207,19 +356,27 @@ class JacFeature:
 
     @staticmethod
     def edge_ref(
-        node_obj: NodeArchitype | list[NodeArchitype],
+        node_obj: NodeArchitype | Iterable[NodeArchitype],
         target_obj: Optional[NodeArchitype | list[NodeArchitype]],
         dir: EdgeDir,
         filter_func: Optional[Callable[[list[EdgeArchitype]], list[EdgeArchitype]]],
         edges_only: bool = False,
-    ) -> list[NodeArchitype] | list[EdgeArchitype]:
-        """Jac's apply_dir stmt feature."""
+        edge_type: Optional[type] = None,
+        lazy: bool = False,
+    ) -> list[NodeArchitype] | list[EdgeArchitype] | EdgeRefs:
+        """Jac's apply_dir stmt feature.
+
+        With lazy, references are streamed (deduplicated in order) as EdgeRefs,
+        so early terminating consumers don't walk every edge.
+        """
         return pm.hook.edge_ref(
             node_obj=node_obj,
             target_obj=target_obj,
             dir=dir,
             filter_func=filter_func,
             edges_only=edges_only,
+            edge_type=edge_type,
+            lazy=lazy,
         )
 
     @staticmethod
@@ -243,6 +400,7 @@ class JacFeature:
         right: NodeArchitype | list[NodeArchitype],
         dir: EdgeDir,
         filter_func: Optional[Callable[[list[EdgeArchitype]], list[EdgeArchitype]]],
+        edge_type: Optional[type] = None,
     ) -> bool:
         """Jac's disconnect operator feature."""
         return pm.hook.disconnect(
@@ -250,8 +408,17 @@ class JacFeature:
             right=right,
             dir=dir,
             filter_func=filter_func,
+            edge_type=edge_type,
         )
 
+    @staticmethod
+    def destroy_subgraph(
+        node: NodeArchitype,
+        edge_filter: Optional[Callable[[EdgeArchitype], bool]] = None,
+    ) -> None:
+        """Destroy node and everything reachable through its outgoing edges."""
+        return pm.hook.destroy_subgraph(node=node, edge_filter=edge_filter)
+
     @staticmethod
     def assign_compr(
         target: list[T], attr_val: tuple[tuple[str], tuple[Any]]
@@ -364,6 +531,9 @@ class JacFeature:
         return pm.hook.get_by_llm_call_args(_pass=_pass, node=node)
 
 
+pm.bind_to(JacFeature)
+
+
 class JacCmd:
     """Jac CLI command."""
 
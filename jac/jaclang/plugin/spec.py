@@ -7,6 +7,8 @@ import types
 from typing import (
     Any,
     Callable,
+    Coroutine,
+    Iterable,
     Mapping,
     Optional,
     ParamSpec,
@@ -28,7 +30,12 @@ if TYPE_CHECKING:
         Root,
         DSFunc,
     )
-    from jaclang.runtimelib.constructs import EdgeArchitype, NodeAnchor, NodeArchitype
+    from jaclang.runtimelib.constructs import (
+        EdgeArchitype,
+        EdgeRefs,
+        NodeAnchor,
+        NodeArchitype,
+    )
     from jaclang.runtimelib.context import ExecutionContext
 
 import pluggy
@@ -164,6 +171,32 @@ class JacFeatureSpec:
         """Jac's spawn operator feature."""
         raise NotImplementedError
 
+    @staticmethod
+    @hookspec(firstresult=True)
+    def async_spawn_call(
+        op1: Architype, op2: Architype
+    ) -> Coroutine[Any, Any, WalkerArchitype]:
+        """Jac's spawn operator feature for async abilities."""
+        raise NotImplementedError
+
+    @staticmethod
+    @hookspec(firstresult=True)
+    def spawn_concurrent(
+        spawns: list[tuple[Architype, Architype]]
+    ) -> list[WalkerArchitype]:
+        """Run spawns concurrently on a single event loop."""
+        raise NotImplementedError
+
+    @staticmethod
+    @hookspec(firstresult=True)
+    def spawn_many(
+        walker: Callable[[], WalkerArchitype],
+        start_nodes: list[NodeArchitype],
+        workers: Optional[int],
+    ) -> list[WalkerArchitype]:
+        """Spawn walker on independent start nodes in parallel."""
+        raise NotImplementedError
+
     @staticmethod
     @hookspec(firstresult=True)
     def report(expr: Any) -> Any:  # noqa: ANN401
@@ -195,7 +228,9 @@ class JacFeatureSpec:
             | list[EdgeArchitype]
             | NodeArchitype
             | EdgeArchitype
+            | EdgeRefs
         ),
+        priority: object,
     ) -> bool:  # noqa: ANN401
         """Jac's visit stmt feature."""
         raise NotImplementedError
@@ -209,12 +244,14 @@ class JacFeatureSpec:
     @staticmethod
     @hookspec(firstresult=True)
     def edge_ref(
-        node_obj: NodeArchitype | list[NodeArchitype],
+        node_obj: NodeArchitype | Iterable[NodeArchitype],
         target_obj: Optional[NodeArchitype | list[NodeArchitype]],
         dir: EdgeDir,
         filter_func: Optional[Callable[[list[EdgeArchitype]], list[EdgeArchitype]]],
         edges_only: bool,
-    ) -> list[NodeArchitype] | list[EdgeArchitype]:
+        edge_type: Optional[type],
+        lazy: bool,
+    ) -> list[NodeArchitype] | list[EdgeArchitype] | EdgeRefs:
         """Jac's apply_dir stmt feature."""
         raise NotImplementedError
 
@@ -239,10 +276,20 @@ class JacFeatureSpec:
         right: NodeArchitype | list[NodeArchitype],
         dir: EdgeDir,
         filter_func: Optional[Callable[[list[EdgeArchitype]], list[EdgeArchitype]]],
+        edge_type: Optional[type],
     ) -> bool:  # noqa: ANN401
         """Jac's disconnect operator feature."""
         raise NotImplementedError
 
+    @staticmethod
+    @hookspec(firstresult=True)
+    def destroy_subgraph(
+        node: NodeArchitype,
+        edge_filter: Optional[Callable[[EdgeArchitype], bool]],
+    ) -> None:
+        """Destroy node and everything reachable through its outgoing edges."""
+        raise NotImplementedError
+
     @staticmethod
     @hookspec(firstresult=True)
     def assign_compr(
@@ -352,6 +399,8 @@ class JacBuiltin:
         bfs: bool,
         edge_limit: int,
         node_limit: int,
+        breadth: int,
+        fraction: float,
         dot_file: Optional[str],
     ) -> str:
         """Print the dot graph."""
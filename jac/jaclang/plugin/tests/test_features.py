@@ -3,8 +3,8 @@
 import inspect
 from typing import List, Type
 
-from jaclang.plugin.default import JacFeatureDefaults
-from jaclang.plugin.feature import JacFeature
+from jaclang.plugin.default import JacFeatureDefaults, hookimpl
+from jaclang.plugin.feature import JacFeature, pm
 from jaclang.plugin.spec import JacFeatureSpec
 from jaclang.utils.test import TestCase
 
@@ -54,3 +54,34 @@ class TestFeatures(TestCase):
         self.assertEqual(jac_feature_spec_methods, jac_feature_defaults_methods)
         for i in jac_feature_spec_methods:
             self.assertIn(i, jac_feature_methods)
+
+    def test_direct_bound_hooks(self) -> None:
+        """Test sole implementations are bound directly and rebound on changes."""
+        original = pm.originals["elvis"]
+        self.assertIsNot(JacFeature.__dict__["elvis"], original)
+        self.assertEqual(JacFeature.elvis(None, 3), 3)
+
+        class Override:
+            @staticmethod
+            @hookimpl
+            def elvis(op1: object, op2: object) -> object:
+                return "override"
+
+        pm.register(Override)
+        try:
+            self.assertIs(JacFeature.__dict__["elvis"], original)
+            self.assertEqual(JacFeature.elvis(None, 3), "override")
+        finally:
+            pm.unregister(Override)
+        self.assertIsNot(JacFeature.__dict__["elvis"], original)
+
+        calls: list[str] = []
+        undo = pm.add_hookcall_monitoring(
+            lambda name, *_: calls.append(name), lambda *_: None
+        )
+        try:
+            JacFeature.elvis(1, 3)
+        finally:
+            undo()
+        self.assertEqual(calls, ["elvis"])
+        self.assertIsNot(JacFeature.__dict__["elvis"], original)
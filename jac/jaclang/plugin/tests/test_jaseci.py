@@ -2,9 +2,27 @@
 
 import io
 import os
+import pickle
+import sqlite3
+import subprocess
 import sys
+from unittest.mock import patch
 
+import jaclang
 from jaclang.cli import cli
+from jaclang.plugin.feature import JacFeature as Jac
+from jaclang.runtimelib.architype import (
+    AccessLevel,
+    Anchor,
+    DEFAULT_PERMISSION,
+    NodeAnchor,
+    NodeArchitype,
+    Permission,
+    Root,
+)
+from jaclang.runtimelib.context import ExecutionContext
+from jaclang.runtimelib.snapshot import export_graph
+from jaclang.settings import settings
 from jaclang.utils.test import TestCase
 
 session = ""
@@ -589,3 +607,545 @@ class TestJaseciPlugin(TestCase):
         )
 
         self._del_session(session)
+
+    def test_access_cache_invalidation(self) -> None:
+        """Test memoized access levels get invalidated on permission changes."""
+        ctx = ExecutionContext.create()
+        try:
+            owner = Root().__jac__
+            owner.persistent = True
+            owner.root = owner.id
+            ctx.mem.set(owner.id, owner)
+
+            node = Root().__jac__
+            node.persistent = True
+            node.root = owner.id
+            ctx.mem.set(node.id, node)
+
+            guest = Root().__jac__
+            ctx.root = guest
+
+            self.assertEqual(AccessLevel.NO_ACCESS, guest.access_level(node))
+            self.assertEqual(
+                AccessLevel.NO_ACCESS, ctx.access_cache.get(guest.id, node.id)
+            )
+
+            owner.allow_root(guest.id, AccessLevel.READ)
+            self.assertEqual(AccessLevel.READ, guest.access_level(node))
+
+            node.unrestrict(AccessLevel.CONNECT)
+            self.assertEqual(AccessLevel.CONNECT, guest.access_level(node))
+
+            node.restrict()
+            self.assertEqual(AccessLevel.READ, guest.access_level(node))
+
+            owner.disallow_root(guest.id)
+            self.assertEqual(AccessLevel.NO_ACCESS, guest.access_level(node))
+
+            node.access = Permission(all=AccessLevel.READ)
+            self.assertEqual(AccessLevel.READ, guest.access_level(node))
+
+            other = Root().__jac__
+            other.persistent = True
+            other.root = other.id
+            ctx.mem.set(other.id, other)
+            other.allow_root(guest.id, AccessLevel.CONNECT)
+            node.access = Permission()
+            self.assertEqual(AccessLevel.NO_ACCESS, guest.access_level(node))
+            node.root = other.id
+            self.assertEqual(AccessLevel.CONNECT, guest.access_level(node))
+        finally:
+            ctx.close()
+
+    def test_dirty_tracking(self) -> None:
+        """Test only changed anchors and fields are flagged for persistence."""
+        session = self.fixture_abs_path("dirty_tracking.session")
+        self._output2buffer()
+        for entrypoint in ["create", "check", "mutate", "check", "bump", "check"]:
+            cli.enter(
+                filename=self.fixture_abs_path("dirty_tracking.jac"),
+                session=session,
+                entrypoint=entrypoint,
+                args=[],
+            )
+        self.assertEqual(
+            self.capturedOutput.getvalue().strip().split("\n"),
+            [
+                "['a'] {'n': {'k': [1]}} 0 1 []",
+                "set()",
+                "['count', 'meta', 'tags']",
+                "['a', 'b'] {'n': {'k': [1, 2]}} 1 1 []",
+                "set()",
+                "['info']",
+                "['a', 'b'] {'n': {'k': [1, 2]}} 1 2 [2]",
+                "set()",
+            ],
+        )
+        self._del_session(session)
+
+    def test_bounded_anchor_cache(self) -> None:
+        """Test evicting clean anchors keeps changes of dirty ones."""
+        session = self.fixture_abs_path("bounded_cache.session")
+        self._output2buffer()
+        cli.enter(
+            filename=self.fixture_abs_path("bounded_cache.jac"),
+            session=session,
+            entrypoint="create",
+            args=[],
+        )
+        settings.anchor_cache_size = 6
+        try:
+            for entrypoint in ["bump", "check"]:
+                cli.enter(
+                    filename=self.fixture_abs_path("bounded_cache.jac"),
+                    session=session,
+                    entrypoint=entrypoint,
+                    args=[],
+                )
+        finally:
+            settings.anchor_cache_size = 0
+        self.assertEqual(
+            self.capturedOutput.getvalue().strip().split("\n"),
+            [
+                "20 True True",
+                str([i + 100 if i % 5 == 0 else i for i in range(20)]),
+            ],
+        )
+        self._del_session(session)
+
+    def test_evicted_anchor_unload(self) -> None:
+        """Test evicted anchors turn back into stubs, keeping their architypes."""
+        session = self.fixture_abs_path("evicted_unload.session")
+        self._output2buffer()
+        cli.enter(
+            filename=self.fixture_abs_path("bounded_cache.jac"),
+            session=session,
+            entrypoint="create",
+            args=[],
+        )
+        settings.anchor_cache_size = 6
+        ctx = ExecutionContext.create(session=session)
+        try:
+            first = ctx.root.edges[0].target
+            item = first.architype
+            node = first
+            for _ in range(10):
+                node = node.edges[-1].target
+            self.assertFalse(first.is_populated())
+            self.assertLessEqual(ctx.mem.get_stats().resident, 6)
+            self.assertIs(ctx.mem.__detached__[first.id], item)
+
+            self.assertEqual(item.val, 0)
+            item.val = 100
+            self.assertTrue(item.__jac__.is_populated())
+            self.assertIs(first.architype, item)
+            self.assertIs(ctx.mem.find_by_id(first.id).architype, item)
+        finally:
+            settings.anchor_cache_size = 0
+            ctx.close()
+
+        ctx = ExecutionContext.create(session=session)
+        try:
+            self.assertEqual(ctx.root.edges[0].target.architype.val, 100)
+        finally:
+            ctx.close()
+        self._del_session(session)
+
+    def test_gc_sweep(self) -> None:
+        """Test sweeping anchors cut off from every root and running walker."""
+        session = self.fixture_abs_path("gc_sweep.session")
+        self._output2buffer()
+        for entrypoint in ["create", "drop", "check"]:
+            cli.enter(
+                filename=self.fixture_abs_path("gc_sweep.jac"),
+                session=session,
+                entrypoint=entrypoint,
+                args=[],
+            )
+        self._del_session(session)
+
+        settings.gc_threshold = 16
+        try:
+            cli.enter(
+                filename=self.fixture_abs_path("gc_sweep.jac"),
+                entrypoint="churn",
+                args=[],
+            )
+        finally:
+            settings.gc_threshold = 0
+        self.assertEqual(
+            self.capturedOutput.getvalue().strip().split("\n"),
+            ["0", "9", "2 [10, 11, 12, 13, 14, 20, 21, 22, 23, 24]", "10 141"],
+        )
+
+    def test_resume_walker(self) -> None:
+        """Test resuming a walker killed mid-walk from its last checkpoint."""
+        # the crawl runs in a fresh interpreter, wherever the suite was started
+        jac_path = os.path.dirname(os.path.dirname(jaclang.__file__))
+        env = {
+            **os.environ,
+            "CRAWL_CRASH_AT": "6",
+            "PYTHONPATH": os.pathsep.join(
+                filter(None, [jac_path, os.environ.get("PYTHONPATH")])
+            ),
+        }
+        for name in ["resume_walker.session", "resume_walker.db"]:
+            session = self.fixture_abs_path(name)
+            self._del_session(session)
+            filename = self.fixture_abs_path("checkpoint_walker.jac")
+            cli.enter(filename=filename, session=session, entrypoint="build", args=[])
+            crashed = subprocess.run(
+                [sys.executable, "-m", "jaclang.cli.cli", "enter"]
+                + ["-e", "crawl", "-s", session, filename],
+                capture_output=True,
+                text=True,
+                cwd=self.fixture_abs_path(""),
+                env=env,
+            )
+            self.assertEqual(crashed.returncode, 86, crashed.stderr)
+            walker_id = crashed.stdout.strip().removeprefix("n::")
+
+            self._output2buffer()
+            cli.run(filename=filename, session=session, resume=walker_id)
+            cli.enter(filename=filename, session=session, entrypoint="check", args=[])
+            # finished walks drop their checkpoint
+            cli.run(filename=filename, session=session, resume=walker_id)
+            self.assertEqual(
+                self.capturedOutput.getvalue().strip().split("\n"),
+                [
+                    str(list(range(10))),
+                    str(list(range(100, 110))),
+                    f"No checkpointed walker {walker_id} in this session.",
+                ],
+            )
+            self._del_session(session)
+
+    def test_resume_disengaged_walker(self) -> None:
+        """Test disengaged walkers drop their checkpoint too."""
+        session = self.fixture_abs_path("resume_halt.session")
+        self._del_session(session)
+        filename = self.fixture_abs_path("checkpoint_walker.jac")
+        self._output2buffer()
+        for entrypoint in ["build", "halt"]:
+            cli.enter(
+                filename=filename, session=session, entrypoint=entrypoint, args=[]
+            )
+        walker_id, *vals = self.capturedOutput.getvalue().strip().split("\n")
+        cli.run(filename=filename, session=session, resume=walker_id)
+        self.assertEqual(vals, ["0", "1", "2", "3"])
+        self.assertEqual(
+            self.capturedOutput.getvalue().strip().split("\n")[1:],
+            [*vals, f"No checkpointed walker {walker_id} in this session."],
+        )
+        self._del_session(session)
+
+    def test_sqlite_session(self) -> None:
+        """Test .db sessions persist graph on SQLite."""
+        session = self.fixture_abs_path("sqlite_session.db")
+        self._output2buffer()
+        for entrypoint in ["create", "traverse"]:
+            cli.enter(
+                filename=self.fixture_abs_path("simple_persistent.jac"),
+                session=session,
+                entrypoint=entrypoint,
+                args=[],
+            )
+        self._del_session(session)
+
+        session = self.fixture_abs_path("sqlite_bounded_cache.db")
+        cli.enter(
+            filename=self.fixture_abs_path("bounded_cache.jac"),
+            session=session,
+            entrypoint="create",
+            args=[],
+        )
+        settings.anchor_cache_size = 6
+        try:
+            for entrypoint in ["bump", "check"]:
+                cli.enter(
+                    filename=self.fixture_abs_path("bounded_cache.jac"),
+                    session=session,
+                    entrypoint=entrypoint,
+                    args=[],
+                )
+        finally:
+            settings.anchor_cache_size = 0
+        self.assertEqual(
+            self.capturedOutput.getvalue().strip().split("\n"),
+            [
+                "node a",
+                "node b",
+                "20 True True",
+                str([i + 100 if i % 5 == 0 else i for i in range(20)]),
+            ],
+        )
+
+        conn = sqlite3.connect(session)
+        self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone(), ("wal",))
+        self.assertEqual(conn.execute("SELECT COUNT(*) FROM edge").fetchone(), (20,))
+        conn.close()
+        self._del_session(session)
+
+    def test_spawn_many(self) -> None:
+        """Test walkers spawned on a process pool merge back into the session."""
+        self._output2buffer()
+        for session in ["parallel_session.db", "parallel_session"]:
+            session = self.fixture_abs_path(session)
+            for entrypoint in ["create", "fanout", "check"]:
+                cli.enter(
+                    filename=self.fixture_abs_path("spawn_many.jac"),
+                    session=session,
+                    entrypoint=entrypoint,
+                    args=[],
+                )
+            self._del_session(session)
+
+        expected = [
+            "True [0, 1, 2, 3, 4, 5, 6, 7]",
+            str([(i + 100, [i * 10]) for i in range(8) if i != 5]),
+        ]
+        self.assertEqual(
+            self.capturedOutput.getvalue().strip().split("\n"), expected * 2
+        )
+
+    def test_graph_snapshot(self) -> None:
+        """Test graph round trips through a columnar snapshot into a new session."""
+        source = self.fixture_abs_path("snapshot_src")
+        target = self.fixture_abs_path("snapshot_dst.db")
+        snapshot = f"{source}.jgs"
+        filename = self.fixture_abs_path("graph_snapshot.jac")
+        self._output2buffer()
+        cli.enter(filename=filename, session=source, entrypoint="create", args=[])
+        cli.graph(action="export", filepath=filename, session=source, snapshot=snapshot)
+        cli.graph(action="import", filepath=filename, session=target, snapshot=snapshot)
+        with self.assertRaises(ValueError):
+            cli.graph(
+                action="import", filepath=filename, session=target, snapshot=snapshot
+            )
+        for session in [source, target]:
+            cli.enter(filename=filename, session=session, entrypoint="check", args=[])
+        self._del_session(source)
+        self._del_session(target)
+
+        output = self.capturedOutput.getvalue().strip().split("\n")
+        self.assertEqual(
+            output[:2], ["Exported 6 nodes, 9 edges.", "Imported 6 nodes, 9 edges."]
+        )
+        self.assertEqual(
+            output[2],
+            "[('p0', 20, 0.0, True, [0, '0'], 'p3'), ('p1', 21, 0.5, True, [1, '1'],"
+            " None), ('p2', 22, 1.0, True, [2, '2'], None), ('p3', 23, 1.5, False,"
+            " [3, '3'], None)]",
+        )
+        self.assertEqual(
+            output[3:6],
+            [
+                "[0, 1, 2, 3]",
+                "[('p0', []), ('p1', ['p2']), ('p2', ['p1']), ('p3', [])]",
+                "['core']",
+            ],
+        )
+        self.assertEqual(output[2:7], output[7:])
+
+    def test_graph_snapshot_access(self) -> None:
+        """Test snapshots only hold what the current root can read."""
+        snapshot = self.fixture_abs_path("restricted.jgs")
+        ctx = ExecutionContext.create()
+        try:
+            root = Root()
+            ctx.root = root.__jac__
+            a, b, c = (NodeArchitype() for _ in range(3))
+            spec = Jac.build_edge(is_undirected=False, conn_type=None, conn_assign=None)
+            Jac.connect(left=root, right=a, edge_spec=spec)
+            Jac.connect(left=a, right=b, edge_spec=spec)
+            Jac.connect(left=b, right=c, edge_spec=spec)
+            # owned by another root, without access granted
+            b.__jac__.persistent = True
+            b.__jac__.root = Root().__jac__.id
+            stats = export_graph(root, snapshot)
+        finally:
+            ctx.close()
+            if os.path.exists(snapshot):
+                os.remove(snapshot)
+        self.assertEqual((stats.nodes, stats.edges), (2, 1))
+
+    def test_neighborhood_prefetch(self) -> None:
+        """Test edges and neighbors of a node are loaded in batches."""
+        session = self.fixture_abs_path("prefetch.db")
+        self._output2buffer()
+        cli.enter(
+            filename=self.fixture_abs_path("bounded_cache.jac"),
+            session=session,
+            entrypoint="create",
+            args=[],
+        )
+        ctx = ExecutionContext.create(session=session)
+        try:
+            with patch.object(ctx.mem, "load", wraps=ctx.mem.load) as load:
+                root = ctx.root
+                root.prefetch(depth=2)
+                self.assertEqual(load.call_count, 4)
+                edge = root.edges[0]
+                self.assertTrue(edge.is_populated())
+                self.assertTrue(edge.target.is_populated())
+                node = edge.target.edges[1].target
+                self.assertTrue(node.is_populated())
+                self.assertEqual(node.architype.val, 1)
+                self.assertFalse(node.edges[1].is_populated())
+                self.assertEqual(load.call_count, 4)
+        finally:
+            ctx.close()
+        self._del_session(session)
+
+    def test_shared_default_permission(self) -> None:
+        """Test anchors share default permission until access is changed."""
+        ctx = ExecutionContext.create()
+        try:
+            first, second = Root().__jac__, Root().__jac__
+            self.assertIs(first.access, DEFAULT_PERMISSION)
+            self.assertIs(second.access, DEFAULT_PERMISSION)
+
+            first.allow_root(ctx.root.id, AccessLevel.WRITE)
+            self.assertIsNot(first.access, DEFAULT_PERMISSION)
+            self.assertIs(second.access, DEFAULT_PERMISSION)
+            self.assertEqual(DEFAULT_PERMISSION, Permission())
+
+            loaded = pickle.loads(pickle.dumps(second))
+            self.assertIs(loaded.access, DEFAULT_PERMISSION)
+            self.assertTrue(loaded.is_populated())
+
+            stub = pickle.loads(pickle.dumps(second.make_stub()))
+            self.assertFalse(stub.is_populated())
+            self.assertEqual(stub.__class__.__dictoffset__, 0)
+        finally:
+            ctx.close()
+
+    def test_bulk_connect(self) -> None:
+        """Test list connect checks access and saves each anchor once."""
+        ctx = ExecutionContext.create()
+        try:
+            root = ctx.root.architype
+            nodes = [Root() for _ in range(3)]
+            spec = Jac.build_edge(is_undirected=False, conn_type=None, conn_assign=None)
+            with patch.object(
+                NodeAnchor, "save", autospec=True, side_effect=NodeAnchor.save
+            ) as save, patch.object(
+                Anchor,
+                "has_connect_access",
+                autospec=True,
+                side_effect=Anchor.has_connect_access,
+            ) as access:
+                edges = Jac.connect(
+                    left=[root, root], right=nodes, edge_spec=spec, edges_only=True
+                )
+            self.assertEqual(len(edges), 6)
+            self.assertEqual(access.call_count, 5)
+            self.assertEqual(save.call_count, 4)
+            self.assertTrue(all(node.__jac__.persistent for node in nodes))
+            self.assertEqual(len(ctx.root.edges), 6)
+        finally:
+            ctx.close()
+
+    def test_destroy_subgraph(self) -> None:
+        """Test subgraph is destroyed in batch, dropping edges from survivors."""
+        session = self.fixture_abs_path("subgraph_session.db")
+        ctx = ExecutionContext.create(session=session)
+        root = ctx.root.architype
+        a, b, c, d, x = (NodeArchitype() for _ in range(5))
+        spec = Jac.build_edge(is_undirected=False, conn_type=None, conn_assign=None)
+        both = Jac.build_edge(is_undirected=True, conn_type=None, conn_assign=None)
+        Jac.connect(left=root, right=[a, x], edge_spec=spec)
+        for left, right in [(a, b), (b, c), (c, a), (x, b)]:
+            Jac.connect(left=left, right=right, edge_spec=spec)
+        Jac.connect(left=a, right=d, edge_spec=both)
+        ctx.close()
+
+        ctx = ExecutionContext.create(session=session)
+        try:
+            root = ctx.root.architype
+            a, x = Jac.edge_ref(root, None, Jac.EdgeDir.OUT, None)
+            Jac.destroy_subgraph(a, lambda edge: not edge.__jac__.is_undirected)
+            self.assertEqual(Jac.edge_ref(root, None, Jac.EdgeDir.OUT, None), [x])
+            self.assertEqual(x.__jac__.edges, [root.__jac__.edges[0]])
+            self.assertEqual(len(ctx.mem.__gc__), 9)
+        finally:
+            ctx.close()
+
+        conn = sqlite3.connect(session)
+        counts = [
+            conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in ["node", "edge", "adjacency"]
+        ]
+        conn.close()
+        self._del_session(session)
+        # d survives the skipped undirected edge but is dropped once orphaned
+        self.assertEqual(counts, [2, 1, 2])
+
+    def test_destroyed_not_reloaded(self) -> None:
+        """Test destroyed anchors aren't reloaded from storage before sync."""
+        for name in ["destroyed.session", "destroyed.db"]:
+            session = self.fixture_abs_path(name)
+            ctx = ExecutionContext.create(session=session)
+            node = NodeArchitype()
+            spec = Jac.build_edge(is_undirected=False, conn_type=None, conn_assign=None)
+            Jac.connect(left=ctx.root.architype, right=node, edge_spec=spec)
+            ctx.close()
+
+            ctx = ExecutionContext.create(session=session)
+            try:
+                anchor = ctx.root.edges[0].target
+                anchor.destroy()
+                self.assertIn(anchor, ctx.mem.__gc__)
+                self.assertIsNone(ctx.mem.find_by_id(anchor.id))
+                self.assertEqual(list(ctx.mem.find([anchor.id])), [])
+            finally:
+                ctx.close()
+            self._del_session(session)
+
+    def test_read_only_walker(self) -> None:
+        """Test read-only walkers can read but not write the graph."""
+        session = self.fixture_abs_path("readonly_session")
+        filename = self.fixture_abs_path("read_only_walker.jac")
+        self._output2buffer()
+        cli.enter(filename=filename, session=session, entrypoint="create", args=[])
+        cli.enter(filename=filename, session=session, entrypoint="total", args=[])
+        for entrypoint in ["bump", "link", "purge"]:
+            with self.assertRaises(PermissionError):
+                cli.enter(
+                    filename=filename, session=session, entrypoint=entrypoint, args=[]
+                )
+        cli.enter(filename=filename, session=session, entrypoint="total", args=[])
+        self._del_session(session)
+        self.assertEqual(self.capturedOutput.getvalue().split("\n"), ["3", "3", ""])
+
+    def test_lazy_edge_ref(self) -> None:
+        """Test edge refs dedup in order and lazy ones stop early."""
+        ctx = ExecutionContext.create()
+        try:
+            root = ctx.root.architype
+            nodes = [Root() for _ in range(50)]
+            spec = Jac.build_edge(is_undirected=False, conn_type=None, conn_assign=None)
+            Jac.connect(left=root, right=nodes, edge_spec=spec)
+
+            self.assertEqual(
+                Jac.edge_ref([root, root], None, Jac.EdgeDir.OUT, None), nodes
+            )
+
+            pulled = []
+
+            def counted(edges: list) -> list:
+                for edge in edges:
+                    pulled.append(edge)
+                    yield edge
+
+            refs = Jac.edge_ref(root, None, Jac.EdgeDir.OUT, counted, lazy=True)
+            self.assertIs(refs[2], nodes[2])
+            self.assertEqual(len(pulled), 3)
+            self.assertEqual(refs[1:4], nodes[1:4])
+            self.assertEqual(len(pulled), 4)
+            self.assertEqual(list(refs)[:5], nodes[:5])
+            self.assertEqual(len(refs), 50)
+            self.assertEqual(len(pulled), 50)
+            self.assertEqual(list(refs), nodes)
+        finally:
+            ctx.close()
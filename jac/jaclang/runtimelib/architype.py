@@ -2,21 +2,47 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field, fields, is_dataclass
-from enum import IntEnum
+from asyncio import get_running_loop, run
+from bisect import bisect_left, bisect_right
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from contextvars import ContextVar, copy_context
+from dataclasses import MISSING, asdict, dataclass, field, fields, is_dataclass
+from datetime import date, time, timedelta
+from enum import Enum, IntEnum
+from functools import cache
+from heapq import heappop, heappush
+from inspect import isawaitable
+from io import StringIO
+from itertools import count, islice
 from logging import getLogger
-from pickle import dumps
+from operator import itemgetter
+from time import monotonic
 from types import UnionType
-from typing import Any, Callable, ClassVar, Iterable, Optional, TypeVar
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Generator,
+    Iterable,
+    Iterator,
+    Optional,
+    TypeVar,
+    cast,
+)
 from uuid import UUID, uuid4
+from weakref import ReferenceType, ref
 
 from jaclang.compiler.constant import EdgeDir
-from jaclang.runtimelib.utils import collect_node_connections
+from jaclang.settings import settings
 
 logger = getLogger(__name__)
 
 TARCH = TypeVar("TARCH", bound="Architype")
 TANCH = TypeVar("TANCH", bound="Anchor")
+T = TypeVar("T")
 
 
 class AccessLevel(IntEnum):
@@ -58,6 +84,182 @@ class Permission:
     roots: Access = field(default_factory=Access)
 
 
+# shared by every anchor until its access is changed (see Anchor.own_access)
+DEFAULT_PERMISSION = Permission()
+
+
+@dataclass
+class AccessCache:
+    """Memoized access levels of roots to anchors for an execution context."""
+
+    # target anchor id -> current root id -> access level
+    levels: dict[object, dict[object, AccessLevel]] = field(default_factory=dict)
+    # root id -> ids of cached anchors under that root's graph
+    dependents: dict[object, set[object]] = field(default_factory=dict)
+
+    def get(self, root_id: object, anchor_id: object) -> AccessLevel | None:
+        """Get cached access level."""
+        if levels := self.levels.get(anchor_id):
+            return levels.get(root_id)
+        return None
+
+    def set(self, root_id: object, anchor: Anchor, level: AccessLevel) -> AccessLevel:
+        """Cache access level."""
+        self.levels.setdefault(anchor.id, {})[root_id] = level
+        if anchor.root:
+            self.dependents.setdefault(anchor.root, set()).add(anchor.id)
+        return level
+
+    def invalidate(self, anchor_id: object) -> None:
+        """Drop access levels that depend on the anchor's permission."""
+        self.levels.pop(anchor_id, None)
+        for dependent in self.dependents.pop(anchor_id, ()):
+            self.levels.pop(dependent, None)
+
+
+class TrackedList(list):
+    """Architype list field that flags its anchor as changed on mutation."""
+
+    __slots__ = ("_jac_owner_",)
+    # (anchor, field name) flagged on mutation
+    _jac_owner_: tuple[Anchor, str]
+
+    def __reduce__(self) -> tuple[type, tuple[list]]:
+        """Pickle as plain list."""
+        return (list, (list(self),))
+
+
+class TrackedDict(dict):
+    """Architype dict field that flags its anchor as changed on mutation."""
+
+    __slots__ = ("_jac_owner_",)
+    # (anchor, field name) flagged on mutation
+    _jac_owner_: tuple[Anchor, str]
+
+    def __reduce__(self) -> tuple[type, tuple[dict]]:
+        """Pickle as plain dict."""
+        return (dict, (dict(self),))
+
+
+def _mutator(method: Callable) -> Callable:
+    """Wrap container method to flag owner field as changed."""
+
+    def mutate(
+        self: TrackedList | TrackedDict, *args: object, **kwargs: object
+    ) -> object:
+        if owner := getattr(self, "_jac_owner_", None):
+            if not owner[0].is_populated():
+                # evicted since, reload it so the change gets saved
+                owner[0].populate()
+            owner[0].mark_dirty("architype", owner[1])
+        return method(self, *args, **kwargs)
+
+    return mutate
+
+
+for _name in (
+    "append",
+    "extend",
+    "insert",
+    "remove",
+    "pop",
+    "clear",
+    "sort",
+    "reverse",
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+):
+    setattr(TrackedList, _name, _mutator(getattr(list, _name)))
+
+for _name in (
+    "__setitem__",
+    "__delitem__",
+    "pop",
+    "popitem",
+    "clear",
+    "update",
+    "setdefault",
+    "__ior__",
+):
+    setattr(TrackedDict, _name, _mutator(getattr(dict, _name)))
+
+IMMUTABLE_TYPES: tuple[type, ...] = (
+    type(None),
+    bool,
+    int,
+    float,
+    complex,
+    str,
+    bytes,
+    Enum,
+    UUID,
+    date,
+    time,
+    timedelta,
+)
+
+
+def track_value(
+    value: object, owner: tuple[Anchor, str], wrap: bool = False
+) -> tuple[object, bool]:
+    """Wrap lists/dicts of an Architype field and check if changes are trackable.
+
+    Only fresh values (just loaded from storage) should be wrapped, as wrapping
+    copies the container. Anything else mutable can't flag its own changes.
+    Architypes held by value flag the owner field through their anchor.
+    """
+    if isinstance(
+        value, (NodeArchitype, EdgeArchitype, WalkerArchitype, *IMMUTABLE_TYPES)
+    ):
+        return value, True
+    if isinstance(value, Architype):
+        anchor = value.__jac__
+        if anchor.owner not in (None, owner):
+            # already held by another field
+            return value, False
+        anchor.owner = owner
+        trackable = True
+        for name, item in list(value.__dict__.items()):
+            if name != "__jac__":
+                tracked, ok = track_value(item, (anchor, name), wrap)
+                if tracked is not item:
+                    value.__dict__[name] = tracked
+                trackable = trackable and ok
+        return value, trackable
+    if isinstance(value, (tuple, frozenset)):
+        return value, all(track_value(item, owner)[1] for item in value)
+
+    if wrap and type(value) is list:
+        value = TrackedList(value)
+        value._jac_owner_ = owner
+    elif wrap and type(value) is dict:
+        value = TrackedDict(value)
+        value._jac_owner_ = owner
+    elif not (
+        isinstance(value, (TrackedList, TrackedDict))
+        and getattr(value, "_jac_owner_", None) == owner
+    ):
+        return value, False
+
+    trackable = True
+    if isinstance(value, TrackedList):
+        for idx, item in enumerate(value):
+            tracked, ok = track_value(item, owner, wrap)
+            if tracked is not item:
+                list.__setitem__(value, idx, tracked)
+            trackable = trackable and ok
+    elif isinstance(value, TrackedDict):
+        for key, item in list(value.items()):
+            tracked, ok = track_value(item, owner, wrap)
+            if tracked is not item:
+                dict.__setitem__(value, key, tracked)
+            trackable = trackable and ok
+
+    return value, trackable
+
+
 @dataclass
 class AnchorReport:
     """Report Handler."""
@@ -66,16 +268,208 @@ class AnchorReport:
     context: dict[str, Any]
 
 
-@dataclass(eq=False, repr=False, kw_only=True)
+# tie breaker keeping equal priority visits in visit order
+VISIT_ORDER = count()
+
+# walker currently running with `static has read_only: bool = True;`
+READ_ONLY_WALKER = ContextVar[Optional["WalkerArchitype"]](
+    "READ_ONLY_WALKER", default=None
+)
+
+# walkers mid-traversal, their frontiers stay alive on memory sweeps
+RUNNING_WALKERS: list[WalkerAnchor] = []
+
+
+def run_awaitable(awaitable: Awaitable[T]) -> T:
+    """Wait for awaitable from synchronous code.
+
+    Runs on a new event loop, or on a worker thread (with a copy of current
+    context) if this thread is already running one, as loops can't be nested.
+    Coroutines should rather be awaited where a loop is available.
+    """
+
+    async def wait() -> T:
+        return await awaitable
+
+    try:
+        get_running_loop()
+    except RuntimeError:
+        return run(wait())
+    context, coroutine = copy_context(), wait()
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(context.run, lambda: run(coroutine)).result()
+
+
+@dataclass(eq=False)
+class FieldIndex:
+    """Neighbors of a node sorted by an indexed field."""
+
+    # None if field values can't be ordered, lookups fall back to scans
+    keys: Optional[list]
+    # (position in edge order, neighbor) aligned with keys
+    nodes: list[tuple[int, NodeAnchor]]
+
+    def lookup(self, op: str, value: object) -> Optional[list[NodeAnchor]]:
+        """Get neighbors where `field <op> value`, in edge order."""
+        if (keys := self.keys) is None:
+            return None
+        try:
+            match op:
+                case "==":
+                    lo, hi = bisect_left(keys, value), bisect_right(keys, value)
+                case "<":
+                    lo, hi = 0, bisect_left(keys, value)
+                case "<=":
+                    lo, hi = 0, bisect_right(keys, value)
+                case ">":
+                    lo, hi = bisect_right(keys, value), len(keys)
+                case ">=":
+                    lo, hi = bisect_left(keys, value), len(keys)
+                case _:
+                    return None
+        except TypeError:
+            return None
+        return [node for _, node in sorted(self.nodes[lo:hi], key=itemgetter(0))]
+
+
+@dataclass(eq=False)
+class EdgePositions:
+    """Order keys of a node's edges, locating one for removal in O(log degree)."""
+
+    # the edges list keys were built for
+    edges: list[EdgeAnchor]
+    keys: dict[EdgeAnchor, int]
+    # key of every edge, ascending like edges
+    order: list[int]
+
+    @classmethod
+    def build(cls, edges: list[EdgeAnchor]) -> EdgePositions:
+        """Key edges by their current position."""
+        return cls(
+            edges,
+            {edge: key for key, edge in enumerate(edges)},
+            list(range(len(edges))),
+        )
+
+    def matches(self, edges: list[EdgeAnchor]) -> bool:
+        """Check if keys still cover every edge of edges."""
+        return self.edges is edges and len(self.order) == len(edges)
+
+    def find(self, edge: EdgeAnchor) -> Optional[int]:
+        """Get position of edge, None if not connected."""
+        if (key := self.keys.get(edge)) is None:
+            return None
+        idx = bisect_left(self.order, key)
+        if idx < len(self.edges) and self.edges[idx].id == edge.id:
+            return idx
+        # reordered in place, rekey and retry once
+        rebuilt = self.build(self.edges)
+        self.keys, self.order = rebuilt.keys, rebuilt.order
+        return self.keys.get(edge)
+
+    def append(self, edge: EdgeAnchor) -> None:
+        """Key edge just appended to edges."""
+        if len(self.order) + 1 == len(self.edges):
+            key = self.order[-1] + 1 if self.order else 0
+            self.keys[edge] = key
+            self.order.append(key)
+
+    def pop(self, idx: int) -> None:
+        """Remove edge at idx."""
+        edge = self.edges.pop(idx)
+        del self.order[idx]
+        self.keys.pop(edge, None)
+
+
+@cache
+def slot_members(cls: type) -> tuple:
+    """Get slot descriptors of class and its bases."""
+    return tuple(
+        c.__dict__[name]
+        for c in cls.__mro__
+        for name in c.__dict__.get("__slots__", ())
+        if name not in ("__dict__", "__weakref__")
+    )
+
+
+@dataclass(eq=False, repr=False, kw_only=True, slots=True, weakref_slot=True)
 class Anchor:
     """Object Anchor."""
 
     architype: Architype
     id: UUID = field(default_factory=uuid4)
     root: Optional[UUID] = None
-    access: Permission = field(default_factory=Permission)
+    access: Permission = field(default_factory=lambda: DEFAULT_PERMISSION)
     persistent: bool = False
-    hash: int = 0
+    # None until synced with storage, then changed attributes/architype fields
+    dirty: Optional[set[str]] = field(default=None, init=False, repr=False)
+    dirty_fields: Optional[set[str]] = field(default=None, init=False, repr=False)
+    # False for stubs that still need to be populated from memory
+    loaded: bool = field(default=True, init=False, repr=False)
+    # stubs populated with this anchor's state, unloaded along with it
+    sharers: Optional[dict[int, ReferenceType[Anchor]]] = field(
+        default=None, init=False, repr=False
+    )
+    # (anchor, field name) holding this architype by value, flagged on its changes
+    owner: Optional[tuple[Anchor, str]] = field(default=None, init=False, repr=False)
+
+    _jac_persisted_: ClassVar[frozenset[str]] = frozenset(
+        ("architype", "root", "access", "persistent")
+    )
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Flag persisted attributes as changed."""
+        if name in self._jac_persisted_:
+            self.mark_dirty(name)
+            if name in ("root", "access") and self.loaded:
+                # cached access levels were decided with the replaced value
+                self.invalidate_access()
+        object.__setattr__(self, name, value)
+
+    def mark_dirty(self, name: str, field: Optional[str] = None) -> None:
+        """Flag attribute (and architype field) as changed since last sync.
+
+        Called before the change is applied, so read-only walkers can refuse it.
+        """
+        if not self.loaded:
+            return
+        self.check_write()
+        if (dirty := self.dirty) is not None:
+            dirty.add(name)
+            if field and self.dirty_fields is not None:
+                self.dirty_fields.add(field)
+        if (owner := self.owner) is not None:
+            if not owner[0].is_populated():
+                owner[0].populate()
+            owner[0].mark_dirty("architype", owner[1])
+
+    def check_write(self) -> None:
+        """Refuse changes to persisted anchors while a read-only walker runs."""
+        if self.persistent and (walker := READ_ONLY_WALKER.get()):
+            raise PermissionError(
+                f"{walker.__class__.__name__} is read-only and can't modify "
+                f"{self.architype.__class__.__name__} [{self.id}]!"
+            )
+
+    def track_changes(self, wrap: bool = False) -> None:
+        """Mark Anchor as synced with storage and track changes from here."""
+        if (dirty := self.dirty) is None or (dirty_fields := self.dirty_fields) is None:
+            self.dirty = dirty = set()
+            self.dirty_fields = dirty_fields = set()
+        else:
+            dirty.clear()
+            dirty_fields.clear()
+
+        architype = self.architype
+        for name, value in list(architype.__dict__.items()):
+            if name != "__jac__":
+                tracked, trackable = track_value(value, (self, name), wrap)
+                if tracked is not value:
+                    architype.__dict__[name] = tracked
+                if not trackable and self.loaded:
+                    # values that can't be watched are always saved
+                    dirty.add("architype")
+                    dirty_fields.add(name)
 
     ##########################################################################
     #                             ACCESS CONTROL: TODO: Make Base Type       #
@@ -86,31 +480,54 @@ class Anchor:
     ) -> None:
         """Allow all access from target root graph to current Architype."""
         level = AccessLevel.cast(level)
-        access = self.access.roots
+        access = self.own_access().roots
 
         _root_id = str(root_id)
         if level != access.anchors.get(_root_id, AccessLevel.NO_ACCESS):
+            self.mark_dirty("access")
             access.anchors[_root_id] = level
+            self.invalidate_access()
 
     def disallow_root(
         self, root_id: UUID, level: AccessLevel | int | str = AccessLevel.READ
     ) -> None:
         """Disallow all access from target root graph to current Architype."""
         level = AccessLevel.cast(level)
-        access = self.access.roots
+        access = self.own_access().roots
 
-        access.anchors.pop(str(root_id), None)
+        if str(root_id) in access.anchors:
+            self.mark_dirty("access")
+            access.anchors.pop(str(root_id))
+            self.invalidate_access()
 
     def unrestrict(self, level: AccessLevel | int | str = AccessLevel.READ) -> None:
         """Allow everyone to access current Architype."""
         level = AccessLevel.cast(level)
         if level != self.access.all:
-            self.access.all = level
+            self.mark_dirty("access")
+            self.own_access().all = level
+            self.invalidate_access()
 
     def restrict(self) -> None:
         """Disallow others to access current Architype."""
         if self.access.all > AccessLevel.NO_ACCESS:
-            self.access.all = AccessLevel.NO_ACCESS
+            self.mark_dirty("access")
+            self.own_access().all = AccessLevel.NO_ACCESS
+            self.invalidate_access()
+
+    def own_access(self) -> Permission:
+        """Get Permission of current Architype, detached from the shared default."""
+        if self.access is DEFAULT_PERMISSION:
+            object.__setattr__(self, "access", Permission())
+        return self.access
+
+    def invalidate_access(self) -> None:
+        """Drop cached access levels affected by current Architype."""
+        from jaclang.runtimelib.context import EXECUTION_CONTEXT
+
+        # nothing is cached without a context
+        if ctx := EXECUTION_CONTEXT.get(None):
+            ctx.access_cache.invalidate(self.id)
 
     def has_read_access(self, to: Anchor) -> bool:
         """Read Access Validation."""
@@ -153,6 +570,9 @@ class Anchor:
         if jroot == jctx.system_root or jroot.id == to.root or jroot == to:
             return AccessLevel.WRITE
 
+        if (access_level := jctx.access_cache.get(jroot.id, to.id)) is not None:
+            return access_level
+
         access_level = AccessLevel.NO_ACCESS
 
         # if target anchor have set access.all
@@ -175,7 +595,7 @@ class Anchor:
         if level > AccessLevel.NO_ACCESS and access_level == AccessLevel.NO_ACCESS:
             access_level = level
 
-        return access_level
+        return jctx.access_cache.set(jroot.id, to, access_level)
 
     # ---------------------------------------------------------------------- #
 
@@ -185,10 +605,13 @@ class Anchor:
 
         jctx = Jac.get_context()
 
-        self.persistent = True
-        self.root = jctx.root.id
+        if not self.persistent:
+            self.persistent = True
+        if self.root != (root := jctx.root.id):
+            self.root = root
 
         jctx.mem.set(self.id, self)
+        jctx.mem.count_save()
 
     def destroy(self) -> None:
         """Destroy Anchor."""
@@ -197,17 +620,19 @@ class Anchor:
         jctx = Jac.get_context()
 
         if jctx.root.has_write_access(self):
+            self.check_write()
             jctx.mem.remove(self.id)
 
     def is_populated(self) -> bool:
         """Check if state."""
-        return "architype" in self.__dict__
+        return self.loaded
 
     def make_stub(self: TANCH) -> TANCH:
         """Return unsynced copy of anchor."""
         if self.is_populated():
             unloaded = object.__new__(self.__class__)
             unloaded.id = self.id
+            unloaded.loaded = False
             return unloaded
         return self
 
@@ -218,10 +643,46 @@ class Anchor:
         jsrc = Jac.get_context().mem
 
         if anchor := jsrc.find_by_id(self.id):
-            self.__dict__.update(anchor.__dict__)
+            self.populate_from(anchor)
+
+    def populate_from(self, anchor: Anchor) -> None:
+        """Share the state of a populated anchor with the same id."""
+        if not anchor.is_populated():
+            # evicted while loading a batch bigger than the anchor cache
+            anchor.populate()
+        for member in slot_members(cast(type, anchor.__class__)):
+            with suppress(AttributeError):
+                member.__set__(self, member.__get__(anchor))
+        if (state := getattr(anchor, "__dict__", None)) is not None:
+            self.__dict__.update(state)
+        self.loaded = True
+
+        if self is not anchor:
+            if (sharers := anchor.sharers) is None:
+                sharers = anchor.sharers = self.sharers = {}
+            key = id(self)
+            sharers[key] = ref(self, lambda _: sharers.pop(key, None))
+
+    def unload(self) -> None:
+        """Drop state of anchor and its sharers, turning them back into stubs."""
+        sharers = [sharer() for sharer in (self.sharers or {}).values()]
+        for anchor in (self, *sharers):
+            if anchor is None:
+                continue
+            for member in slot_members(cast(type, anchor.__class__)):
+                if member.__name__ not in ("id", "loaded"):
+                    with suppress(AttributeError):
+                        member.__delete__(anchor)
+            with suppress(AttributeError):
+                object.__getattribute__(anchor, "__dict__").clear()
+            anchor.loaded = False
 
     def __getattr__(self, name: str) -> object:
         """Trigger load if detects unloaded state."""
+        if name == "loaded":
+            # stubs created without the flag set
+            return False
+
         if not self.is_populated():
             self.populate()
 
@@ -255,19 +716,36 @@ class Anchor:
 
     def __setstate__(self, state: dict[str, Any]) -> None:
         """Deserialize Anchor."""
-        self.__dict__.update(state)
-
-        if self.is_populated() and self.architype:
+        if "architype" not in state:
+            self.id = state["id"]
+            self.loaded = False
+            return
+
+        if state.get("access") == DEFAULT_PERMISSION:
+            state["access"] = DEFAULT_PERMISSION
+
+        for f in fields(self):
+            if f.name in state:
+                value = state[f.name]
+            elif f.default is not MISSING:
+                value = f.default
+            elif f.default_factory is not MISSING:
+                value = f.default_factory()
+            else:
+                continue
+            object.__setattr__(self, f.name, value)
+
+        if self.architype:
             self.architype.__jac__ = self
-            self.hash = hash(dumps(self))
+            self.track_changes(wrap=True)
 
     def __repr__(self) -> str:
         """Override representation."""
         if self.is_populated():
             attrs = ""
             for f in fields(self):
-                if f.name in self.__dict__:
-                    attrs += f"{f.name}={self.__dict__[f.name]}, "
+                if f.repr:
+                    attrs += f"{f.name}={getattr(self, f.name)}, "
             attrs = attrs[:-2]
         else:
             attrs = f"id={self.id}"
@@ -297,29 +775,184 @@ class Anchor:
         return False
 
 
-@dataclass(eq=False, repr=False, kw_only=True)
+@dataclass(eq=False, repr=False, kw_only=True, slots=True)
 class NodeAnchor(Anchor):
     """Node Anchor."""
 
     architype: NodeArchitype
     edges: list[EdgeAnchor]
+    edge_index: Optional[
+        dict[EdgeDir, dict[type[EdgeArchitype], dict[EdgeAnchor, None]]]
+    ] = field(default=None, init=False, repr=False)
+    edge_positions: Optional[EdgePositions] = field(
+        default=None, init=False, repr=False
+    )
+    # (dir, edge type, node type, field) -> neighbors sorted by field
+    field_indexes: Optional[dict[tuple, FieldIndex]] = field(
+        default=None, init=False, repr=False
+    )
+    # neighbors with a FieldIndex over this node, dropped when its fields change
+    index_owners: Optional[dict[int, ReferenceType[NodeAnchor]]] = field(
+        default=None, init=False, repr=False
+    )
+
+    _jac_persisted_ = Anchor._jac_persisted_ | {"edges"}
+
+    def get_edge_index(
+        self,
+    ) -> dict[EdgeDir, dict[type[EdgeArchitype], dict[EdgeAnchor, None]]]:
+        """Get edges bucketed by direction and edge architype class."""
+        if (anchor := self.architype.__jac__) is not self:
+            # populated stubs share edges with the loaded anchor, index that one
+            return anchor.get_edge_index()
+
+        if (index := self.edge_index) is None:
+            index = self.edge_index = {EdgeDir.OUT: {}, EdgeDir.IN: {}}
+            for edge in self.edges:
+                self.index_edge(edge)
+        return index
+
+    def index_edge(self, edge: EdgeAnchor) -> None:
+        """Add edge to edge index if already built."""
+        if (anchor := self.architype.__jac__) is not self:
+            return anchor.index_edge(edge)
+
+        self.field_indexes = None
+        if (index := self.edge_index) is not None:
+            cls = edge.architype.__class__
+            if self == edge.source:
+                index[EdgeDir.OUT].setdefault(cls, {})[edge] = None
+            if self == edge.target:
+                index[EdgeDir.IN].setdefault(cls, {})[edge] = None
+
+    def unindex_edge(self, edge: EdgeAnchor) -> None:
+        """Remove edge from edge index if already built."""
+        if (anchor := self.architype.__jac__) is not self:
+            return anchor.unindex_edge(edge)
+
+        self.field_indexes = None
+        if (index := self.edge_index) is not None:
+            for buckets in index.values():
+                for bucket in buckets.values():
+                    bucket.pop(edge, None)
+
+    def get_field_index(
+        self, dir: EdgeDir, edge_type: Optional[type], cls: type, name: str
+    ) -> FieldIndex:
+        """Get neighbors of type cls sorted by field, built on first use."""
+        if (anchor := self.architype.__jac__) is not self:
+            return anchor.get_field_index(dir, edge_type, cls, name)
+
+        if (indexes := self.field_indexes) is None:
+            indexes = self.field_indexes = {}
+        key = (dir, edge_type, cls, name)
+        if index := indexes.get(key):
+            return index
+
+        self.prefetch()
+        positions: dict[NodeAnchor, int] = {}
+        for edge in self.filter_edges(dir, None, edge_type):
+            for node, linked in (
+                (edge.target, dir != EdgeDir.IN and self == edge.source),
+                (edge.source, dir != EdgeDir.OUT and self == edge.target),
+            ):
+                if linked and node not in positions and isinstance(node.architype, cls):
+                    positions[node] = len(positions)
+
+        rows = [
+            (getattr(node.architype, name), pos, node)
+            for node, pos in positions.items()
+        ]
+        try:
+            rows.sort(key=itemgetter(0))
+            keys: Optional[list] = [row[0] for row in rows]
+        except TypeError:
+            keys = None
+        index = indexes[key] = FieldIndex(
+            keys=keys, nodes=[(pos, node) for _, pos, node in rows]
+        )
+        for node in positions:
+            node.architype.__jac__.add_index_owner(self)
+        return index
+
+    def add_index_owner(self, owner: NodeAnchor) -> None:
+        """Register a neighbor whose field indexes cover this node."""
+        if (owners := self.index_owners) is None:
+            owners = self.index_owners = {}
+        key = id(owner)
+        owners[key] = ref(owner, lambda _: owners.pop(key, None))
+
+    def drop_field_indexes(self, name: Optional[str] = None) -> None:
+        """Drop neighbors' field indexes over this node, on field name or all."""
+        # unloaded nodes already dropped the indexes over them
+        owners = getattr(self, "index_owners", None) or {}
+        for owner_ref in list(owners.values()):
+            if (
+                (owner := owner_ref())
+                and owner.is_populated()
+                and (indexes := owner.field_indexes)
+            ):
+                for key in [key for key in indexes if name in (None, key[3])]:
+                    del indexes[key]
+
+    def unload(self) -> None:
+        """Drop state, with neighbors' field indexes that can't track it anymore."""
+        self.drop_field_indexes()
+        Anchor.unload(self)
+
+    def filter_edges(
+        self,
+        dir: EdgeDir,
+        filter_func: Optional[Callable[[list[EdgeArchitype]], list[EdgeArchitype]]],
+        edge_type: Optional[type] = None,
+    ) -> Iterable[EdgeAnchor]:
+        """Get edges matching edge type and filter, streamed from current edges."""
+        edges: Iterable[EdgeAnchor]
+        if edge_type is None:
+            edges = self.edges
+        else:
+            matched: dict[EdgeAnchor, None] = {}
+            index = self.get_edge_index()
+            for _dir in (EdgeDir.OUT, EdgeDir.IN) if dir == EdgeDir.ANY else (dir,):
+                for cls, bucket in index[_dir].items():
+                    if issubclass(cls, edge_type):
+                        matched.update(bucket)
+            edges = matched
+
+        if filter_func:
+            return (
+                arch.__jac__
+                for arch in filter_func(
+                    (edge.architype for edge in edges)  # type: ignore[arg-type]
+                )
+            )
+        return edges
 
     def get_edges(
         self,
         dir: EdgeDir,
         filter_func: Optional[Callable[[list[EdgeArchitype]], list[EdgeArchitype]]],
         target_obj: Optional[list[NodeArchitype]],
+        edge_type: Optional[type] = None,
     ) -> list[EdgeArchitype]:
         """Get edges connected to this node."""
+        return list(self.iter_edges(dir, filter_func, target_obj, edge_type))
+
+    def iter_edges(
+        self,
+        dir: EdgeDir,
+        filter_func: Optional[Callable[[list[EdgeArchitype]], list[EdgeArchitype]]],
+        target_obj: Optional[list[NodeArchitype]],
+        edge_type: Optional[type] = None,
+    ) -> Generator[EdgeArchitype, None, None]:
+        """Stream edges connected to this node."""
         from jaclang.plugin.feature import JacFeature as Jac
 
         root = Jac.get_root().__jac__
-        ret_edges: list[EdgeArchitype] = []
-        for anchor in self.edges:
+        for anchor in self.filter_edges(dir, filter_func, edge_type):
             if (
                 (source := anchor.source)
                 and (target := anchor.target)
-                and (not filter_func or filter_func([anchor.architype]))
                 and source.architype
                 and target.architype
             ):
@@ -329,32 +962,63 @@ class NodeAnchor(Anchor):
                     and (not target_obj or target.architype in target_obj)
                     and root.has_read_access(target)
                 ):
-                    ret_edges.append(anchor.architype)
+                    yield anchor.architype
                 if (
                     dir in [EdgeDir.IN, EdgeDir.ANY]
                     and self == target
                     and (not target_obj or source.architype in target_obj)
                     and root.has_read_access(source)
                 ):
-                    ret_edges.append(anchor.architype)
-        return ret_edges
+                    yield anchor.architype
+
+    def prefetch(self, depth: Optional[int] = None) -> None:
+        """Batch load edges and neighbor nodes up to depth hops away."""
+        from jaclang.plugin.feature import JacFeature as Jac
+
+        nodes: list[NodeAnchor] = [self]
+        for _ in range(settings.prefetch_depth if depth is None else depth):
+            edges: list[EdgeAnchor] = [
+                edge for node in nodes if node.is_populated() for edge in node.edges
+            ]
+            if edge_stubs := [edge for edge in edges if not edge.is_populated()]:
+                Jac.get_context().mem.prefetch(edge_stubs)
+            nodes = [
+                node
+                for edge in edges
+                if edge.is_populated()
+                for node in (edge.source, edge.target)
+            ]
+            if node_stubs := [node for node in nodes if not node.is_populated()]:
+                Jac.get_context().mem.prefetch(node_stubs)
+            elif not nodes:
+                break
 
     def edges_to_nodes(
         self,
         dir: EdgeDir,
         filter_func: Optional[Callable[[list[EdgeArchitype]], list[EdgeArchitype]]],
         target_obj: Optional[list[NodeArchitype]],
+        edge_type: Optional[type] = None,
     ) -> list[NodeArchitype]:
         """Get set of nodes connected to this node."""
+        return list(self.iter_nodes(dir, filter_func, target_obj, edge_type))
+
+    def iter_nodes(
+        self,
+        dir: EdgeDir,
+        filter_func: Optional[Callable[[list[EdgeArchitype]], list[EdgeArchitype]]],
+        target_obj: Optional[list[NodeArchitype]],
+        edge_type: Optional[type] = None,
+    ) -> Generator[NodeArchitype, None, None]:
+        """Stream nodes connected to this node."""
         from jaclang.plugin.feature import JacFeature as Jac
 
         root = Jac.get_root().__jac__
-        ret_edges: list[NodeArchitype] = []
-        for anchor in self.edges:
+        self.prefetch()
+        for anchor in self.filter_edges(dir, filter_func, edge_type):
             if (
                 (source := anchor.source)
                 and (target := anchor.target)
-                and (not filter_func or filter_func([anchor.architype]))
                 and source.architype
                 and target.architype
             ):
@@ -364,45 +1028,43 @@ class NodeAnchor(Anchor):
                     and (not target_obj or target.architype in target_obj)
                     and root.has_read_access(target)
                 ):
-                    ret_edges.append(target.architype)
+                    yield target.architype
                 if (
                     dir in [EdgeDir.IN, EdgeDir.ANY]
                     and self == target
                     and (not target_obj or source.architype in target_obj)
                     and root.has_read_access(source)
                 ):
-                    ret_edges.append(source.architype)
-        return ret_edges
+                    yield source.architype
+
+    def add_edge(self, edge: EdgeAnchor) -> None:
+        """Add edge reference."""
+        self.mark_dirty("edges")
+        self.edges.append(edge)
+        if (positions := self.edge_positions) is not None:
+            positions.append(edge)
+        self.index_edge(edge)
 
     def remove_edge(self, edge: EdgeAnchor) -> None:
         """Remove reference without checking sync status."""
-        for idx, ed in enumerate(self.edges):
-            if ed.id == edge.id:
-                self.edges.pop(idx)
-                break
+        self.mark_dirty("edges")
+        positions = self.edge_positions
+        if positions is None or not positions.matches(self.edges):
+            positions = self.edge_positions = EdgePositions.build(self.edges)
+        if (idx := positions.find(edge)) is not None:
+            positions.pop(idx)
+        self.unindex_edge(edge)
 
     def gen_dot(self, dot_file: Optional[str] = None) -> str:
         """Generate Dot file for visualizing nodes and edges."""
-        visited_nodes: set[NodeAnchor] = set()
-        connections: set[tuple[NodeArchitype, NodeArchitype, str]] = set()
-        unique_node_id_dict = {}
-
-        collect_node_connections(self, visited_nodes, connections)
-        dot_content = 'digraph {\nnode [style="filled", shape="ellipse", fillcolor="invis", fontcolor="black"];\n'
-        for idx, i in enumerate([nodes_.architype for nodes_ in visited_nodes]):
-            unique_node_id_dict[i] = (i.__class__.__name__, str(idx))
-            dot_content += f'{idx} [label="{i}"];\n'
-        dot_content += 'edge [color="gray", style="solid"];\n'
-
-        for pair in list(set(connections)):
-            dot_content += (
-                f"{unique_node_id_dict[pair[0]][1]} -> {unique_node_id_dict[pair[1]][1]}"
-                f' [label="{pair[2]}"];\n'
-            )
+        from jaclang.runtimelib.graphwriter import walk_graph, write_dot
+
+        out = StringIO()
+        write_dot(out, walk_graph(self, traverse=True), fill=False)
         if dot_file:
             with open(dot_file, "w") as f:
-                f.write(dot_content + "}")
-        return dot_content + "}"
+                f.write(out.getvalue())
+        return out.getvalue()
 
     def spawn_call(self, walk: WalkerAnchor) -> WalkerArchitype:
         """Invoke data spatial call."""
@@ -415,14 +1077,88 @@ class NodeAnchor(Anchor):
         jctx = Jac.get_context()
 
         if jctx.root.has_write_access(self):
-            for edge in self.edges:
+            self.check_write()
+            # destroying edges detaches them, iterate over a snapshot
+            for edge in list(self.edges):
                 edge.destroy()
 
             jctx.mem.remove(self.id)
 
+    def collect_subgraph(
+        self, edge_filter: Optional[Callable[[EdgeArchitype], bool]] = None
+    ) -> tuple[list[NodeAnchor], list[EdgeAnchor]]:
+        """Collect writable nodes reachable through outgoing edges and their edges.
+
+        Roots and nodes without write access are never collected nor traversed.
+        """
+        from jaclang.plugin.feature import JacFeature as Jac
+
+        root = Jac.get_context().root
+        if isinstance(self.architype, Root) or not root.has_write_access(self):
+            return [], []
+
+        nodes: dict[NodeAnchor, None] = {self: None}
+        edges: dict[EdgeAnchor, None] = {}
+        stack = [self]
+        while stack:
+            current = stack.pop()
+            for edge in current.edges:
+                edges[edge] = None
+                if edge.source == current:
+                    other = edge.target
+                elif edge.is_undirected:
+                    other = edge.source
+                else:
+                    continue
+                if (
+                    other not in nodes
+                    and not isinstance(other.architype, Root)
+                    and (not edge_filter or edge_filter(edge.architype))
+                    and root.has_write_access(other)
+                ):
+                    nodes[other] = None
+                    stack.append(other)
+        return list(nodes), list(edges)
+
+    def destroy_subgraph(
+        self, edge_filter: Optional[Callable[[EdgeArchitype], bool]] = None
+    ) -> None:
+        """Destroy node and everything reachable from it in one batch.
+
+        Edges from surviving nodes into the subgraph are dropped with a single
+        pass over each survivor's edges, then all anchors leave memory together.
+        """
+        from jaclang.plugin.feature import JacFeature as Jac
+
+        nodes, edges = self.collect_subgraph(edge_filter)
+        if not nodes:
+            return
+
+        doomed = {anchor.id for anchor in nodes}
+        survivors: dict[NodeAnchor, None] = {}
+        for edge in edges:
+            for node in (edge.source, edge.target):
+                if node.id not in doomed:
+                    survivors[node.architype.__jac__] = None
+
+        for node in (*nodes, *survivors):
+            node.check_write()
+
+        detached = {edge.id for edge in edges}
+        for survivor in survivors:
+            survivor.mark_dirty("edges")
+            # in place, stubs of the survivor share the same list
+            survivor.edges[:] = [
+                edge for edge in survivor.edges if edge.id not in detached
+            ]
+            survivor.edge_index = survivor.field_indexes = None
+            survivor.edge_positions = None
+
+        Jac.get_context().mem.remove([*doomed, *detached])
+
     def __getstate__(self) -> dict[str, object]:
         """Serialize Node Anchor."""
-        state = super().__getstate__()
+        state = Anchor.__getstate__(self)
 
         if self.is_populated():
             state["edges"] = [edge.make_stub() for edge in self.edges]
@@ -430,7 +1166,7 @@ class NodeAnchor(Anchor):
         return state
 
 
-@dataclass(eq=False, repr=False, kw_only=True)
+@dataclass(eq=False, repr=False, kw_only=True, slots=True)
 class EdgeAnchor(Anchor):
     """Edge Anchor."""
 
@@ -439,10 +1175,12 @@ class EdgeAnchor(Anchor):
     target: NodeAnchor
     is_undirected: bool
 
+    _jac_persisted_ = Anchor._jac_persisted_ | {"source", "target", "is_undirected"}
+
     def __post_init__(self) -> None:
         """Populate edge to source and target."""
-        self.source.edges.append(self)
-        self.target.edges.append(self)
+        self.source.add_edge(self)
+        self.target.add_edge(self)
 
     def detach(self) -> None:
         """Detach edge from nodes."""
@@ -460,12 +1198,13 @@ class EdgeAnchor(Anchor):
         jctx = Jac.get_context()
 
         if jctx.root.has_write_access(self):
+            self.check_write()
             self.detach()
             jctx.mem.remove(self.id)
 
     def __getstate__(self) -> dict[str, object]:
         """Serialize Node Anchor."""
-        state = super().__getstate__()
+        state = Anchor.__getstate__(self)
 
         if self.is_populated():
             state.update(
@@ -479,42 +1218,68 @@ class EdgeAnchor(Anchor):
         return state
 
 
-@dataclass(eq=False, repr=False, kw_only=True)
+@dataclass(eq=False, repr=False, kw_only=True, slots=True)
 class WalkerAnchor(Anchor):
     """Walker Anchor."""
 
     architype: WalkerArchitype
     path: list[Anchor] = field(default_factory=list)
-    next: list[Anchor] = field(default_factory=list)
-    ignores: list[Anchor] = field(default_factory=list)
+    next: deque[Anchor] = field(default_factory=deque)
+    # (priority, visit order, node) of `visit :priority: node;`, popped first
+    heap: list[tuple[Any, int, Anchor]] = field(default_factory=list)
+    ignores: set[Anchor] = field(default_factory=set)
+    visited: set[Anchor] = field(default_factory=set)
     disengaged: bool = False
 
-    def visit_node(self, anchors: Iterable[NodeAnchor | EdgeAnchor]) -> bool:
-        """Walker visits node."""
-        before_len = len(self.next)
+    def visit_node(
+        self, anchors: Iterable[NodeAnchor | EdgeAnchor], priority: object = None
+    ) -> bool:
+        """Walker visits node, by lowest priority first if one is given."""
+        before_len = len(self.next) + len(self.heap)
+        visit_once = self.architype.visit_once
         for anchor in anchors:
-            if anchor not in self.ignores:
-                if isinstance(anchor, NodeAnchor):
-                    self.next.append(anchor)
-                elif isinstance(anchor, EdgeAnchor):
-                    if target := anchor.target:
-                        self.next.append(target)
-                    else:
-                        raise ValueError("Edge has no target.")
-        return len(self.next) > before_len
+            if isinstance(anchor, EdgeAnchor):
+                if not (node := anchor.target):
+                    raise ValueError("Edge has no target.")
+            elif isinstance(anchor, NodeAnchor):
+                node = anchor
+            else:
+                continue
+
+            if node not in self.ignores:
+                if visit_once:
+                    if node in self.visited:
+                        continue
+                    if priority is None:
+                        self.visited.add(node)
+                if priority is None:
+                    self.next.append(node)
+                else:
+                    # a node may be queued again with a better priority,
+                    # visit_once then skips the stale entries when popped
+                    heappush(self.heap, (priority, next(VISIT_ORDER), node))
+        return len(self.next) + len(self.heap) > before_len
+
+    def pop_next(self) -> Anchor | None:
+        """Pop the lowest priority visit, then plain visits in order."""
+        while self.heap:
+            node = heappop(self.heap)[2]
+            if not self.architype.visit_once or node not in self.visited:
+                self.visited.add(node)
+                return node
+        return self.next.popleft() if self.next else None
 
     def ignore_node(self, anchors: Iterable[NodeAnchor | EdgeAnchor]) -> bool:
         """Walker ignores node."""
         before_len = len(self.ignores)
         for anchor in anchors:
-            if anchor not in self.ignores:
-                if isinstance(anchor, NodeAnchor):
-                    self.ignores.append(anchor)
-                elif isinstance(anchor, EdgeAnchor):
-                    if target := anchor.target:
-                        self.ignores.append(target)
-                    else:
-                        raise ValueError("Edge has no target.")
+            if isinstance(anchor, NodeAnchor):
+                self.ignores.add(anchor)
+            elif isinstance(anchor, EdgeAnchor):
+                if target := anchor.target:
+                    self.ignores.add(target)
+                else:
+                    raise ValueError("Edge has no target.")
         return len(self.ignores) > before_len
 
     def disengage_now(self) -> None:
@@ -523,46 +1288,135 @@ class WalkerAnchor(Anchor):
 
     def spawn_call(self, node: Anchor) -> WalkerArchitype:
         """Invoke data spatial call."""
-        if walker := self.architype:
-            self.path = []
-            self.next = [node]
-            while len(self.next):
-                if current_node := self.next.pop(0).architype:
-                    for i in current_node._jac_entry_funcs_:
-                        if not i.trigger or isinstance(walker, i.trigger):
-                            if i.func:
-                                i.func(current_node, walker)
-                            else:
-                                raise ValueError(f"No function {i.name} to call.")
+        for result in self.traverse(node):
+            if isawaitable(result):
+                run_awaitable(result)
+        return self.architype
+
+    async def async_spawn_call(self, node: Anchor) -> WalkerArchitype:
+        """Invoke data spatial call, awaiting async abilities."""
+        for result in self.traverse(node):
+            if isawaitable(result):
+                await result
+        return self.architype
+
+    def traverse(self, node: Anchor) -> Generator[object, None, None]:
+        """Walk from node, yielding the result of each ability call."""
+        self.path = []
+        self.next = deque([node])
+        self.heap = []
+        self.visited = {node}
+        yield from self.walk()
+
+    def walk(self) -> Generator[object, None, None]:
+        """Visit the frontier until it runs out, yielding ability results."""
+        from jaclang.runtimelib.profiler import Profiler
+
+        if not (walker := self.architype):
+            raise Exception(f"Invalid Reference {self.id}")
+
+        every, seconds = walker.checkpoint_steps, walker.checkpoint_seconds
+        checkpoints = bool(every or seconds) and not walker.read_only
+        steps, last = 0, monotonic()
+        # writes to persisted anchors raise while a read-only walker runs
+        token = READ_ONLY_WALKER.set(walker) if walker.read_only else None
+        RUNNING_WALKERS.append(self)
+        try:
+            profiler = Profiler.current()
+            while anchor := self.pop_next():
+                if current_node := anchor.architype:
+                    if isinstance(current := current_node.__jac__, NodeAnchor):
+                        current.prefetch()
+                    table = DSTable.get(walker.__class__, current_node.__class__)
+                    if profiler:
+                        profiler.node_visited(current_node)
+                        table = profiler.instrument(table)
+                    for i in table.node_entry:
+                        if i.func:
+                            yield i.func(current_node, walker)
+                        else:
+                            raise ValueError(f"No function {i.name} to call.")
                         if self.disengaged:
-                            return walker
-                    for i in walker._jac_entry_funcs_:
-                        if not i.trigger or isinstance(current_node, i.trigger):
-                            if i.func:
-                                i.func(walker, current_node)
-                            else:
-                                raise ValueError(f"No function {i.name} to call.")
+                            return
+                    for i in table.walker_entry:
+                        if i.func:
+                            yield i.func(walker, current_node)
+                        else:
+                            raise ValueError(f"No function {i.name} to call.")
                         if self.disengaged:
-                            return walker
-                    for i in walker._jac_exit_funcs_:
-                        if not i.trigger or isinstance(current_node, i.trigger):
-                            if i.func:
-                                i.func(walker, current_node)
-                            else:
-                                raise ValueError(f"No function {i.name} to call.")
+                            return
+                    for i in table.walker_exit:
+                        if i.func:
+                            yield i.func(walker, current_node)
+                        else:
+                            raise ValueError(f"No function {i.name} to call.")
                         if self.disengaged:
-                            return walker
-                    for i in current_node._jac_exit_funcs_:
-                        if not i.trigger or isinstance(walker, i.trigger):
-                            if i.func:
-                                i.func(current_node, walker)
-                            else:
-                                raise ValueError(f"No function {i.name} to call.")
+                            return
+                    for i in table.node_exit:
+                        if i.func:
+                            yield i.func(current_node, walker)
+                        else:
+                            raise ValueError(f"No function {i.name} to call.")
                         if self.disengaged:
-                            return walker
-            self.ignores = []
-            return walker
-        raise Exception(f"Invalid Reference {self.id}")
+                            return
+                if checkpoints:
+                    steps += 1
+                    if (every and not steps % every) or (
+                        seconds and monotonic() - last >= seconds
+                    ):
+                        self.checkpoint()
+                        last = monotonic()
+        except BaseException:
+            # keep the last checkpoint to resume from
+            checkpoints = False
+            raise
+        finally:
+            RUNNING_WALKERS.remove(self)
+            if token is not None:
+                READ_ONLY_WALKER.reset(token)
+            self.ignores = set()
+            self.visited = set()
+            if self.disengaged:
+                self.next, self.heap = deque(), []
+            if checkpoints and self.persistent:
+                # finished, drop the checkpoint as there's nothing left to resume
+                self.destroy()
+
+    def checkpoint(self) -> None:
+        """Save walker, its frontier and every pending change to the session."""
+        from jaclang.plugin.feature import JacFeature as Jac
+
+        if (mem := Jac.get_context().mem).session is None:
+            return
+        self.save()
+        if (dirty := self.dirty) is not None:
+            dirty.add("architype")
+        mem.sync()
+
+    def resume_call(self) -> WalkerArchitype:
+        """Continue a walk from its last checkpoint."""
+        for result in self.walk():
+            if isawaitable(result):
+                run_awaitable(result)
+        return self.architype
+
+    def frontier(self) -> dict[str, object]:
+        """Get pending visits, ignored and visited nodes as stubs."""
+        return {
+            "next": deque(anchor.make_stub() for anchor in self.next),
+            "heap": [(key, order, node.make_stub()) for key, order, node in self.heap],
+            "ignores": {anchor.make_stub() for anchor in self.ignores},
+            "visited": {anchor.make_stub() for anchor in self.visited},
+        }
+
+    def __getstate__(self) -> dict[str, object]:
+        """Serialize Walker Anchor with its frontier."""
+        state = Anchor.__getstate__(self)
+
+        if self.is_populated():
+            state.update(self.frontier())
+
+        return state
 
 
 class Architype:
@@ -570,11 +1424,29 @@ class Architype:
 
     _jac_entry_funcs_: ClassVar[list[DSFunc]]
     _jac_exit_funcs_: ClassVar[list[DSFunc]]
+    # (DSTable.version, node class -> DSTable), set per walker class by DSTable.get
+    _jac_ds_tables_: ClassVar[tuple[int, dict[type, DSTable]]]
+    # fields neighbor lookups can answer from a FieldIndex (see `indexed`)
+    _jac_indexes_: ClassVar[frozenset[str]] = frozenset()
+    # fields kept in NumPy columns instead of __dict__ (see `columnar`)
+    _jac_columns_: ClassVar[frozenset[str]] = frozenset()
 
     def __init__(self) -> None:
         """Create default architype."""
         self.__jac__ = Anchor(architype=self)
 
+    def __setattr__(self, name: str, value: object) -> None:
+        """Flag field as changed on its anchor."""
+        anchor = self.__dict__.get("__jac__") if name != "__jac__" else None
+        if anchor:
+            if not anchor.is_populated():
+                # evicted since, reload it so the change gets saved
+                anchor.populate()
+            anchor.mark_dirty("architype", name)
+        super().__setattr__(name, value)
+        if anchor and name in self._jac_indexes_ and isinstance(anchor, NodeAnchor):
+            anchor.drop_field_indexes(name)
+
     def __repr__(self) -> str:
         """Override repr for architype."""
         return f"{self.__class__.__name__}"
@@ -612,6 +1484,17 @@ class WalkerArchitype(Architype):
 
     __jac__: WalkerAnchor
 
+    # Enter each node at most once per spawn (`static has visit_once = True;`)
+    visit_once: ClassVar[bool] = False
+    # Refuse writes to persisted anchors, nothing to commit after the walk
+    # (`static has read_only: bool = True;`)
+    read_only: ClassVar[bool] = False
+    # Save the walk to the session every n visits and/or t seconds so
+    # `jac run --resume <walker id>` can continue it after a crash
+    # (`static has checkpoint_steps: int = 1000;`)
+    checkpoint_steps: ClassVar[int] = 0
+    checkpoint_seconds: ClassVar[float] = 0.0
+
     def __init__(self) -> None:
         """Create walker architype."""
         self.__jac__ = WalkerAnchor(architype=self)
@@ -637,6 +1520,94 @@ class Root(NodeArchitype):
         self.__jac__ = NodeAnchor(architype=self, persistent=True, edges=[])
 
 
+class EdgeRefs:
+    """Lazy edge reference result, streamed only as far as needed.
+
+    Pulled references are kept, so it can be iterated again, sized and indexed
+    like the list of a non lazy edge reference.
+    """
+
+    __slots__ = ("source", "origin", "pulled")
+
+    def __init__(
+        self,
+        source: Iterable[Architype],
+        origin: Optional[tuple[NodeAnchor, EdgeDir, Optional[type]]] = None,
+    ) -> None:
+        """Wrap edge reference stream, of origin's neighbors if plain node query."""
+        self.source = iter(source)
+        self.origin = origin
+        self.pulled: list[Architype] = []
+
+    def pull(self, stop: Optional[int] = None) -> list[Architype]:
+        """Pull references from stream until stop of them are known (all if None)."""
+        pulled = self.pulled
+        if stop is None:
+            pulled.extend(self.source)
+        elif stop > len(pulled):
+            pulled.extend(islice(self.source, stop - len(pulled)))
+        return pulled
+
+    def __iter__(self) -> Iterator[Architype]:
+        """Iterate references, pulling the rest of the stream as needed."""
+        idx = 0
+        while idx < len(self.pull(idx + 1)):
+            yield self.pulled[idx]
+            idx += 1
+
+    def __len__(self) -> int:
+        """Count references, pulling the whole stream."""
+        return len(self.pull())
+
+    def __getitem__(self, key: int | slice) -> Architype | list[Architype]:
+        """Get reference by index or slice, pulling the stream up to it."""
+        if isinstance(key, slice):
+            bounds = (key.start or 0, key.stop)
+            stop = key.stop if all(i is not None and i >= 0 for i in bounds) else None
+        else:
+            stop = key + 1 if key >= 0 else None
+        return self.pull(stop)[key]
+
+
+class FieldFilter:
+    """Typed filter comprehension, answered from field indexes when possible."""
+
+    __slots__ = ("cls", "conditions", "scan")
+
+    def __init__(
+        self,
+        cls: type,
+        conditions: list[tuple[str, str, object]],
+        scan: Callable[[Iterable], list],
+    ) -> None:
+        """Create filter of `cls` instances matching (field, op, value)s."""
+        self.cls = cls
+        self.conditions = conditions
+        self.scan = scan
+
+    def __call__(self, items: Iterable) -> list:
+        """Filter items, looking neighbors up by an indexed field if any."""
+        if (
+            isinstance(items, EdgeRefs)
+            and (origin := items.origin)
+            and (indexed := getattr(self.cls, "_jac_indexes_", None))
+        ):
+            from jaclang.plugin.feature import JacFeature as Jac
+
+            node, dir, edge_type = origin
+            for name, op, value in self.conditions:
+                if name not in indexed:
+                    continue
+                index = node.get_field_index(dir, edge_type, self.cls, name)
+                if (matched := index.lookup(op, value)) is not None:
+                    root = Jac.get_root().__jac__
+                    # remaining conditions checked by scanning matched only
+                    return self.scan(
+                        [n.architype for n in matched if root.has_read_access(n)]
+                    )
+        return self.scan(items)
+
+
 @dataclass(eq=False)
 class DSFunc:
     """Data Spatial Function."""
@@ -648,3 +1619,97 @@ class DSFunc:
     def resolve(self, cls: type) -> None:
         """Resolve the function."""
         self.func = getattr(cls, self.name)
+
+
+@dataclass(eq=False)
+class EdgeBuilder:
+    """Edge factory of connect operations."""
+
+    is_undirected: bool
+    conn_type: type[EdgeArchitype] | EdgeArchitype
+    conn_assign: Optional[tuple[tuple, tuple]] = None
+
+    def create(self, source: NodeAnchor, target: NodeAnchor) -> EdgeArchitype:
+        """Attach new edge without saving."""
+        conn_type = self.conn_type
+        edge = conn_type() if isinstance(conn_type, type) else conn_type
+        edge.__attach__(source, target, self.is_undirected)
+        if conn_assign := self.conn_assign:
+            for fld, val in zip(conn_assign[0], conn_assign[1]):
+                if hasattr(edge, fld):
+                    setattr(edge, fld, val)
+                else:
+                    raise ValueError(f"Invalid attribute: {fld}")
+        return edge
+
+    def __call__(self, source: NodeAnchor, target: NodeAnchor) -> EdgeArchitype:
+        """Connect source to target."""
+        edge = self.create(source, target)
+        if source.persistent or target.persistent:
+            edge.__jac__.save()
+            target.save()
+            source.save()
+        return edge
+
+    def bulk(
+        self, sources: list[NodeAnchor], targets: list[NodeAnchor]
+    ) -> list[EdgeArchitype]:
+        """Connect every source to every target, saving each anchor once."""
+        edges: list[EdgeArchitype] = []
+        touched: dict[NodeAnchor, None] = {}
+        for source in sources:
+            for target in targets:
+                edge = self.create(source, target)
+                if source.persistent or target.persistent:
+                    edge.__jac__.save()
+                    touched[target] = touched[source] = None
+                edges.append(edge)
+
+        for node in touched:
+            node.save()
+        return edges
+
+
+@dataclass(eq=False)
+class DSTable:
+    """Data Spatial Dispatch Table.
+
+    Abilities triggered when a walker class visits a node class, resolved once
+    and cached on the walker class until abilities get patched.
+    """
+
+    node_entry: list[DSFunc]
+    walker_entry: list[DSFunc]
+    walker_exit: list[DSFunc]
+    node_exit: list[DSFunc]
+
+    version: ClassVar[int] = 0
+
+    @staticmethod
+    def get(walker_cls: type[Architype], node_cls: type[Architype]) -> DSTable:
+        """Get resolved dispatch table."""
+        cache: tuple[int, dict[type, DSTable]] | None = walker_cls.__dict__.get(
+            "_jac_ds_tables_"
+        )
+        if not cache or cache[0] != DSTable.version:
+            cache = (DSTable.version, {})
+            walker_cls._jac_ds_tables_ = cache
+
+        if not (table := cache[1].get(node_cls)):
+            table = cache[1][node_cls] = DSTable(
+                node_entry=DSTable.triggered(node_cls._jac_entry_funcs_, walker_cls),
+                walker_entry=DSTable.triggered(walker_cls._jac_entry_funcs_, node_cls),
+                walker_exit=DSTable.triggered(walker_cls._jac_exit_funcs_, node_cls),
+                node_exit=DSTable.triggered(node_cls._jac_exit_funcs_, walker_cls),
+            )
+        return table
+
+    @staticmethod
+    def triggered(funcs: list[DSFunc], cls: type) -> list[DSFunc]:
+        """Filter abilities triggered by class."""
+        return [i for i in funcs if not i.trigger or issubclass(cls, i.trigger)]
+
+    @staticmethod
+    def invalidate() -> None:
+        """Invalidate all cached dispatch tables."""
+        DSTable.version += 1
@@ -0,0 +1,223 @@
+"""NumPy backed columnar storage for numeric architype fields.
+
+`make_columnar` swaps numeric fields of an architype class for `Column`
+descriptors. Every instance owns one row of per class arrays, so reading
+`node.score` still works per node while `gather` pulls the values of a whole
+neighborhood in a single fancy index for vectorized sums, top-k or similarity.
+"""
+
+from __future__ import annotations
+
+import weakref
+from dataclasses import fields
+from typing import (
+    Any,
+    Iterable,
+    Optional,
+    Sequence,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+try:
+    import numpy as np
+except ModuleNotFoundError:
+    np = None  # type: ignore[assignment]
+
+from .architype import Architype
+
+# (dtype, vector) of supported field annotations
+KINDS: dict[object, tuple[str, bool]] = {
+    bool: ("bool", False),
+    int: ("int64", False),
+    float: ("float64", False),
+    list[int]: ("int64", True),
+    list[float]: ("float64", True),
+}
+
+
+def require_numpy() -> None:
+    """Fail early if the optional NumPy dependency is missing."""
+    if np is None:
+        raise ImportError(
+            "Columnar storage needs NumPy, "
+            "install it with `pip install jaclang[columnar]`"
+        )
+
+
+def field_kind(hint: object) -> Optional[tuple[str, bool]]:
+    """Get (dtype, vector) of a field annotation, None if it can't be a column."""
+    if hint in KINDS:
+        return KINDS[hint]
+    if get_origin(hint) is list and get_args(hint) in ((int,), (float,)):
+        return KINDS[list[get_args(hint)[0]]]  # type: ignore[misc]
+    return None
+
+
+class ColumnStore:
+    """Rows of one architype class, a row per live instance."""
+
+    def __init__(self, capacity: int = 64) -> None:
+        """Create empty store."""
+        self.columns: dict[str, Column] = {}
+        self.capacity = capacity
+        self.size = 0
+        self.free: list[int] = []
+
+    def allocate(self) -> int:
+        """Reserve a row, growing every column if full."""
+        if self.free:
+            return self.free.pop()
+        if self.size == self.capacity:
+            self.capacity *= 2
+            for column in self.columns.values():
+                column.resize(self.capacity)
+        self.size += 1
+        return self.size - 1
+
+    def release(self, row: int) -> None:
+        """Return the row of a collected instance."""
+        for column in self.columns.values():
+            column.present[row] = False
+        self.free.append(row)
+
+    def bind(self, obj: Architype) -> int:
+        """Get the row of obj, reserving one on first write."""
+        if (row := obj.__dict__.get("_jac_row_")) is None:
+            row = obj.__dict__["_jac_row_"] = self.allocate()
+            weakref.finalize(obj, self.release, row)
+        return row
+
+
+class Column:
+    """Descriptor keeping one field of every instance in a NumPy array."""
+
+    def __init__(self, store: ColumnStore, name: str, dtype: str, vector: bool) -> None:
+        """Create column with room for every row of store."""
+        self.store = store
+        self.name = name
+        self.dtype = dtype
+        self.vector = vector
+        # vectors get their width from the first value
+        self.data: Any = None if vector else np.zeros(store.capacity, dtype)
+        self.present: Any = np.zeros(store.capacity, bool)
+
+    def resize(self, capacity: int) -> None:
+        """Grow arrays to capacity rows, keeping values."""
+        for attr in ("data", "present"):
+            if (old := getattr(self, attr)) is not None:
+                new = np.zeros((capacity, *old.shape[1:]), old.dtype)
+                new[: len(old)] = old
+                setattr(self, attr, new)
+
+    def has(self, obj: Architype) -> bool:
+        """Check if obj has a value in this column."""
+        row = obj.__dict__.get("_jac_row_")
+        return row is not None and bool(self.present[row])
+
+    def __get__(self, obj: Optional[Architype], owner: type) -> Any:  # noqa: ANN401
+        """Read the value of obj as a plain Python value."""
+        if obj is None:
+            return self
+        if not self.has(obj):
+            raise AttributeError(
+                f"'{owner.__name__}' object has no attribute '{self.name}'"
+            )
+        value = self.data[obj.__dict__["_jac_row_"]]
+        return value.tolist() if self.vector else value.item()
+
+    def __set__(self, obj: Architype, value: Any) -> None:  # noqa: ANN401
+        """Write the value of obj into its row."""
+        if self.vector:
+            value = np.asarray(value, self.dtype)
+            if value.ndim != 1:
+                raise ValueError(f"{self.name} expects a flat list, got {value.shape}")
+            if self.data is None:
+                self.data = np.zeros((self.store.capacity, len(value)), self.dtype)
+            elif len(value) != self.data.shape[1]:
+                raise ValueError(
+                    f"{self.name} holds vectors of length {self.data.shape[1]}, "
+                    f"got {len(value)}"
+                )
+        row = self.store.bind(obj)
+        self.data[row] = value
+        self.present[row] = True
+
+    def gather(self, rows: Sequence[int]) -> Any:  # noqa: ANN401
+        """Get the values of rows as one array."""
+        if self.data is None:
+            return np.zeros((len(rows), 0), self.dtype)
+        return self.data[np.asarray(rows, np.intp)]
+
+
+def make_columnar(cls: type[Architype], names: Iterable[str] = ()) -> None:
+    """Keep numeric fields of cls (all supported ones if none given) in columns."""
+    require_numpy()
+    try:
+        hints = get_type_hints(cls)
+    except NameError:
+        hints = {}
+
+    kinds = {
+        f.name: field_kind(hints.get(f.name, f.type))
+        for f in fields(cls)  # type: ignore[arg-type]
+    }
+    if names := list(names):
+        for name in names:
+            if name not in kinds:
+                raise TypeError(f"{cls.__name__} has no field {name}")
+            if kinds[name] is None:
+                raise TypeError(
+                    f"{cls.__name__}.{name} must be an int, float, bool or "
+                    "list of int/float to be columnar"
+                )
+    else:
+        names = [name for name, kind in kinds.items() if kind]
+
+    store = ColumnStore()
+    for name in names:
+        dtype, vector = kinds[name]  # type: ignore[misc]
+        store.columns[name] = column = Column(store, name, dtype, vector)
+        setattr(cls, name, column)
+
+    cls._jac_columns_ = cls._jac_columns_ | frozenset(names)
+    cls.__getstate__ = columnar_getstate  # type: ignore[assignment]
+    cls.__setstate__ = columnar_setstate  # type: ignore[attr-defined]
+
+
+def columnar_getstate(self: Architype) -> dict[str, Any]:
+    """Get instance state with column values inlined and the row dropped."""
+    state = {k: v for k, v in self.__dict__.items() if k != "_jac_row_"}
+    for name in self._jac_columns_:
+        column: Column = getattr(type(self), name)
+        if column.has(self):
+            state[name] = column.__get__(self, type(self))
+    return state
+
+
+def columnar_setstate(self: Architype, state: dict[str, Any]) -> None:
+    """Restore instance state, writing column values into a fresh row."""
+    for name, value in state.items():
+        if name in self._jac_columns_:
+            object.__setattr__(self, name, value)
+        else:
+            self.__dict__[name] = value
+
+
+def gather(nodes: Sequence[Architype], name: str) -> Any:  # noqa: ANN401
+    """Get field name of every node as one NumPy array."""
+    require_numpy()
+    if nodes:
+        column = getattr(type(nodes[0]), name, None)
+        if isinstance(column, Column):
+            rows = []
+            for node in nodes:
+                owner = getattr(type(node), name, None)
+                if owner is not column or not column.has(node):
+                    break
+                rows.append(node.__dict__["_jac_row_"])
+            else:
+                return column.gather(rows)
+    # mixed classes or plain fields fall back to reading nodes one by one
+    return np.asarray([getattr(node, name) for node in nodes])
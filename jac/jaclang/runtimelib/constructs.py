@@ -7,8 +7,12 @@ from .architype import (
     Anchor,
     Architype,
     DSFunc,
+    DSTable,
     EdgeAnchor,
     EdgeArchitype,
+    EdgeBuilder,
+    EdgeRefs,
+    FieldFilter,
     GenericEdge,
     NodeAnchor,
     NodeArchitype,
@@ -17,7 +21,7 @@ from .architype import (
     WalkerArchitype,
 )
 from .context import ExecutionContext
-from .memory import Memory, ShelfStorage
+from .memory import Memory, ShelfStorage, SqliteStorage
 from .test import JacTestCheck, JacTestResult, JacTextTestRunner
 
 __all__ = [
@@ -32,8 +36,13 @@ __all__ = [
     "GenericEdge",
     "Root",
     "DSFunc",
+    "DSTable",
+    "EdgeBuilder",
+    "EdgeRefs",
+    "FieldFilter",
     "Memory",
     "ShelfStorage",
+    "SqliteStorage",
     "ExecutionContext",
     "JacTestResult",
     "JacTextTestRunner",
@@ -7,8 +7,8 @@ from contextvars import ContextVar
 from typing import Any, Callable, Optional, cast
 from uuid import UUID
 
-from .architype import NodeAnchor, Root
-from .memory import Memory, ShelfStorage
+from .architype import AccessCache, Anchor, NodeAnchor, RUNNING_WALKERS, Root
+from .memory import Memory, ShelfStorage, SqliteStorage
 
 
 EXECUTION_CONTEXT = ContextVar[Optional["ExecutionContext"]]("ExecutionContext")
@@ -29,6 +29,7 @@ class ExecutionContext:
     system_root: NodeAnchor
     root: NodeAnchor
     entry_node: NodeAnchor
+    access_cache: AccessCache
 
     def init_anchor(
         self,
@@ -49,6 +50,22 @@ class ExecutionContext:
     def set_entry_node(self, entry_node: str | None) -> None:
         """Override entry."""
         self.entry_node = self.init_anchor(entry_node, self.root)
+        self.mem.pin(self.entry_node.id)
+
+    def gc_roots(self) -> list[Anchor]:
+        """Get anchors keeping the graph alive on memory sweeps."""
+        mem = self.mem.__mem__
+        roots: list[Anchor] = [self.system_root, self.root, self.entry_node]
+        roots.extend(
+            anchor
+            for anchor in mem.values()
+            if isinstance(anchor, NodeAnchor) and isinstance(anchor.architype, Root)
+        )
+        for walker in RUNNING_WALKERS:
+            roots.append(walker)
+            roots.extend(walker.next)
+            roots.extend(node for *_, node in walker.heap)
+        return roots
 
     def close(self) -> None:
         """Close current ExecutionContext."""
@@ -60,11 +77,17 @@ class ExecutionContext:
         session: Optional[str] = None,
         root: Optional[str] = None,
         auto_close: bool = True,
+        read_only: bool = False,
     ) -> ExecutionContext:
         """Create ExecutionContext."""
         ctx = ExecutionContext()
-        ctx.mem = ShelfStorage(session)
+        ctx.mem = (
+            SqliteStorage(session, read_only=read_only)
+            if session and session.endswith(".db")
+            else ShelfStorage(session, read_only=read_only)
+        )
         ctx.reports = []
+        ctx.access_cache = AccessCache()
 
         if not isinstance(
             system_root := ctx.mem.find_by_id(SUPER_ROOT_UUID), NodeAnchor
@@ -76,6 +99,8 @@ class ExecutionContext:
         ctx.system_root = system_root
 
         ctx.entry_node = ctx.root = ctx.init_anchor(root, ctx.system_root)
+        ctx.mem.pin(ctx.system_root.id)
+        ctx.mem.pin(ctx.root.id)
 
         if auto_close and (old_ctx := EXECUTION_CONTEXT.get(None)):
             old_ctx.close()
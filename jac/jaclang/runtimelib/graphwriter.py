@@ -0,0 +1,176 @@
+"""Iterative graph traversal and streaming graph writers for Jac Language.
+
+`walk_graph` visits the graph around a node without recursion and yields
+every edge once, as soon as it is followed, then every node with the depth
+it settled at. Writers consume that stream and write straight to a file
+handle instead of building the output in memory. The walk itself still keeps
+the id and depth of every node reached and every edge followed, so its memory
+grows with the size of the exported graph (bounded by node_limit and
+edge_limit), plus a copy of the edge list of each node being expanded.
+"""
+
+from __future__ import annotations
+
+import html
+import json
+from collections import deque
+from itertools import islice
+from random import Random
+from typing import Callable, Collection, Iterable, Iterator, TextIO, Union
+
+from jaclang.compiler.constant import colors
+
+from .architype import EdgeAnchor, NodeAnchor
+
+GraphEvent = Union[tuple[NodeAnchor, int, int], tuple[EdgeAnchor, int, int]]
+
+
+def walk_graph(
+    node: NodeAnchor,
+    depth: int = -1,
+    traverse: bool = False,
+    edge_type: Collection[str] = (),
+    bfs: bool = True,
+    edge_limit: int = -1,
+    node_limit: int = -1,
+    breadth: int = -1,
+    fraction: float = 1.0,
+) -> Iterator[GraphEvent]:
+    """Yield (edge, source id, target id) then (node, id, depth) events.
+
+    Negative limits mean unlimited. Ids follow visiting order. `traverse` only
+    follows outgoing edges and `edge_type` lists edge classes to skip. Off by
+    default, `breadth` caps edges followed per node and `fraction` is the
+    chance each newly reached node is kept.
+    """
+    excluded = set(edge_type)
+    rand = Random(0)
+    ids: dict[NodeAnchor, int] = {node: 0}
+    depths: dict[NodeAnchor, int] = {node: 0}
+    visited: set[NodeAnchor] = set()
+    # edges are met from both ends, emitted ones are kept to skip the second
+    seen: set[EdgeAnchor] = set()
+    # bfs visits queued nodes in turn, dfs nests into each node as it's reached
+    frontier: deque[tuple[NodeAnchor, int, Iterator[EdgeAnchor]]] = deque()
+
+    def visit(anchor: NodeAnchor, level: int) -> None:
+        if anchor not in visited:
+            visited.add(anchor)
+            edges: Iterator[EdgeAnchor] = iter(list(anchor.edges))
+            if breadth >= 0:
+                edges = islice(edges, breadth)
+            frontier.append((anchor, level, edges))
+
+    queue: deque[tuple[NodeAnchor, int]] = deque([(node, 0)])
+    while queue or frontier:
+        if not frontier:
+            visit(*queue.popleft())
+            continue
+        current, level, edges = frontier[-1]
+        for edge in edges:
+            incoming = edge.target == current
+            if (traverse and incoming) or edge.architype.__class__.__name__ in excluded:
+                continue
+            other = edge.source if incoming else edge.target
+            if not other or other == current:
+                continue
+            # a node's depth is its shortest distance seen so far
+            if other in depths:
+                depths[current] = min(level, depths[current], depths[other] + 1)
+                depths[other] = min(level + 1, depths[current] + 1, depths[other])
+            else:
+                depths[other] = min(level + 1, depths[current] + 1)
+            if (
+                edge in seen
+                or 0 <= depth < min(depths[current], depths[other]) + 1
+                or 0 <= node_limit <= len(visited)
+                or 0 <= edge_limit <= len(seen)
+            ):
+                continue
+            if other not in ids:
+                if fraction < 1 and rand.random() >= fraction:
+                    continue
+                ids[other] = len(ids)
+            seen.add(edge)
+            yield edge, ids[edge.source], ids[edge.target]
+            if bfs:
+                queue.append((other, level + 1))
+            elif other not in visited:
+                visit(other, level + 1)
+                break
+        else:
+            frontier.pop()
+
+    for anchor, idx in ids.items():
+        yield anchor, idx, depths[anchor]
+
+
+def write_dot(out: TextIO, events: Iterable[GraphEvent], fill: bool = True) -> None:
+    """Stream events as a DOT digraph, coloring nodes by depth if fill is set."""
+    out.write(
+        'digraph {\nnode [style="filled", shape="ellipse", '
+        'fillcolor="invis", fontcolor="black"];\n'
+    )
+    for anchor, first, second in events:
+        label = html.escape(str(anchor.architype))
+        if isinstance(anchor, EdgeAnchor):
+            out.write(f'{first} -> {second}  [label="{label} "];\n')
+        elif fill:
+            color = colors[min(second, len(colors) - 1)]
+            out.write(f'{first} [label="{label}"fillcolor="{color}"];\n')
+        else:
+            out.write(f'{first} [label="{label}"];\n')
+    out.write("}")
+
+
+def write_jsonl(out: TextIO, events: Iterable[GraphEvent]) -> None:
+    """Stream events as one JSON object per line."""
+    for anchor, first, second in events:
+        info = {
+            "jid": anchor.id.hex,
+            "type": anchor.architype.__class__.__name__,
+            "label": str(anchor.architype),
+        }
+        if isinstance(anchor, EdgeAnchor):
+            record = {"kind": "edge", "source": first, "target": second, **info}
+        else:
+            record = {"kind": "node", "id": first, "depth": second, **info}
+        out.write(json.dumps(record) + "\n")
+
+
+def write_graphml(out: TextIO, events: Iterable[GraphEvent]) -> None:
+    """Stream events as a GraphML document."""
+    out.write(
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n'
+        '<key id="type" for="all" attr.name="type" attr.type="string"/>\n'
+        '<key id="label" for="all" attr.name="label" attr.type="string"/>\n'
+        '<key id="depth" for="node" attr.name="depth" attr.type="int"/>\n'
+        '<graph id="G" edgedefault="directed">\n'
+    )
+    for anchor, first, second in events:
+        data = (
+            f'<data key="type">{anchor.architype.__class__.__name__}</data>'
+            f'<data key="label">{html.escape(str(anchor.architype))}</data>'
+        )
+        if isinstance(anchor, EdgeAnchor):
+            out.write(f'<edge source="n{first}" target="n{second}">{data}</edge>\n')
+        else:
+            out.write(
+                f'<node id="n{first}">{data}<data key="depth">{second}</data></node>\n'
+            )
+    out.write("</graph>\n</graphml>\n")
+
+
+WRITERS: dict[str, Callable[[TextIO, Iterable[GraphEvent]], None]] = {
+    "dot": write_dot,
+    "jsonl": write_jsonl,
+    "graphml": write_graphml,
+}
+
+
+def write_graph(out: TextIO, fmt: str, events: Iterable[GraphEvent]) -> None:
+    """Stream events with the writer of the given format."""
+    if fmt not in WRITERS:
+        raise ValueError(f"Unknown graph format {fmt}, expected one of {[*WRITERS]}")
+    WRITERS[fmt](out, events)
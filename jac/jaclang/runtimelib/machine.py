@@ -9,8 +9,8 @@ from contextvars import ContextVar
 from typing import Optional, Union
 
 from jaclang.compiler.absyntree import Module
+from jaclang.compiler.bytecode_cache import load_bytecode
 from jaclang.compiler.compile import compile_jac
-from jaclang.compiler.constant import Constants as Con
 from jaclang.runtimelib.architype import EdgeArchitype, NodeArchitype, WalkerArchitype
 from jaclang.utils.log import logging
 
@@ -181,11 +181,8 @@ class JacProgram:
         if self.mod_bundle and isinstance(self.mod_bundle, Module):
             codeobj = self.mod_bundle.mod_deps[full_target].gen.py_bytecode
             return marshal.loads(codeobj) if isinstance(codeobj, bytes) else None
-        gen_dir = os.path.join(caller_dir, Con.JAC_GEN_DIR)
-        pyc_file_path = os.path.join(gen_dir, module_name + ".jbc")
-        if cachable and os.path.exists(pyc_file_path) and not reload:
-            with open(pyc_file_path, "rb") as f:
-                return marshal.load(f)
+        if cachable and not reload and (cached := load_bytecode(full_target)):
+            return cached
 
         result = compile_jac(full_target, cache_result=cachable)
         if result.errors_had or not result.ir.gen.py_bytecode:
@@ -2,28 +2,149 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from pickle import dumps
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from pickle import dumps, loads
 from shelve import Shelf, open
-from typing import Callable, Generator, Generic, Iterable, TypeVar
+from sqlite3 import Connection, connect
+from typing import (
+    Callable,
+    Generator,
+    Generic,
+    Iterable,
+    Iterator,
+    MutableSet,
+    TypeVar,
+    cast,
+)
 from uuid import UUID
+from weakref import WeakValueDictionary
 
-from .architype import Anchor, NodeAnchor, Root, TANCH
+from jaclang.settings import settings
+
+from .architype import (
+    Anchor,
+    Architype,
+    EdgeAnchor,
+    NodeAnchor,
+    Root,
+    TANCH,
+    WalkerAnchor,
+)
 
 ID = TypeVar("ID")
 
 
+@dataclass
+class MemoryStats:
+    """Anchor cache statistics."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    resident: int = 0
+    loads: int = 0
+    saves: int = 0
+    collected: int = 0
+
+
 @dataclass
 class Memory(Generic[ID, TANCH]):
-    """Generic Memory Handler."""
+    """Generic Memory Handler.
 
-    __mem__: dict[ID, TANCH] = field(default_factory=dict)
+    With a non-zero capacity, `__mem__` works as an LRU cache: clean anchors
+    beyond capacity are evicted, unless pinned. Evicted anchors are unloaded
+    back into stubs and get repopulated from the datasource on next access.
+    Their architypes are kept in `__detached__` while still referenced, so a
+    reload rebinds them instead of creating a second copy.
+
+    With a non-zero gc_threshold, `collect` runs after that many saves and
+    drops anchors no longer reachable from a root or a running walker.
+    """
+
+    __mem__: OrderedDict[ID, TANCH] = field(default_factory=OrderedDict)
     __gc__: set[TANCH] = field(default_factory=set)
+    __detached__: WeakValueDictionary[ID, Architype] = field(
+        default_factory=WeakValueDictionary
+    )
+    __pinned__: set[ID] = field(default_factory=set)
+    __stats__: MemoryStats = field(default_factory=MemoryStats)
+    __pending__: int = 0
+    capacity: int = 0
+    gc_threshold: int = 0
+    session: str | None = None
+    read_only: bool = False
 
     def close(self) -> None:
         """Close memory handler."""
         self.__mem__.clear()
         self.__gc__.clear()
+        self.__detached__.clear()
+        self.__pinned__.clear()
+
+    def sync(self) -> None:
+        """Write pending changes to datasource without closing it."""
+
+    @contextmanager
+    def released(self) -> Iterator[None]:
+        """Sync and let go of datasource while other processes open it."""
+        self.sync()
+        yield
+
+    def get_stats(self) -> MemoryStats:
+        """Get anchor cache statistics."""
+        return replace(self.__stats__, resident=len(self.__mem__))
+
+    def pin(self, id: ID) -> None:
+        """Prevent anchor from being evicted."""
+        self.__pinned__.add(id)
+
+    def unpin(self, id: ID) -> None:
+        """Allow anchor to be evicted."""
+        self.__pinned__.discard(id)
+
+    def lookup(self, id: ID) -> TANCH | None:
+        """Get anchor from cache."""
+        if (anchor := self.__mem__.get(id)) is None:
+            self.__stats__.misses += 1
+            return None
+
+        if self.capacity:
+            self.__mem__.move_to_end(id)
+        self.__stats__.hits += 1
+        return anchor
+
+    def admit(self, id: ID, anchor: TANCH) -> None:
+        """Add loaded anchor to cache and evict if over capacity."""
+        if (architype := self.__detached__.pop(id, None)) is not None:
+            # rebind architype of the evicted anchor, still used somewhere
+            object.__setattr__(anchor, "architype", architype)
+            architype.__dict__["__jac__"] = anchor
+            anchor.track_changes(wrap=True)
+        self.__mem__[id] = anchor
+        if self.capacity and len(self.__mem__) > self.capacity:
+            self.evict()
+
+    def evict(self) -> None:
+        """Evict least recently used clean anchors until within capacity."""
+        mem = self.__mem__
+        # pinned/dirty anchors are rotated to the back, scan stays amortized O(1)
+        # and never reaches the most recent one, still in use by whoever loaded it
+        for _ in range(min(len(mem) - 1, 2 * (len(mem) - self.capacity) + 8)):
+            if len(mem) <= self.capacity:
+                break
+            id, anchor = mem.popitem(last=False)
+            if id in self.__pinned__ or anchor.dirty != set():
+                mem[id] = anchor
+            else:
+                self.unload(id, anchor)
+                self.__stats__.evictions += 1
+
+    def unload(self, id: ID, anchor: TANCH) -> None:
+        """Turn clean anchor back into a stub, detaching its architype."""
+        self.__detached__[id] = anchor.architype
+        anchor.unload()
 
     def find(
         self,
@@ -37,7 +158,7 @@ class Memory(Generic[ID, TANCH]):
         return (
             anchor
             for id in ids
-            if (anchor := self.__mem__.get(id)) and (not filter or filter(anchor))
+            if (anchor := self.lookup(id)) and (not filter or filter(anchor))
         )
 
     def find_one(
@@ -50,11 +171,105 @@ class Memory(Generic[ID, TANCH]):
 
     def find_by_id(self, id: ID) -> TANCH | None:
         """Find one by id."""
-        return self.__mem__.get(id)
+        return self.lookup(id)
+
+    def prefetch(self, anchors: Iterable[TANCH]) -> None:
+        """Populate unloaded anchors with a single find."""
+        stubs: dict[ID, list[TANCH]] = {}
+        for anchor in anchors:
+            if not anchor.is_populated():
+                stubs.setdefault(cast(ID, anchor.id), []).append(anchor)
+
+        if stubs:
+            for anchor in self.find(stubs):
+                for stub in stubs[cast(ID, anchor.id)]:
+                    if stub is not anchor:
+                        stub.populate_from(anchor)
 
     def set(self, id: ID, data: TANCH) -> None:
         """Save anchor to memory."""
         self.__mem__[id] = data
+        # reconnected after a sweep, keep it in the datasource
+        self.__gc__.discard(data)
+
+    def count_save(self) -> None:
+        """Count a saved anchor, sweeping once gc_threshold saves are reached."""
+        if self.gc_threshold:
+            self.__pending__ += 1
+            if self.__pending__ >= self.gc_threshold:
+                self.collect()
+
+    def collect(self, roots: Iterable[TANCH] | None = None) -> int:
+        """Drop anchors unreachable from roots (default: the context's roots).
+
+        Reachability follows edges both ways through anchors in memory, with
+        pinned anchors as extra roots. Unreachable groups that are wholly in
+        memory are dropped, stored ones get deleted on the next sync. Groups
+        linked to unloaded stubs may still be reachable from the datasource,
+        so only their clean anchors are evicted. Stored walkers are kept.
+        """
+        if roots is None:
+            from jaclang.plugin.feature import JacFeature as Jac
+
+            roots = cast(Iterable[TANCH], Jac.get_context().gc_roots())
+
+        mem = self.__mem__
+        seen: MutableSet[ID] = set()
+        pinned = [anchor for id in self.__pinned__ if (anchor := mem.get(id))]
+        self.spread([*roots, *pinned], seen, [])
+
+        dropped = 0
+        for id, anchor in list(mem.items()):
+            if id in seen:
+                continue
+            group: list[TANCH] = []
+            closed = self.spread([anchor], seen, group)
+            for member in group:
+                if isinstance(member, WalkerAnchor) and member.dirty is not None:
+                    continue
+                key = cast(ID, member.id)
+                if closed:
+                    mem.pop(key, None)
+                    # dirty is None for anchors that never came from storage
+                    if member.dirty is not None:
+                        self.__gc__.add(member)
+                elif member.dirty == set() and key in mem:
+                    self.unload(key, mem.pop(key))
+                else:
+                    continue
+                dropped += 1
+
+        # destroyed anchors that were never stored have nothing to delete
+        self.__gc__ = {anchor for anchor in self.__gc__ if anchor.dirty is not None}
+        self.__pending__ = 0
+        self.__stats__.collected += dropped
+        return dropped
+
+    def spread(
+        self, start: Iterable[TANCH], seen: MutableSet[ID], found: list[TANCH]
+    ) -> bool:
+        """Mark anchors linked to start, False if some were unloaded stubs."""
+        mem = self.__mem__
+        closed = True
+        stack = list(start)
+        while stack:
+            anchor = stack.pop()
+            if (id := cast(ID, anchor.id)) in seen:
+                continue
+            if not anchor.is_populated():
+                if (loaded := mem.get(id)) is None:
+                    closed = False
+                    continue
+                anchor = loaded
+            seen.add(id)
+            found.append(anchor)
+            if isinstance(anchor, NodeAnchor):
+                stack.extend(cast(list[TANCH], anchor.edges))
+            elif isinstance(anchor, EdgeAnchor):
+                stack.extend(
+                    cast(TANCH, node) for node in (anchor.source, anchor.target) if node
+                )
+        return closed
 
     def remove(self, ids: ID | Iterable[ID]) -> None:
         """Remove anchor/s from memory."""
@@ -72,53 +287,108 @@ class ShelfStorage(Memory[UUID, Anchor]):
 
     __shelf__: Shelf[Anchor] | None = None
 
-    def __init__(self, session: str | None = None) -> None:
+    def __init__(
+        self,
+        session: str | None = None,
+        capacity: int | None = None,
+        read_only: bool = False,
+    ) -> None:
         """Initialize memory handler."""
-        super().__init__()
-        self.__shelf__ = open(session) if session else None  # noqa: SIM115
+        super().__init__(
+            capacity=settings.anchor_cache_size if capacity is None else capacity,
+            gc_threshold=settings.gc_threshold,
+            session=session,
+            read_only=read_only,
+        )
+        self.__shelf__ = (
+            open(session, flag="r" if read_only else "c")  # noqa: SIM115
+            if session
+            else None
+        )
 
     def close(self) -> None:
         """Close memory handler."""
         if isinstance(self.__shelf__, Shelf):
-            from jaclang.plugin.feature import JacFeature as Jac
-
-            root = Jac.get_root().__jac__
+            self.sync()
+            self.__shelf__.close()
+        super().close()
 
-            for anchor in self.__gc__:
-                self.__shelf__.pop(str(anchor.id), None)
-                self.__mem__.pop(anchor.id, None)
+    @contextmanager
+    def released(self) -> Iterator[None]:
+        """Sync and close shelf while other processes open it, reopening after.
+
+        Some dbm backends lock the file while it is open for writing.
+        """
+        if not isinstance(self.__shelf__, Shelf) or self.read_only:
+            yield
+            return
+
+        self.sync()
+        self.__shelf__.close()
+        self.__shelf__ = None
+        try:
+            yield
+        finally:
+            self.__shelf__ = open(cast(str, self.session), flag="c")  # noqa: SIM115
+
+    def sync(self) -> None:
+        """Write removed and changed anchors to shelf."""
+        if not isinstance(self.__shelf__, Shelf) or self.read_only:
+            return
+
+        from jaclang.plugin.feature import JacFeature as Jac
+
+        root = Jac.get_root().__jac__
+        synced: list[Anchor] = []
+
+        for anchor in self.__gc__:
+            self.__shelf__.pop(str(anchor.id), None)
+            self.__mem__.pop(anchor.id, None)
+        self.__gc__.clear()
 
-            for d in self.__mem__.values():
-                if d.persistent and d.hash != hash(dumps(d)):
-                    _id = str(d.id)
-                    if p_d := self.__shelf__.get(_id):
-                        if (
-                            isinstance(p_d, NodeAnchor)
-                            and isinstance(d, NodeAnchor)
-                            and p_d.edges != d.edges
-                            and root.has_connect_access(d)
-                        ):
-                            if not d.edges:
-                                self.__shelf__.pop(_id, None)
-                                continue
-                            p_d.edges = d.edges
-
-                        if root.has_write_access(d):
-                            if hash(dumps(p_d.access)) != hash(dumps(d.access)):
-                                p_d.access = d.access
-                            if hash(dumps(d.architype)) != hash(dumps(d.architype)):
-                                p_d.architype = d.architype
-
-                        self.__shelf__[_id] = p_d
-                    elif not (
-                        isinstance(d, NodeAnchor)
-                        and not isinstance(d.architype, Root)
-                        and not d.edges
+        for d in self.__mem__.values():
+            # dirty is None for anchors that never came from storage
+            if d.persistent and (changes := d.dirty) != set():
+                _id = str(d.id)
+                if p_d := self.__shelf__.get(_id):
+                    changes = changes or {"edges", "access", "architype"}
+                    if (
+                        isinstance(p_d, NodeAnchor)
+                        and isinstance(d, NodeAnchor)
+                        and "edges" in changes
+                        and root.has_connect_access(d)
                     ):
-                        self.__shelf__[_id] = d
+                        if not d.edges:
+                            self.__shelf__.pop(_id, None)
+                            continue
+                        p_d.edges = d.edges
+
+                    if root.has_write_access(d):
+                        if isinstance(d, WalkerAnchor):
+                            # walkers are stored whole, frontier included
+                            p_d = d
+                        if "access" in changes:
+                            p_d.access = d.access
+                        if "architype" in changes:
+                            p_d.architype = d.architype
+
+                    self.__shelf__[_id] = p_d
+                    self.__stats__.saves += 1
+                elif not (
+                    isinstance(d, NodeAnchor)
+                    and not isinstance(d.architype, Root)
+                    and not d.edges
+                ):
+                    self.__shelf__[_id] = d
+                    self.__stats__.saves += 1
+                else:
+                    continue
+                synced.append(d)
 
-            self.__shelf__.close()
-        super().close()
+        self.__shelf__.sync()
+
+        for anchor in synced:
+            anchor.track_changes()
 
     def find(
         self,
@@ -131,14 +401,16 @@ class ShelfStorage(Memory[UUID, Anchor]):
 
         if isinstance(self.__shelf__, Shelf):
             for id in ids:
-                anchor = self.__mem__.get(id)
+                anchor = self.lookup(id)
 
                 if (
                     not anchor
-                    and id not in self.__gc__
                     and (_anchor := self.__shelf__.get(str(id)))
+                    # destroyed but not yet synced, equal by class and id
+                    and _anchor not in self.__gc__
                 ):
-                    self.__mem__[id] = anchor = _anchor
+                    self.admit(id, anchor := _anchor)
+                    self.__stats__.loads += 1
                 if anchor and (not filter or filter(anchor)):
                     yield anchor
         else:
@@ -151,8 +423,355 @@ class ShelfStorage(Memory[UUID, Anchor]):
         if (
             not data
             and isinstance(self.__shelf__, Shelf)
-            and (data := self.__shelf__.get(str(id)))
+            and (_data := self.__shelf__.get(str(id)))
+            # destroyed but not yet synced, equal by class and id
+            and _data not in self.__gc__
         ):
-            self.__mem__[id] = data
+            self.admit(id, data := _data)
+            self.__stats__.loads += 1
 
         return data
+
+
+@dataclass
+class SqliteStorage(Memory[UUID, Anchor]):
+    """SQLite Handler.
+
+    Nodes (and walkers) and edges are stored on separate tables with their
+    adjacency on its own table, so changing an edge only touches its rows.
+    Changes are committed per transaction on `commit`, which also runs when
+    the bounded cache can't evict because every anchor is dirty.
+    """
+
+    __conn__: Connection | None = None
+    __committing__: bool = False
+
+    BATCH_SIZE = 500
+    KINDS = {"n": NodeAnchor, "w": WalkerAnchor}
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS node ("
+        "id TEXT PRIMARY KEY, kind TEXT NOT NULL, architype BLOB NOT NULL, "
+        "root TEXT, access BLOB NOT NULL, persistent INTEGER NOT NULL)",
+        "CREATE TABLE IF NOT EXISTS edge ("
+        "id TEXT PRIMARY KEY, source TEXT NOT NULL, target TEXT NOT NULL, "
+        "is_undirected INTEGER NOT NULL, architype BLOB NOT NULL, "
+        "root TEXT, access BLOB NOT NULL, persistent INTEGER NOT NULL)",
+        "CREATE TABLE IF NOT EXISTS adjacency ("
+        "node TEXT NOT NULL, edge TEXT NOT NULL, UNIQUE (node, edge))",
+        "CREATE INDEX IF NOT EXISTS adjacency_edge ON adjacency (edge)",
+        "CREATE TABLE IF NOT EXISTS walk ("
+        "id TEXT PRIMARY KEY, frontier BLOB NOT NULL)",
+    )
+
+    def __init__(
+        self, session: str, capacity: int | None = None, read_only: bool = False
+    ) -> None:
+        """Initialize memory handler."""
+        super().__init__(
+            capacity=settings.anchor_cache_size if capacity is None else capacity,
+            gc_threshold=settings.gc_threshold,
+            session=session,
+            read_only=read_only,
+        )
+        if read_only:
+            self.__conn__ = connect(f"file:{session}?mode=ro", uri=True)
+            return
+        self.__conn__ = connect(session)
+        self.__conn__.execute("PRAGMA journal_mode=WAL")
+        self.__conn__.execute("PRAGMA synchronous=NORMAL")
+        with self.__conn__:
+            for statement in self.SCHEMA:
+                self.__conn__.execute(statement)
+
+    def close(self) -> None:
+        """Close memory handler."""
+        if isinstance(self.__conn__, Connection):
+            self.commit()
+            self.__conn__.close()
+            self.__conn__ = None
+        super().close()
+
+    @contextmanager
+    def released(self) -> Iterator[None]:
+        """Commit and close connection while other processes open the database.
+
+        Connections must not be carried across a fork, reopened after.
+        """
+        if not isinstance(self.__conn__, Connection) or self.read_only:
+            yield
+            return
+
+        self.commit()
+        self.__conn__.close()
+        self.__conn__ = None
+        try:
+            yield
+        finally:
+            self.__conn__ = connect(cast(str, self.session))
+            self.__conn__.execute("PRAGMA synchronous=NORMAL")
+
+    def evict(self) -> None:
+        """Evict least recently used clean anchors, committing if all are dirty."""
+        super().evict()
+        if (
+            len(self.__mem__) > self.capacity
+            and isinstance(self.__conn__, Connection)
+            and not self.__committing__
+        ):
+            self.commit()
+            super().evict()
+
+    def sync(self) -> None:
+        """Commit pending changes."""
+        self.commit()
+
+    def commit(self) -> None:
+        """Write removed and changed anchors in a single transaction."""
+        if not isinstance(conn := self.__conn__, Connection) or self.read_only:
+            return
+
+        from jaclang.plugin.feature import JacFeature as Jac
+
+        root = Jac.get_root().__jac__
+        synced: list[Anchor] = []
+
+        self.__committing__ = True
+        with conn:
+            # bulk deletes, each adjacency lookup goes through its own index
+            nodes: list[tuple[str]] = []
+            edges: list[tuple[str]] = []
+            for anchor in self.__gc__:
+                (edges if isinstance(anchor, EdgeAnchor) else nodes).append(
+                    (str(anchor.id),)
+                )
+                self.__mem__.pop(anchor.id, None)
+            self.__gc__.clear()
+            conn.executemany("DELETE FROM node WHERE id = ?", nodes)
+            conn.executemany("DELETE FROM adjacency WHERE node = ?", nodes)
+            conn.executemany("DELETE FROM walk WHERE id = ?", nodes)
+            conn.executemany("DELETE FROM edge WHERE id = ?", edges)
+            conn.executemany("DELETE FROM adjacency WHERE edge = ?", edges)
+
+            for d in self.__mem__.values():
+                # dirty is None for anchors that never came from storage
+                if not d.persistent or (changes := d.dirty) == set():
+                    continue
+
+                if changes is None:
+                    if (
+                        isinstance(d, NodeAnchor)
+                        and not isinstance(d.architype, Root)
+                        and not d.edges
+                    ):
+                        continue
+                    self.insert(d)
+                    self.__stats__.saves += 1
+                else:
+                    if (
+                        isinstance(d, NodeAnchor)
+                        and "edges" in changes
+                        and root.has_connect_access(d)
+                    ):
+                        if not d.edges:
+                            self.delete(d)
+                            continue
+                        self.connect(d)
+
+                    if root.has_write_access(d):
+                        self.update(d, changes)
+                    self.__stats__.saves += 1
+                synced.append(d)
+        self.__committing__ = False
+
+        for anchor in synced:
+            anchor.track_changes()
+
+    def insert(self, anchor: Anchor) -> None:
+        """Insert anchor with its adjacency."""
+        conn = self.__conn__
+        assert conn is not None
+        state = anchor.__getstate__()
+        values = (
+            str(anchor.id),
+            dumps(state["architype"]),
+            str(anchor.root) if anchor.root else None,
+            dumps(anchor.access),
+            anchor.persistent,
+        )
+        if isinstance(anchor, EdgeAnchor):
+            conn.execute(
+                "INSERT OR REPLACE INTO edge (id, architype, root, access, persistent, "
+                "source, target, is_undirected) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    *values,
+                    str(anchor.source.id),
+                    str(anchor.target.id),
+                    anchor.is_undirected,
+                ),
+            )
+        else:
+            conn.execute(
+                "INSERT OR REPLACE INTO node (id, architype, root, access, persistent, "
+                "kind) VALUES (?, ?, ?, ?, ?, ?)",
+                (*values, "n" if isinstance(anchor, NodeAnchor) else "w"),
+            )
+            if isinstance(anchor, NodeAnchor):
+                self.connect(anchor)
+            elif isinstance(anchor, WalkerAnchor):
+                self.save_frontier(anchor)
+
+    def update(self, anchor: Anchor, changes: set[str]) -> None:
+        """Update changed columns of anchor."""
+        conn = self.__conn__
+        assert conn is not None
+        table = "edge" if isinstance(anchor, EdgeAnchor) else "node"
+        if "access" in changes:
+            conn.execute(
+                f"UPDATE {table} SET access = ? WHERE id = ?",
+                (dumps(anchor.access), str(anchor.id)),
+            )
+        if "architype" in changes:
+            conn.execute(
+                f"UPDATE {table} SET architype = ? WHERE id = ?",
+                (dumps(anchor.__getstate__()["architype"]), str(anchor.id)),
+            )
+            if isinstance(anchor, WalkerAnchor):
+                self.save_frontier(anchor)
+
+    def save_frontier(self, anchor: WalkerAnchor) -> None:
+        """Replace pending visits of walker anchor."""
+        conn = self.__conn__
+        assert conn is not None
+        conn.execute(
+            "INSERT OR REPLACE INTO walk (id, frontier) VALUES (?, ?)",
+            (str(anchor.id), dumps(anchor.frontier())),
+        )
+
+    def connect(self, anchor: NodeAnchor) -> None:
+        """Replace adjacency of node anchor."""
+        conn = self.__conn__
+        assert conn is not None
+        _id = str(anchor.id)
+        conn.execute("DELETE FROM adjacency WHERE node = ?", (_id,))
+        conn.executemany(
+            "INSERT OR IGNORE INTO adjacency (node, edge) VALUES (?, ?)",
+            [(_id, str(edge.id)) for edge in anchor.edges],
+        )
+
+    def delete(self, anchor: Anchor) -> None:
+        """Delete anchor with its adjacency."""
+        conn = self.__conn__
+        assert conn is not None
+        _id = str(anchor.id)
+        conn.execute("DELETE FROM node WHERE id = ?", (_id,))
+        conn.execute("DELETE FROM adjacency WHERE node = ?", (_id,))
+        conn.execute("DELETE FROM walk WHERE id = ?", (_id,))
+
+    def load(self, ids: list[UUID]) -> dict[UUID, Anchor]:
+        """Load anchors from datasource in batches."""
+        conn = self.__conn__
+        assert conn is not None
+        loaded: dict[UUID, Anchor] = {}
+        for i in range(0, len(ids), self.BATCH_SIZE):
+            batch = [str(id) for id in ids[i : i + self.BATCH_SIZE]]
+            params = ", ".join("?" * len(batch))
+            edges: dict[str, list[EdgeAnchor]] = {}
+            for node, edge in conn.execute(
+                f"SELECT node, edge FROM adjacency WHERE node IN ({params}) "
+                "ORDER BY rowid",
+                batch,
+            ):
+                edges.setdefault(node, []).append(self.stub(EdgeAnchor, edge))
+            frontiers = dict(
+                conn.execute(
+                    f"SELECT id, frontier FROM walk WHERE id IN ({params})", batch
+                ).fetchall()
+            )
+
+            for _id, kind, architype, root, access, persistent in conn.execute(
+                "SELECT id, kind, architype, root, access, persistent FROM node "
+                f"WHERE id IN ({params})",
+                batch,
+            ):
+                state = self.state(_id, architype, root, access, persistent)
+                if kind == "n":
+                    state["edges"] = edges.get(_id, [])
+                elif _id in frontiers:
+                    state.update(loads(frontiers[_id]))
+                anchor: Anchor = object.__new__(self.KINDS[kind])
+                anchor.__setstate__(state)
+                loaded[anchor.id] = anchor
+
+            for (
+                _id,
+                source,
+                target,
+                is_undirected,
+                architype,
+                root,
+                access,
+                persistent,
+            ) in conn.execute(
+                "SELECT id, source, target, is_undirected, architype, root, access, "
+                f"persistent FROM edge WHERE id IN ({params})",
+                batch,
+            ):
+                state = self.state(_id, architype, root, access, persistent)
+                state["source"] = self.stub(NodeAnchor, source)
+                state["target"] = self.stub(NodeAnchor, target)
+                state["is_undirected"] = bool(is_undirected)
+                anchor = object.__new__(EdgeAnchor)
+                anchor.__setstate__(state)
+                loaded[anchor.id] = anchor
+        return loaded
+
+    @staticmethod
+    def state(
+        id: str, architype: bytes, root: str | None, access: bytes, persistent: int
+    ) -> dict[str, object]:
+        """Build anchor state from row."""
+        return {
+            "id": UUID(id),
+            "architype": loads(architype),
+            "root": UUID(root) if root else None,
+            "access": loads(access),
+            "persistent": bool(persistent),
+        }
+
+    @staticmethod
+    def stub(cls: type[TANCH], id: str) -> TANCH:
+        """Build unloaded anchor."""
+        unloaded = object.__new__(cls)
+        unloaded.id = UUID(id)
+        unloaded.loaded = False
+        return unloaded
+
+    def find(
+        self,
+        ids: UUID | Iterable[UUID],
+        filter: Callable[[Anchor], Anchor] | None = None,
+    ) -> Generator[Anchor, None, None]:
+        """Find anchors from datasource by ids with filter."""
+        if not isinstance(ids, Iterable):
+            ids = [ids]
+
+        if not isinstance(self.__conn__, Connection):
+            yield from super().find(ids, filter)
+            return
+
+        ids = list(ids)
+        found = {id: anchor for id in ids if (anchor := self.lookup(id))}
+        removed = {anchor.id for anchor in self.__gc__}
+        if missing := [id for id in ids if id not in found and id not in removed]:
+            for id, anchor in self.load(missing).items():
+                self.admit(id, anchor)
+                self.__stats__.loads += 1
+                found[id] = anchor
+
+        for id in ids:
+            if (anchor := found.get(id)) and (not filter or filter(anchor)):
+                yield anchor
+
+    def find_by_id(self, id: UUID) -> Anchor | None:
+        """Find one by id."""
+        return next(self.find(id), None)
@@ -0,0 +1,170 @@
+"""Parallel walker spawning for Jac Language."""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from multiprocessing import get_context
+from typing import Any, Callable, Optional, cast
+from uuid import UUID
+
+from .architype import (
+    Anchor,
+    EdgeAnchor,
+    NodeAnchor,
+    NodeArchitype,
+    TrackedDict,
+    TrackedList,
+    WalkerAnchor,
+    WalkerArchitype,
+)
+from .context import ExecutionContext
+
+
+@dataclass
+class SpawnJob:
+    """Walker spawn shared with forked workers."""
+
+    walker: Callable[[], WalkerArchitype]
+    session: str
+    root: str
+
+
+@dataclass
+class SpawnResult:
+    """Walkers, reports and changes of a batch of start nodes."""
+
+    walkers: list[WalkerAnchor] = field(default_factory=list)
+    reports: list[Any] = field(default_factory=list)
+    created: list[Anchor] = field(default_factory=list)
+    updated: list[tuple[Anchor, set[str], set[str]]] = field(default_factory=list)
+    removed: list[UUID] = field(default_factory=list)
+
+
+# inherited by forked workers, walker factories don't need to be picklable
+JOB: Optional[SpawnJob] = None
+
+BATCHES_PER_WORKER = 4
+
+
+def spawn_batch(nodes: list[str]) -> SpawnResult:
+    """Spawn walker on each start node with a read only ExecutionContext."""
+    from jaclang.plugin.feature import JacFeature as Jac
+
+    assert JOB is not None, "spawn_batch must run on a spawn_many worker"
+
+    # context inherited from parent process is left as is, never closed here
+    ctx = ExecutionContext.create(
+        session=JOB.session, root=JOB.root, auto_close=False, read_only=True
+    )
+    result = SpawnResult()
+    try:
+        for node in nodes:
+            walker = JOB.walker()
+            Jac.spawn_call(walker, ctx.init_anchor(node, ctx.root).architype)
+            result.walkers.append(walker.__jac__)
+
+        mem = ctx.mem
+        result.reports = ctx.reports
+        result.removed = [anchor.id for anchor in mem.__gc__]
+        for anchor in mem.__mem__.values():
+            if not anchor.persistent or (dirty := anchor.dirty) == set():
+                continue
+            if dirty is None:
+                result.created.append(anchor)
+            else:
+                result.updated.append(
+                    (anchor, set(dirty), set(anchor.dirty_fields or ()))
+                )
+    finally:
+        ctx.close()
+
+    return result
+
+
+def merge(ctx: ExecutionContext, result: SpawnResult) -> None:
+    """Apply changes of a worker batch to current memory."""
+    mem = ctx.mem
+
+    for anchor in result.created:
+        anchor.dirty = anchor.dirty_fields = None
+        mem.set(anchor.id, anchor)
+
+    for anchor, dirty, names in result.updated:
+        if not (current := mem.find_by_id(anchor.id)):
+            continue
+
+        if (
+            "edges" in dirty
+            and isinstance(current, NodeAnchor)
+            and isinstance(anchor, NodeAnchor)
+        ):
+            # worker edges come back as stubs, link the anchors found here
+            ids = {edge.id for edge in current.edges}
+            for edge in anchor.edges:
+                if edge.id not in ids and (found := mem.find_by_id(edge.id)):
+                    current.add_edge(cast(EdgeAnchor, found))
+
+        if "architype" in dirty:
+            state = cast(dict[str, Any], anchor.architype.__getstate__())
+            for name in names or state.keys() - {"__jac__"}:
+                if name in state:
+                    if isinstance(value := state[name], (TrackedList, TrackedDict)):
+                        value._jac_owner_ = (current, name)
+                    setattr(current.architype, name, value)
+
+        if "access" in dirty:
+            current.access = anchor.access
+            current.invalidate_access()
+
+        for name in dirty & {"root", "persistent"}:
+            setattr(current, name, getattr(anchor, name))
+
+    for id in result.removed:
+        if (current := mem.find_by_id(id)) and current not in mem.__gc__:
+            current.destroy()
+
+    ctx.reports.extend(result.reports)
+
+
+def spawn_many(
+    walker: Callable[[], WalkerArchitype],
+    start_nodes: list[NodeArchitype],
+    workers: Optional[int] = None,
+) -> list[WalkerArchitype]:
+    """Spawn a new walker on each start node using a process pool.
+
+    Pending changes are written to the session and it is closed while forked
+    workers read the graph from it, each with its own ExecutionContext. Reports
+    and changes are merged back in start node order, so the outcome doesn't
+    depend on scheduling. Without a session (or a single worker) walkers run
+    sequentially on current context.
+    """
+    from jaclang.plugin.feature import JacFeature as Jac
+
+    global JOB
+
+    ctx = ExecutionContext.get()
+    workers = workers or os.cpu_count() or 1
+    if not ctx.mem.session or workers < 2 or len(start_nodes) < 2:
+        return [Jac.spawn_call(walker(), node) for node in start_nodes]
+
+    nodes = [str(node.__jac__.id) for node in start_nodes]
+    size = -(-len(nodes) // (workers * BATCHES_PER_WORKER))
+    batches = [nodes[i : i + size] for i in range(0, len(nodes), size)]
+
+    JOB = SpawnJob(walker=walker, session=ctx.mem.session, root=str(ctx.root.id))
+    try:
+        with ctx.mem.released(), ProcessPoolExecutor(
+            max_workers=min(workers, len(batches)), mp_context=get_context("fork")
+        ) as pool:
+            results = list(pool.map(spawn_batch, batches))
+    finally:
+        JOB = None
+
+    walkers: list[WalkerArchitype] = []
+    for result in results:
+        merge(ctx, result)
+        walkers.extend(anchor.architype for anchor in result.walkers)
+    return walkers
@@ -0,0 +1,196 @@
+"""Walker runtime profiler for Jac Language."""
+
+from __future__ import annotations
+
+import json
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from inspect import iscoroutinefunction
+from time import perf_counter
+from typing import Callable, Optional
+
+from .architype import Architype, DSFunc, DSTable
+from .memory import MemoryStats
+
+PROFILER: ContextVar[Optional[Profiler]] = ContextVar("PROFILER", default=None)
+
+
+@dataclass
+class CallStats:
+    """Call count and cumulative time."""
+
+    calls: int = 0
+    time: float = 0.0
+
+
+@dataclass
+class EdgeQueryStats(CallStats):
+    """Edge reference statistics."""
+
+    scanned: int = 0
+    returned: int = 0
+
+
+@dataclass
+class ConnectStats(CallStats):
+    """Connect statistics."""
+
+    edges: int = 0
+
+
+@dataclass
+class Profiler:
+    """Walker runtime profiler."""
+
+    abilities: dict[str, CallStats] = field(default_factory=dict)
+    nodes: dict[str, int] = field(default_factory=dict)
+    edge_queries: dict[str, EdgeQueryStats] = field(default_factory=dict)
+    connect: ConnectStats = field(default_factory=ConnectStats)
+    visits: int = 0
+    memory: MemoryStats = field(default_factory=MemoryStats)
+    tables: dict[DSTable, DSTable] = field(default_factory=dict, repr=False)
+
+    @staticmethod
+    def current() -> Optional[Profiler]:
+        """Get active profiler."""
+        return PROFILER.get()
+
+    @staticmethod
+    def start() -> Profiler:
+        """Activate a new profiler."""
+        profiler = Profiler()
+        PROFILER.set(profiler)
+        return profiler
+
+    def stop(self, memory: Optional[MemoryStats] = None) -> None:
+        """Deactivate profiler."""
+        if memory:
+            self.memory = memory
+        if PROFILER.get() is self:
+            PROFILER.set(None)
+
+    def finish(self, memory: MemoryStats, dump: str = "") -> None:
+        """Stop profiler, print report and optionally dump it as JSON."""
+        self.stop(memory)
+        self.report()
+        if dump:
+            self.dump(dump)
+
+    def instrument(self, table: DSTable) -> DSTable:
+        """Get dispatch table with timed abilities."""
+        if (timed := self.tables.get(table)) is None:
+            timed = self.tables[table] = DSTable(
+                node_entry=[self.timed(i) for i in table.node_entry],
+                walker_entry=[self.timed(i) for i in table.walker_entry],
+                walker_exit=[self.timed(i) for i in table.walker_exit],
+                node_exit=[self.timed(i) for i in table.node_exit],
+            )
+        return timed
+
+    def timed(self, ability: DSFunc) -> DSFunc:
+        """Wrap ability to record calls and time."""
+        if not (func := ability.func):
+            return ability
+
+        stats = self.abilities.setdefault(func.__qualname__, CallStats())
+
+        if iscoroutinefunction(func):
+
+            async def acall(obj: Architype, other: Architype) -> object:
+                start = perf_counter()
+                try:
+                    return await func(obj, other)
+                finally:
+                    stats.calls += 1
+                    stats.time += perf_counter() - start
+
+            return DSFunc(name=ability.name, trigger=ability.trigger, func=acall)
+
+        def call(obj: Architype, other: Architype) -> object:
+            start = perf_counter()
+            try:
+                return func(obj, other)
+            finally:
+                stats.calls += 1
+                stats.time += perf_counter() - start
+
+        return DSFunc(name=ability.name, trigger=ability.trigger, func=call)
+
+    def node_visited(self, node: Architype) -> None:
+        """Count node visited by walker."""
+        name = node.__class__.__name__
+        self.nodes[name] = self.nodes.get(name, 0) + 1
+
+    def edge_query(
+        self,
+        key: str,
+        scanned: int,
+        returned: int,
+        start: float,
+    ) -> None:
+        """Record edge reference."""
+        stats = self.edge_queries.get(key)
+        if stats is None:
+            stats = self.edge_queries[key] = EdgeQueryStats()
+        stats.calls += 1
+        stats.time += perf_counter() - start
+        stats.scanned += scanned
+        stats.returned += returned
+
+    def connected(self, edges: int, start: float) -> None:
+        """Record connect."""
+        self.connect.calls += 1
+        self.connect.time += perf_counter() - start
+        self.connect.edges += edges
+
+    def to_dict(self) -> dict:
+        """Convert to JSON serializable dict."""
+        return {
+            "abilities": {k: asdict(v) for k, v in self.abilities.items()},
+            "nodes": dict(self.nodes),
+            "edge_queries": {k: asdict(v) for k, v in self.edge_queries.items()},
+            "connect": asdict(self.connect),
+            "visits": self.visits,
+            "memory": asdict(self.memory),
+        }
+
+    def dump(self, path: str) -> None:
+        """Dump profile as JSON."""
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def report(self, out: Callable[[str], None] = print) -> None:
+        """Print profile sorted by cumulative time."""
+        out("Walker profile")
+        out(f"  {'ability':<40} {'calls':>10} {'total ms':>12} {'ms/call':>10}")
+        for name, stats in sorted(
+            self.abilities.items(), key=lambda i: i[1].time, reverse=True
+        ):
+            out(
+                f"  {name:<40} {stats.calls:>10} {stats.time * 1000:>12.3f}"
+                f" {stats.time * 1000 / max(stats.calls, 1):>10.4f}"
+            )
+        out(f"  {'node type':<40} {'visited':>10}")
+        for name, count in sorted(self.nodes.items(), key=lambda i: -i[1]):
+            out(f"  {name:<40} {count:>10}")
+        out(
+            f"  {'edge query':<40} {'calls':>10} {'total ms':>12}"
+            f" {'scanned':>10} {'returned':>10}"
+        )
+        for name, query in sorted(
+            self.edge_queries.items(), key=lambda i: i[1].time, reverse=True
+        ):
+            out(
+                f"  {name:<40} {query.calls:>10} {query.time * 1000:>12.3f}"
+                f" {query.scanned:>10} {query.returned:>10}"
+            )
+        out(
+            f"  connect: {self.connect.calls} calls, {self.connect.edges} edges,"
+            f" {self.connect.time * 1000:.3f} ms; visit: {self.visits} statements"
+        )
+        memory = self.memory
+        out(
+            f"  memory: {memory.loads} loads, {memory.saves} saves,"
+            f" {memory.hits} hits, {memory.misses} misses,"
+            f" {memory.evictions} evictions"
+        )
@@ -0,0 +1,444 @@
+"""Columnar binary graph snapshots for Jac Language.
+
+A snapshot holds the graph reachable from a node, laid out as columns:
+
+    MAGIC, then length prefixed blocks
+    header      json: architype classes, their row counts and field columns
+    tables      pickle: distinct access permissions
+    per class   node/edge ids, access column, field columns
+                (edges also keep source/target node rows and direction)
+    adjacency   CSR offsets and edge rows, preserving edge order of each node
+
+Field columns are typed arrays for int/float/bool, utf-8 blobs for str and a
+pickle fallback for anything else, where references to architypes inside the
+snapshot are stored as ids.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import io
+import json
+import pickle
+import struct
+import sys
+from array import array
+from dataclasses import dataclass
+from importlib import import_module
+from typing import Any, BinaryIO, Callable, Iterable, Optional, cast
+from uuid import UUID
+
+from .architype import (
+    Anchor,
+    Architype,
+    DEFAULT_PERMISSION,
+    EdgeAnchor,
+    NodeAnchor,
+    NodeArchitype,
+    Permission,
+    TANCH,
+)
+from .context import ExecutionContext
+
+MAGIC = b"JACGRAPH"
+VERSION = 1
+
+SIZE = struct.Struct("<Q")
+
+
+@dataclass
+class GraphStats:
+    """Number of nodes and edges written to or read from a snapshot."""
+
+    nodes: int
+    edges: int
+
+
+class Missing:
+    """Placeholder of a field not set on every architype of a class."""
+
+    def __reduce__(self) -> str:
+        """Pickle as the module singleton."""
+        return "MISSING"
+
+
+MISSING = Missing()
+
+
+def class_ref(cls: type) -> str:
+    """Get importable reference of a class."""
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def find_class(ref: str) -> type:
+    """Resolve class from its reference."""
+    module_name, qualname = ref.split(":")
+    obj: object = sys.modules.get(module_name) or import_module(module_name)
+    for name in qualname.split("."):
+        obj = getattr(obj, name)
+    assert isinstance(obj, type), f"{ref} is not a class"
+    return obj
+
+
+def write_block(out: BinaryIO, data: bytes) -> None:
+    """Write length prefixed block."""
+    out.write(SIZE.pack(len(data)))
+    out.write(data)
+
+
+def read_block(src: BinaryIO) -> bytes:
+    """Read length prefixed block."""
+    (size,) = SIZE.unpack(src.read(SIZE.size))
+    data = src.read(size)
+    if len(data) != size:
+        raise ValueError("Truncated graph snapshot!")
+    return data
+
+
+def column_kind(values: list) -> str:
+    """Pick the most compact encoding fitting every value of a column."""
+    types = {type(value) for value in values}
+    if types == {int} and -(2**63) <= min(values) and max(values) < 2**63:
+        return "i"
+    if types == {float}:
+        return "f"
+    if types == {bool}:
+        return "b"
+    if types == {str}:
+        return "s"
+    return "p"
+
+
+class Encoder:
+    """Encode columns, storing snapshot architypes as ids."""
+
+    def __init__(self, ids: dict[int, UUID]) -> None:
+        """Create encoder for architypes in snapshot, keyed by object id."""
+        self.ids = ids
+
+    def persistent_id(self, obj: object) -> Optional[str]:
+        """Get snapshot id of architypes, pickled as references."""
+        if isinstance(obj, Architype) and (uid := self.ids.get(id(obj))):
+            return uid.hex
+        return None
+
+    def encode(self, kind: str, values: list) -> bytes:
+        """Encode column values."""
+        if kind == "i":
+            return array("q", values).tobytes()
+        if kind == "f":
+            return array("d", values).tobytes()
+        if kind == "b":
+            return bytes(values)
+        if kind == "s":
+            blobs = [value.encode() for value in values]
+            offsets = array("Q", [0])
+            total = 0
+            for blob in blobs:
+                total += len(blob)
+                offsets.append(total)
+            return SIZE.pack(len(offsets)) + offsets.tobytes() + b"".join(blobs)
+
+        buffer = io.BytesIO()
+        pickler = pickle.Pickler(buffer, protocol=pickle.HIGHEST_PROTOCOL)
+        pickler.persistent_id = self.persistent_id  # type: ignore[method-assign]
+        pickler.dump(values)
+        return buffer.getvalue()
+
+
+class Decoder:
+    """Decode columns, resolving snapshot ids to imported architypes."""
+
+    def __init__(self, architypes: dict[str, Architype]) -> None:
+        """Create decoder for imported architypes."""
+        self.architypes = architypes
+
+    def decode(self, kind: str, data: bytes, count: int) -> list:
+        """Decode column values."""
+        if kind == "i":
+            return array("q", data).tolist()
+        if kind == "f":
+            return array("d", data).tolist()
+        if kind == "b":
+            return [bool(value) for value in data]
+        if kind == "s":
+            (size,) = SIZE.unpack_from(data)
+            offsets = array("Q", data[SIZE.size : SIZE.size + size * 8])
+            blob = memoryview(data)[SIZE.size + size * 8 :]
+            return [
+                str(blob[offsets[i] : offsets[i + 1]], "utf-8") for i in range(count)
+            ]
+
+        unpickler = pickle.Unpickler(io.BytesIO(data))
+        unpickler.persistent_load = self.architypes.__getitem__  # type: ignore
+        return unpickler.load()
+
+
+def collect(
+    node: NodeAnchor, root: NodeAnchor
+) -> tuple[list[NodeAnchor], list[EdgeAnchor]]:
+    """Collect nodes and edges reachable from node that root can read, in order."""
+    nodes: dict[NodeAnchor, None] = {node: None}
+    edges: dict[EdgeAnchor, None] = {}
+    queue = [node]
+    while queue:
+        current = queue.pop()
+        for edge in current.edges:
+            if edge in edges or not root.has_read_access(edge):
+                continue
+            other = edge.target if current == edge.source else edge.source
+            if other in nodes or root.has_read_access(other):
+                edges[edge] = None
+                if other not in nodes:
+                    nodes[other] = None
+                    queue.append(other)
+    return list(nodes), list(edges)
+
+
+def group(
+    anchors: Iterable[Anchor],
+) -> dict[type, list[Anchor]]:
+    """Group anchors by architype class, in first seen order."""
+    groups: dict[type, list[Anchor]] = {}
+    for anchor in anchors:
+        groups.setdefault(anchor.architype.__class__, []).append(anchor)
+    return groups
+
+
+def write_tables(
+    out: BinaryIO,
+    groups: dict[type, list[Anchor]],
+    encoder: Encoder,
+    accesses: dict[int, int],
+    extra: Callable[[list[Anchor]], list[bytes]],
+) -> list[dict]:
+    """Write id, access, extra and field columns of each class."""
+    meta = []
+    for cls, anchors in groups.items():
+        # columnar classes inline their column values into the state
+        states = [
+            cast(dict[str, Any], anchor.architype.__getstate__()) for anchor in anchors
+        ]
+        names: dict[str, None] = {}
+        for state in states:
+            names.update(dict.fromkeys(state))
+        names.pop("__jac__", None)
+
+        write_block(out, b"".join(anchor.id.bytes for anchor in anchors))
+        write_block(
+            out, array("q", [accesses[id(a.access)] for a in anchors]).tobytes()
+        )
+        for block in extra(anchors):
+            write_block(out, block)
+
+        fields = []
+        for name in names:
+            values = [state.get(name, MISSING) for state in states]
+            kind = column_kind(values)
+            write_block(out, encoder.encode(kind, values))
+            fields.append([name, kind])
+        meta.append({"cls": class_ref(cls), "count": len(anchors), "fields": fields})
+    return meta
+
+
+def export_graph(node: NodeArchitype, path: str) -> GraphStats:
+    """Write the graph reachable from node, as far as root can read, to a file."""
+    nodes, edges = collect(node.__jac__, ExecutionContext.get().root)
+    node_groups = group(nodes)
+    edge_groups = group(edges)
+
+    # rows follow class grouping, node itself always comes first
+    node_rows: dict[NodeAnchor, int] = {}
+    for anchors in node_groups.values():
+        for anchor in anchors:
+            node_rows[anchor] = len(node_rows)  # type: ignore[index]
+    edge_rows: dict[EdgeAnchor, int] = {}
+    for anchors in edge_groups.values():
+        for anchor in anchors:
+            edge_rows[anchor] = len(edge_rows)  # type: ignore[index]
+    first = node_rows[node.__jac__]
+
+    permissions: list[Permission] = []
+    accesses: dict[int, int] = {}
+    for anchor in [*nodes, *edges]:
+        if id(anchor.access) not in accesses:
+            accesses[id(anchor.access)] = len(permissions)
+            permissions.append(anchor.access)
+
+    encoder = Encoder({id(a.architype): a.id for a in [*nodes, *edges]})
+
+    def edge_columns(anchors: list[Anchor]) -> list[bytes]:
+        group_edges = cast(list[EdgeAnchor], anchors)
+        return [
+            array("q", [node_rows[edge.source] for edge in group_edges]).tobytes(),
+            array("q", [node_rows[edge.target] for edge in group_edges]).tobytes(),
+            bytes(edge.is_undirected for edge in group_edges),
+        ]
+
+    body = io.BytesIO()
+    node_meta = write_tables(body, node_groups, encoder, accesses, lambda _: [])
+    edge_meta = write_tables(body, edge_groups, encoder, accesses, edge_columns)
+
+    offsets = array("q", [0])
+    columns = array("q")
+    for anchor in node_rows:
+        columns.extend(edge_rows[edge] for edge in anchor.edges if edge in edge_rows)
+        offsets.append(len(columns))
+    write_block(body, offsets.tobytes())
+    write_block(body, columns.tobytes())
+
+    header = {
+        "version": VERSION,
+        "root": first,
+        "nodes": node_meta,
+        "edges": edge_meta,
+    }
+    with open(path, "wb") as out:
+        out.write(MAGIC)
+        write_block(out, json.dumps(header).encode())
+        write_block(out, pickle.dumps(permissions, pickle.HIGHEST_PROTOCOL))
+        out.write(body.getvalue())
+
+    return GraphStats(nodes=len(node_rows), edges=len(edge_rows))
+
+
+def read_tables(
+    src: BinaryIO, meta: list[dict], permissions: list[Permission], extra: int
+) -> list[tuple[type, list[UUID], list[Permission], list[bytes], list[bytes]]]:
+    """Read raw columns of each class."""
+    tables = []
+    for table in meta:
+        raw = read_block(src)
+        ids = [UUID(bytes=raw[i : i + 16]) for i in range(0, len(raw), 16)]
+        access = [permissions[i] for i in array("q", read_block(src))]
+        extras = [read_block(src) for _ in range(extra)]
+        fields = [read_block(src) for _ in table["fields"]]
+        tables.append((find_class(table["cls"]), ids, access, extras, fields))
+    return tables
+
+
+def bare(cls: type[TANCH], **fields: object) -> TANCH:
+    """Create anchor without tracking or edge hooks, other fields at defaults."""
+    anchor = object.__new__(cls)
+    for f in dataclasses.fields(cls):
+        if f.name in fields:
+            value = fields[f.name]
+        elif f.default is not dataclasses.MISSING:
+            value = f.default
+        elif f.default_factory is not dataclasses.MISSING:
+            value = f.default_factory()
+        else:
+            continue
+        object.__setattr__(anchor, f.name, value)
+    return anchor
+
+
+def import_graph(path: str, node: Optional[NodeArchitype] = None) -> GraphStats:
+    """Load a snapshot into current memory, connected to node (default root).
+
+    Anchors are created in bulk owned by current root and persisted on close,
+    without going through per anchor save. The snapshot's first node is merged
+    into node, every other anchor keeps its id, so a snapshot can only be
+    imported once per session.
+    """
+    ctx = ExecutionContext.get()
+    target = node.__jac__ if node else ctx.root
+    owner = ctx.root.id
+
+    with open(path, "rb") as src:
+        if src.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a graph snapshot!")
+        header = json.loads(read_block(src))
+        if header["version"] != VERSION:
+            raise ValueError(f"Unsupported graph snapshot version {header['version']}!")
+        permissions = [
+            DEFAULT_PERMISSION if perm == DEFAULT_PERMISSION else perm
+            for perm in pickle.loads(read_block(src))
+        ]
+        node_tables = read_tables(src, header["nodes"], permissions, 0)
+        edge_tables = read_tables(src, header["edges"], permissions, 3)
+        offsets = array("q", read_block(src))
+        columns = array("q", read_block(src))
+
+    first = header["root"]
+    imported = [id for _, ids, *_ in node_tables for id in ids]
+    del imported[first]
+    imported += [id for _, ids, *_ in edge_tables for id in ids]
+    if existing := ctx.mem.find_one(imported):
+        raise ValueError(
+            f"{path} is already imported, {existing.__class__.__name__}"
+            f" [{existing.id}] exists in this session!"
+        )
+
+    architypes: dict[str, Architype] = {}
+    nodes: list[NodeAnchor] = []
+    for cls, ids, access, _, _ in node_tables:
+        for id, perm in zip(ids, access):
+            if len(nodes) == first:
+                anchor = target
+            else:
+                anchor = bare(
+                    NodeAnchor,
+                    architype=object.__new__(cls),
+                    id=id,
+                    root=owner,
+                    access=perm,
+                    persistent=True,
+                    edges=[],
+                )
+                anchor.architype.__dict__["__jac__"] = anchor
+            architypes[id.hex] = anchor.architype
+            nodes.append(anchor)
+
+    edges: list[EdgeAnchor] = []
+    for cls, ids, access, (sources, targets, undirected), _ in edge_tables:
+        for id, perm, source, target_row, is_undirected in zip(
+            ids, access, array("q", sources), array("q", targets), undirected
+        ):
+            edge = bare(
+                EdgeAnchor,
+                architype=object.__new__(cls),
+                id=id,
+                root=owner,
+                access=perm,
+                persistent=True,
+                source=nodes[source],
+                target=nodes[target_row],
+                is_undirected=bool(is_undirected),
+            )
+            edge.architype.__dict__["__jac__"] = edge
+            architypes[id.hex] = edge.architype
+            edges.append(edge)
+
+    decoder = Decoder(architypes)
+    for metas, tables, anchors in (
+        (header["nodes"], node_tables, cast(list[Anchor], nodes)),
+        (header["edges"], edge_tables, cast(list[Anchor], edges)),
+    ):
+        start = 0
+        for meta, (_, ids, _, _, blocks) in zip(metas, tables):
+            rows = anchors[start : start + len(ids)]
+            start += len(ids)
+            columnar = rows[0].architype._jac_columns_ if rows else frozenset()
+            for (name, kind), block in zip(meta["fields"], blocks):
+                for item, value in zip(rows, decoder.decode(kind, block, len(ids))):
+                    if value is MISSING or item is target:
+                        continue
+                    if name in columnar:
+                        object.__setattr__(item.architype, name, value)
+                    else:
+                        item.architype.__dict__[name] = value
+
+    mem = ctx.mem
+    for row, anchor in enumerate(nodes):
+        edge_list = [edges[i] for i in columns[offsets[row] : offsets[row + 1]]]
+        if anchor is target:
+            for edge in edge_list:
+                target.add_edge(edge)
+        else:
+            anchor.edges = edge_list
+            mem.set(anchor.id, anchor)
+    for edge in edges:
+        mem.set(edge.id, edge)
+
+    return GraphStats(nodes=len(nodes), edges=len(edges))
@@ -21,6 +21,11 @@ class Settings:
     disable_mtllm: bool = False
     ignore_test_annex: bool = False
 
+    # Runtime configuration
+    anchor_cache_size: int = 0  # 0 keeps every loaded anchor in memory
+    prefetch_depth: int = 1  # hops of edges/nodes batch loaded around a node
+    gc_threshold: int = 0  # anchors saved between reachability sweeps, 0 disables
+
     # Formatter configuration
     max_line_length: int = 88
 
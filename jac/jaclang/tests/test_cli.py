@@ -2,6 +2,7 @@
 
 import inspect
 import io
+import json
 import os
 import subprocess
 import sys
@@ -32,6 +33,39 @@ class JacCliTests(TestCase):
 
         self.assertIn("Hello World!", stdout_value)
 
+    def test_jac_cli_run_profile(self) -> None:
+        """Test walker profile report and JSON dump."""
+        captured_output = io.StringIO()
+        sys.stdout = captured_output
+        profile_json = self.fixture_abs_path("walker_dispatch.profile.json")
+
+        cli.run(self.fixture_abs_path("walker_dispatch.jac"), profile_json=profile_json)
+
+        sys.stdout = sys.__stdout__
+        stdout_value = captured_output.getvalue()
+        with open(profile_json) as f:
+            profile = json.load(f)
+        os.remove(profile_json)
+
+        self.assertIn("Walker profile", stdout_value)
+        self.assertIn("visitor.on_b_or_c", stdout_value)
+        self.assertEqual(
+            sorted(profile["abilities"]),
+            [
+                "A.greet",
+                "visitor.leave",
+                "visitor.on_a",
+                "visitor.on_b_or_c",
+                "visitor.start",
+            ],
+        )
+        self.assertEqual(
+            profile["abilities"]["visitor.on_b_or_c"]["calls"],
+            2 * profile["abilities"]["visitor.start"]["calls"],
+        )
+        self.assertEqual(profile["nodes"]["Hub"], profile["visits"])
+        self.assertEqual(profile["connect"]["edges"], 3 * profile["visits"])
+
     def test_jac_cli_alert_based_err(self) -> None:
         """Basic test for pass."""
         captured_output = io.StringIO()
@@ -360,6 +394,29 @@ class JacCliTests(TestCase):
         self.assertIn("11\n13\n15\n>>> Graph content saved to", stdout_value)
         self.assertIn("connect_expressions.dot\n", stdout_value)
 
+    def test_graph_formats(self) -> None:
+        """Test graph CLI cmd streaming JSON lines and GraphML."""
+        captured_output = io.StringIO()
+        sys.stdout = captured_output
+        for saveto in ("graph_fmt.jsonl", "graph_fmt.graphml"):
+            cli.dot(
+                f"{self.examples_abs_path('reference/connect_expressions.jac')}",
+                saveto=saveto,
+            )
+        sys.stdout = sys.__stdout__
+        with open("graph_fmt.jsonl") as f:
+            records = [json.loads(line) for line in f]
+        with open("graph_fmt.graphml") as f:
+            graphml = f.read()
+        os.remove("graph_fmt.jsonl")
+        os.remove("graph_fmt.graphml")
+        nodes = [rec for rec in records if rec["kind"] == "node"]
+        edges = [rec for rec in records if rec["kind"] == "edge"]
+        self.assertEqual(nodes[0]["type"], "Root")
+        self.assertEqual(len(nodes), graphml.count("<node "))
+        self.assertEqual(len(edges), graphml.count("<edge "))
+        self.assertTrue(graphml.endswith("</graph>\n</graphml>\n"))
+
     def test_py_to_jac(self) -> None:
         """Test for graph CLI cmd."""
         captured_output = io.StringIO()
@@ -5,6 +5,8 @@ import os
 import pickle
 import sys
 import sysconfig
+import unittest
+from importlib.util import find_spec
 
 
 import jaclang.compiler.passes.main as passes
@@ -336,6 +338,142 @@ class JacLanguageTests(TestCase):
         self.assertIn("node_a(val=2)", stdout_value)
         self.assertIn("[node_a(val=42), node_a(val=42)]\n", stdout_value)
 
+    def test_edge_index(self) -> None:
+        """Test typed edge queries through edge index."""
+        captured_output = io.StringIO()
+        sys.stdout = captured_output
+        jac_import("edge_index", base_path=self.fixture_abs_path("./"))
+        sys.stdout = sys.__stdout__
+        stdout_value = captured_output.getvalue().split("\n")
+        self.assertEqual(
+            stdout_value[:12],
+            [
+                "22",
+                "['bob', 'carol']",
+                "['carol']",
+                "['dave']",
+                "['bob', 'carol', 'dave']",
+                "['carol']",
+                "20",
+                "15",
+                "17",
+                "[]",
+                "['erin']",
+                "['k5', 'k8', 'k9', 'k10']",
+            ],
+        )
+
+    def test_async_walker(self) -> None:
+        """Test async abilities interleave walkers on a single event loop."""
+        captured_output = io.StringIO()
+        sys.stdout = captured_output
+        jac_import("async_walker", base_path=self.fixture_abs_path("./"))
+        sys.stdout = sys.__stdout__
+        stdout_value = captured_output.getvalue().split("\n")
+        self.assertEqual(
+            stdout_value[:4],
+            [
+                "abxabxabx",
+                "[[0, 1, 2], [0, 1, 2]] [0, 1, 2]",
+                "[0, 1, 2]",
+                "[0, 1, 2]",
+            ],
+        )
+
+    def test_indexed_fields(self) -> None:
+        """Test typed filters on indexed fields match a scan and stay in sync."""
+        captured_output = io.StringIO()
+        sys.stdout = captured_output
+        jac_import("indexed_fields", base_path=self.fixture_abs_path("./"))
+        sys.stdout = sys.__stdout__
+        stdout_value = captured_output.getvalue().split("\n")
+        self.assertEqual(
+            stdout_value[:8],
+            [
+                "['p3', 'p4', 'p8', 'p9']",
+                "['p6']",
+                "['p0', 'p1', 'p2', 'p0']",
+                "4 True",
+                "['p0', 'p4', 'p5']",
+                "['p1', 'p4', 'p5', 'p6']",
+                "['q0']",
+                "1 0",
+            ],
+        )
+
+    @unittest.skipUnless(find_spec("numpy"), "columnar storage needs numpy")
+    def test_columnar_nodes(self) -> None:
+        """Test numeric node fields read and write through NumPy columns."""
+        captured_output = io.StringIO()
+        sys.stdout = captured_output
+        jac_import("columnar_nodes", base_path=self.fixture_abs_path("./"))
+        sys.stdout = sys.__stdout__
+        stdout_value = captured_output.getvalue().split("\n")
+        self.assertEqual(
+            stdout_value[:7],
+            [
+                "[0.0, 1.5, 3.0, 0.5, 2.0, 3.5] 15",
+                "['i5', 'i2', 'i4']",
+                "[0.0, 0.707, 0.894, 0.949, 0.97, 0.981]",
+                "9.0 [5.0, 0.0] int",
+                "['i0', 'i5'] ['count', 'embedding', 'score']",
+                "width mismatch",
+                "i3 0.5 [3.0, 1.0] True",
+            ],
+        )
+
+    def test_walker_dispatch(self) -> None:
+        """Test walker abilities dispatch on subclass and union triggers."""
+        captured_output = io.StringIO()
+        sys.stdout = captured_output
+        jac_import("walker_dispatch", base_path=self.fixture_abs_path("./"))
+        sys.stdout = sys.__stdout__
+        stdout_value = captured_output.getvalue().split("\n")
+        self.assertEqual(
+            sorted(stdout_value[:8]),
+            [
+                "A greets visitor 1",
+                "A greets visitor 2",
+                "leave 1",
+                "leave 2",
+                "on_a 1",
+                "on_a 2",
+                "on_b_or_c B",
+                "on_b_or_c C",
+            ],
+        )
+
+    def test_visit_priority(self) -> None:
+        """Test best-first walkers visit the lowest priority first."""
+        captured_output = io.StringIO()
+        sys.stdout = captured_output
+        jac_import("visit_priority", base_path=self.fixture_abs_path("./"))
+        sys.stdout = sys.__stdout__
+        stdout_value = captured_output.getvalue().split("\n")
+        self.assertEqual(
+            stdout_value[:2],
+            [
+                "['a', 'cc', 'bb', 'ddd'] {'a': 0, 'bb': 5, 'cc': 2, 'ddd': 6}",
+                "['ddd', 'bb', 'cc', 'a', 'a']",
+            ],
+        )
+
+    def test_visit_once(self) -> None:
+        """Test visit once walkers over cyclic graphs."""
+        captured_output = io.StringIO()
+        sys.stdout = captured_output
+        jac_import("visit_once", base_path=self.fixture_abs_path("./"))
+        sys.stdout = sys.__stdout__
+        stdout_value = captured_output.getvalue().split("\n")
+        self.assertEqual(
+            stdout_value[:3],
+            [
+                "['a', 'b', 'c', 'd']",
+                "['a', 'b', 'c', 'd']",
+                "['a', 'b']",
+            ],
+        )
+
     def test_impl_grab(self) -> None:
         """Test walking through edges."""
         captured_output = io.StringIO()
@@ -0,0 +1,62 @@
+"""Benchmark resident memory of a large in-memory graph.
+
+Builds `nodes` nodes with `edges` generic edges between them and reports the
+growth of resident set size (max RSS) and bytes per anchor.
+
+Usage: python scripts/benchmarks/anchor_memory.py [nodes] [edges]
+"""
+
+from __future__ import annotations
+
+import gc
+import resource
+import sys
+from dataclasses import dataclass
+from random import Random
+from time import perf_counter
+
+from jaclang.plugin.feature import JacFeature as Jac
+from jaclang.runtimelib.context import ExecutionContext
+
+
+@Jac.make_node(on_entry=[], on_exit=[])
+@dataclass(eq=False)
+class Item(Jac.Node):
+    """Benchmark node."""
+
+    idx: int
+
+
+def build(nodes: int, edges: int) -> list[Item]:
+    """Build `nodes` nodes connected by `edges` random edges."""
+    rand = Random(0)
+    items = [Item(idx=i) for i in range(nodes)]
+    spec = Jac.build_edge(is_undirected=False, conn_type=None, conn_assign=None)
+    for i in range(edges):
+        Jac.connect(
+            left=items[i % nodes], right=items[rand.randrange(nodes)], edge_spec=spec
+        )
+    return items
+
+
+def main() -> None:
+    """Run benchmark."""
+    nodes = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    edges = int(sys.argv[2]) if len(sys.argv) > 2 else 5_000_000
+
+    ExecutionContext.create()
+    gc.collect()
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = perf_counter()
+    graph = build(nodes, edges)
+    elapsed = perf_counter() - start
+    # ru_maxrss is in KiB on Linux
+    resident = (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - before) * 1024
+
+    print(f"nodes={len(graph)} edges={edges} build={elapsed:.1f}s")
+    print(f"resident : {resident / 2**20:10.1f} MiB")
+    print(f"per anchor : {resident / (nodes + edges):10.1f} B")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Benchmark best-first walkers on shortest paths over a weighted grid.
+
+Runs Dijkstra from a corner of a `size` x `size` grid with `visit :d: cell;`
+(heap frontier) and with the pure Jac workaround that keeps its own pending
+list and scans it for the closest cell (see best_first.jac).
+
+Usage: python scripts/benchmarks/best_first.py [size]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from time import perf_counter
+
+from jaclang import jac_import
+from jaclang.plugin.feature import JacFeature as Jac
+from jaclang.runtimelib.context import ExecutionContext
+from jaclang.runtimelib.machine import JacMachine
+
+
+def main() -> None:
+    """Run benchmark."""
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    base = os.path.dirname(os.path.abspath(__file__))
+
+    ExecutionContext.create()
+    JacMachine(base)
+    (module,) = jac_import("best_first", base_path=base)
+    start = module.grid(size)
+
+    results = {}
+    for name in ("heap_dijkstra", "scan_dijkstra"):
+        walker = getattr(module, name)(dist={start.idx: 0})
+        began = perf_counter()
+        Jac.spawn_call(start, walker)
+        print(f"{name:<14}: {perf_counter() - began:8.3f}s")
+        results[name] = walker.dist
+
+    assert results["heap_dijkstra"] == results["scan_dijkstra"]
+    print(f"cells={size * size} farthest={max(results['heap_dijkstra'].values())}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Benchmark typed edge queries on high-degree nodes.
+
+Compares the edge index lookup (`-:friend:->`, compiled with `edge_type`) with
+the full edge scan used by untyped edge references (same filter, no index).
+
+Usage: python scripts/benchmarks/edge_index.py [degree] [typed] [repeat]
+"""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from timeit import timeit
+from typing import cast
+
+from jaclang.plugin.feature import JacFeature as Jac
+from jaclang.runtimelib.context import ExecutionContext
+
+
+@Jac.make_node(on_entry=[], on_exit=[])
+@dataclass(eq=False)
+class Person(Jac.Node):
+    """Benchmark node."""
+
+    idx: int
+
+
+@Jac.make_edge(on_entry=[], on_exit=[])
+@dataclass(eq=False)
+class Knows(Jac.Edge):
+    """Noise edge."""
+
+
+@Jac.make_edge(on_entry=[], on_exit=[])
+@dataclass(eq=False)
+class Friend(Jac.Edge):
+    """Queried edge."""
+
+
+def friend_filter(edges: list) -> list:
+    """Mirror the lambda generated for `-:Friend:->`."""
+    return [i for i in edges if isinstance(i, Friend)]
+
+
+def build(degree: int, typed: int) -> Person:
+    """Build a hub with `degree` Knows edges and `typed` Friend edges."""
+    hub = Person(idx=-1)
+    knows = Jac.build_edge(is_undirected=False, conn_type=Knows, conn_assign=None)
+    friend = Jac.build_edge(is_undirected=False, conn_type=Friend, conn_assign=None)
+    Jac.connect(left=hub, right=[Person(idx=i) for i in range(degree)], edge_spec=knows)
+    Jac.connect(left=hub, right=[Person(idx=i) for i in range(typed)], edge_spec=friend)
+    return hub
+
+
+def main() -> None:
+    """Run benchmark."""
+    degree = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    typed = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    repeat = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+
+    ExecutionContext.create()
+    hub = build(degree, typed)
+
+    def scan() -> list:
+        return cast(list, Jac.edge_ref(hub, None, Jac.EdgeDir.OUT, friend_filter))
+
+    def indexed() -> list:
+        return cast(
+            list,
+            Jac.edge_ref(hub, None, Jac.EdgeDir.OUT, friend_filter, edge_type=Friend),
+        )
+
+    assert sorted(n.idx for n in scan()) == sorted(n.idx for n in indexed())
+
+    indexed()  # build index once
+    scan_time = timeit(scan, number=repeat) / repeat
+    index_time = timeit(indexed, number=repeat) / repeat
+
+    print(f"degree={degree + typed} matching={typed} repeat={repeat}")
+    print(f"scan    : {scan_time * 1000:10.3f} ms/query")
+    print(f"indexed : {index_time * 1000:10.3f} ms/query")
+    print(f"speedup : {scan_time / index_time:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Benchmark columnar graph snapshots against a shelf session.
+
+Builds a graph of `nodes` nodes and `edges` random edges under root, writes it
+to a shelf session and to a snapshot, then reads both back and reports time
+and size on disk of each.
+
+Usage: python scripts/benchmarks/graph_snapshot.py [nodes] [edges]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from dataclasses import dataclass
+from random import Random
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Callable, TypeVar
+
+from jaclang.plugin.feature import JacFeature as Jac
+from jaclang.runtimelib.architype import NodeArchitype
+from jaclang.runtimelib.context import ExecutionContext
+from jaclang.runtimelib.snapshot import collect, export_graph, import_graph
+
+T = TypeVar("T")
+
+
+@Jac.make_node(on_entry=[], on_exit=[])
+@dataclass(eq=False)
+class Item(Jac.Node):
+    """Benchmark node."""
+
+    idx: int
+    name: str
+    weight: float
+
+
+def build(nodes: int, edges: int) -> None:
+    """Build `nodes` nodes under root connected by `edges` random edges."""
+    rand = Random(0)
+    items: list[NodeArchitype] = [
+        Item(idx=i, name=f"item{i}", weight=i / 3) for i in range(nodes)
+    ]
+    spec = Jac.build_edge(is_undirected=False, conn_type=None, conn_assign=None)
+    Jac.connect(left=Jac.get_root(), right=items, edge_spec=spec)
+    for i in range(edges):
+        Jac.connect(
+            left=items[i % nodes], right=items[rand.randrange(nodes)], edge_spec=spec
+        )
+
+
+def size(path: str) -> int:
+    """Get total size of files starting with path."""
+    base, prefix = os.path.split(path)
+    return sum(
+        os.path.getsize(os.path.join(base, file))
+        for file in os.listdir(base)
+        if file.startswith(prefix)
+    )
+
+
+def timed(label: str, func: Callable[..., T], *args: object) -> T:
+    """Run func and print elapsed time."""
+    start = perf_counter()
+    result = func(*args)
+    print(f"{label:<16}: {perf_counter() - start:8.2f}s")
+    return result
+
+
+def main() -> None:
+    """Run benchmark."""
+    nodes = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    edges = int(sys.argv[2]) if len(sys.argv) > 2 else 200_000
+
+    with TemporaryDirectory() as tmp:
+        shelf = os.path.join(tmp, "graph.session")
+        snapshot = os.path.join(tmp, "graph.jgs")
+
+        ctx = ExecutionContext.create(session=shelf)
+        timed("build", build, nodes, edges)
+        timed("shelf write", ctx.close)
+
+        ctx = ExecutionContext.create(session=shelf)
+        timed("shelf read", collect, ctx.root, ctx.root)
+        timed("snapshot write", export_graph, ctx.root.architype, snapshot)
+        ctx.close()
+
+        ExecutionContext.create()
+        stats = timed("snapshot read", import_graph, snapshot)
+
+        print(f"nodes={stats.nodes} edges={stats.edges}")
+        print(f"shelf size      : {size(shelf) / 2**20:8.1f} MiB")
+        print(f"snapshot size   : {size(snapshot) / 2**20:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Benchmark per call overhead of JacFeature hook dispatch.
+
+Compares calls routed through the pluggy hook caller (the original `JacFeature`
+methods) with the directly bound sole implementations, on cheap hot operations
+where dispatch dominates.
+
+Usage: python scripts/benchmarks/hook_dispatch.py [number]
+"""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from functools import partial
+from timeit import timeit
+from typing import Callable
+
+from jaclang.plugin.feature import JacFeature as Jac, pm
+from jaclang.runtimelib.context import ExecutionContext
+
+
+@Jac.make_node(on_entry=[], on_exit=[])
+@dataclass(eq=False)
+class Item(Jac.Node):
+    """Benchmark node."""
+
+    idx: int
+
+
+def main() -> None:
+    """Run benchmark."""
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+
+    ExecutionContext.create()
+    hub = Item(idx=-1)
+    edge = Jac.build_edge(is_undirected=False, conn_type=None, conn_assign=None)
+    Jac.connect(left=hub, right=[Item(idx=i) for i in range(3)], edge_spec=edge)
+
+    cases: dict[str, Callable[[Callable], object]] = {
+        "get_context": lambda f: f(),
+        "elvis": lambda f: f(None, 1),
+        "edge_ref": lambda f: f(hub, None, Jac.EdgeDir.OUT, None),
+        "build_edge": lambda f: f(
+            is_undirected=False, conn_type=None, conn_assign=None
+        ),
+    }
+
+    print(f"number={number}")
+    print(f"{'operation':<12} {'hook':>10} {'direct':>10} {'saved':>10}  (us/call)")
+    for name, call in cases.items():
+        hooked = pm.originals[name].__func__
+        direct = getattr(Jac, name)
+        if direct is hooked:
+            print(f"{name:<12} not directly bound, more than one implementation")
+            continue
+        assert call(hooked) == call(direct) or name == "build_edge"
+        hook_time = timeit(partial(call, hooked), number=number) / number * 1e6
+        direct_time = timeit(partial(call, direct), number=number) / number * 1e6
+        print(
+            f"{name:<12} {hook_time:10.3f} {direct_time:10.3f} "
+            f"{hook_time - direct_time:10.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()